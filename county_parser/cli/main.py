@@ -1,5 +1,6 @@
 """Main CLI interface for county data parsing."""
 
+import os
 import click
 from pathlib import Path
 from rich.console import Console
@@ -16,10 +17,16 @@ from ..services import MongoDBService
 
 @click.group()
 @click.option('--config-file', type=click.Path(), help='Path to configuration file')
+@click.option('--stage-parquet', is_flag=True,
+              help='Read raw county files through typed Parquet copies cached under the output directory')
 @click.pass_context
-def cli(ctx, config_file):
+def cli(ctx, config_file, stage_parquet):
     """County Property Data Parser - Parse and clean large county property files."""
     
+    if stage_parquet:
+        # Commands that build their own Config pick this up from the environment
+        os.environ['STAGE_PARQUET'] = 'true'
+    
     # Load configuration
     if config_file:
         # TODO: Load from custom config file
@@ -200,8 +207,10 @@ def join_data(ctx, real_accounts, owners, output, output_format):
 @click.option('--batch-id', help='Custom batch ID for MongoDB storage')
 @click.option('--mongo-uri', help='MongoDB connection URI (overrides environment)')
 @click.option('--database', help='MongoDB database name (overrides environment)')
+@click.option('--columnar', is_flag=True, help='Join related data with Polars group_by/join instead of Python dict lookups')
+@click.option('--delta', is_flag=True, help='Only write new or changed properties (compares content hashes)')
 @click.pass_context
-def normalize_all(ctx, output_format, output, include_related, sample_size, batch_id, mongo_uri, database):
+def normalize_all(ctx, output_format, output, include_related, sample_size, batch_id, mongo_uri, database, columnar, delta):
     """Normalize and combine all county data files into a single dataset."""
     
     config = ctx.obj['config']
@@ -231,10 +240,16 @@ def normalize_all(ctx, output_format, output, include_related, sample_size, batc
             mineral_df = normalizer._load_mineral_rights()
             
             # Create normalized data directly
-            normalized_data = normalizer._create_json_normalized_data(
-                real_accounts_df, owners_df, deeds_df, permits_df, 
-                tieback_df, neighborhood_df, mineral_df
-            )
+            if columnar:
+                normalized_data = normalizer._records_from_columnar(normalizer._create_columnar_normalized_data(
+                    real_accounts_df, owners_df, deeds_df, permits_df,
+                    tieback_df, neighborhood_df, mineral_df
+                ))
+            else:
+                normalized_data = normalizer._create_json_normalized_data(
+                    real_accounts_df, owners_df, deeds_df, permits_df, 
+                    tieback_df, neighborhood_df, mineral_df
+                )
             
             # Save directly to MongoDB
             from ..services import MongoDBService
@@ -246,7 +261,8 @@ def normalize_all(ctx, output_format, output, include_related, sample_size, batc
                 mongo_result = mongodb.save_properties(
                     normalized_data, 
                     batch_id=batch_id,
-                    source_files=['real_acct.txt', 'owners.txt', 'deeds.txt', 'permits.txt', 'parcel_tieback.txt']
+                    source_files=['real_acct.txt', 'owners.txt', 'deeds.txt', 'permits.txt', 'parcel_tieback.txt'],
+                    delta=delta
                 )
                 
                 console.print(f"\n[bold green]🎉 Successfully saved to MongoDB![/bold green]")
@@ -292,7 +308,8 @@ def normalize_all(ctx, output_format, output, include_related, sample_size, batc
                 format=output_format,
                 include_all_fields=include_related,
                 sample_size=sample_size,
-                use_chunking=True
+                use_chunking=True,
+                columnar=columnar
             )
             
             console.print("\n[bold green]🎉 Normalization Complete![/bold green]")
@@ -411,11 +428,30 @@ def diagnose(ctx, check_integrity):
 @click.option('--mongo-uri', help='MongoDB connection URI (overrides environment)')
 @click.option('--database', help='MongoDB database name (overrides environment)')
 @click.option('--dry-run', is_flag=True, help='Show what would be imported without actually saving')
+@click.option('--delta', is_flag=True, help='Only write new or changed properties (compares content hashes)')
+@click.option('--pipeline', is_flag=True, help='Stream records to concurrent MongoDB writers instead of saving one list')
+@click.option('--batch-size', type=int, help='Records per bulk write (default: MONGO_BULK_BATCH_SIZE or 1000)')
+@click.option('--unordered', is_flag=True, help='Send unordered bulk writes so the server can apply them in parallel')
+@click.option('--writers', type=int, help='Concurrent bulk writers (default: MONGO_BULK_WRITERS or 1)')
+@click.option('--write-concern', help='Write concern for the load, e.g. "majority", "1" or "w=1,j=false"')
 @click.pass_context
-def save_to_mongodb(ctx, input_file, batch_id, mongo_uri, database, dry_run):
+def save_to_mongodb(ctx, input_file, batch_id, mongo_uri, database, dry_run, delta, pipeline,
+                    batch_size, unordered, writers, write_concern):
     """Save normalized county data to MongoDB."""
     console = ctx.obj['console']
     
+    from ..services.mongodb_service import parse_write_concern
+    bulk_options = {
+        'batch_size': batch_size,
+        'ordered': False if unordered else None,
+        'write_concern': parse_write_concern(write_concern)
+    }
+    
+    if pipeline and not dry_run:
+        _stream_json_to_mongodb(ctx, input_file, batch_id, mongo_uri, database, delta,
+                                writers=writers, **bulk_options)
+        return
+    
     try:
         # Load the data
         console.print(f"[yellow]📂 Loading data from {input_file}...[/yellow]")
@@ -465,7 +501,10 @@ def save_to_mongodb(ctx, input_file, batch_id, mongo_uri, database, dry_run):
             result = mongodb.save_properties(
                 data, 
                 batch_id=batch_id,
-                source_files=source_files or ['normalized_data.json']
+                source_files=source_files or ['normalized_data.json'],
+                delta=delta,
+                writers=writers,
+                **bulk_options
             )
             
             console.print(f"\n[bold green]🎉 Successfully saved to MongoDB![/bold green]")
@@ -486,6 +525,53 @@ def save_to_mongodb(ctx, input_file, batch_id, mongo_uri, database, dry_run):
         console.print(f"[red]❌ Error saving to MongoDB: {e}[/red]")
         raise click.ClickException(str(e))
 
+
+def _stream_json_to_mongodb(ctx, input_file, batch_id, mongo_uri, database, delta, writers=None, **bulk_options):
+    """Stream a JSON array of normalized properties into MongoDB without loading it whole."""
+    from itertools import chain
+    from ..utils.stream_utils import iter_json_array
+    
+    console = ctx.obj['console']
+    console.print(f"[yellow]📂 Streaming data from {input_file}...[/yellow]")
+    
+    mongodb = MongoDBService(mongo_uri=mongo_uri, database=database)
+    if not mongodb.connect():
+        raise click.ClickException("Failed to connect to MongoDB")
+    
+    try:
+        records = iter_json_array(input_file)
+        first = next(records, None)
+        if first is None:
+            console.print("[yellow]No property records found[/yellow]")
+            return
+        if not isinstance(first, dict):
+            raise click.ClickException("Input file must contain a JSON array of property records")
+        
+        # Determine source files from metadata if available
+        source_files = first.get('metadata', {}).get('source_files', []) if 'metadata' in first else []
+        
+        result = mongodb.save_properties_stream(
+            chain([first], records),
+            batch_id=batch_id,
+            source_files=source_files or ['normalized_data.json'],
+            delta=delta,
+            writers=writers or ctx.obj['config'].parsing.max_workers,
+            **bulk_options
+        )
+        
+        console.print(f"\n[bold green]🎉 Successfully saved to MongoDB![/bold green]")
+        console.print(f"📊 Batch ID: {result['batch_id']}")
+        console.print(f"💾 Saved: {result['saved_count']:,} of {result['total_count']:,} properties")
+        console.print(f"📅 Timestamp: {result['timestamp']}")
+        
+    except click.ClickException:
+        raise
+    except Exception as e:
+        console.print(f"[red]❌ Error saving to MongoDB: {e}[/red]")
+        raise click.ClickException(str(e))
+    finally:
+        mongodb.disconnect()
+
 @cli.command()
 @click.option('--mongo-uri', help='MongoDB connection URI (overrides environment)')
 @click.option('--database', help='MongoDB database name (overrides environment)')
@@ -579,6 +665,37 @@ def backup_mongodb(ctx, output, mongo_uri, database):
         console.print(f"[red]❌ Error creating backup: {e}[/red]")
         raise click.ClickException(str(e))
 
+@cli.command()
+@click.option('--mongo-uri', help='MongoDB connection URI (overrides environment)')
+@click.option('--database', help='MongoDB database name (overrides environment)')
+@click.pass_context
+def rebuild_stats(ctx, mongo_uri, database):
+    """Recompute the property_stats summary served by /api/stats from all properties."""
+    console = ctx.obj['console']
+
+    try:
+        mongodb = MongoDBService(mongo_uri=mongo_uri, database=database)
+
+        if not mongodb.connect():
+            raise click.ClickException("Failed to connect to MongoDB")
+
+        try:
+            mongodb.rebuild_property_stats()
+            stats = mongodb.get_property_stats()
+
+            console.print(f"Properties: {stats['total_properties']:,}")
+            for county in stats['counties']:
+                console.print(f"   • {county['_id']}: {county['count']:,}")
+            for name, value in stats['values']['percentiles'].items():
+                console.print(f"   {name}: ${value:,.0f}")
+
+        finally:
+            mongodb.disconnect()
+
+    except Exception as e:
+        console.print(f"[red]❌ Error rebuilding statistics: {e}[/red]")
+        raise click.ClickException(str(e))
+
 
 @cli.command()
 @click.option('--mongo-uri', help='MongoDB connection URI (overrides environment)')
@@ -734,21 +851,28 @@ def travis_analyze(ctx, file_type):
 @cli.command()
 @click.option('--sample-size', type=int, default=100, help='Number of records to process')
 @click.option('--output-file', '-o', type=click.Path(), help='Output JSON file path (optional)')
+@click.option('--columnar', is_flag=True, help='Decode PROP.TXT with the columnar Polars decoder')
+@click.option('--parallel', is_flag=True, help='Extract PROP.TXT/PROP_ENT.TXT byte-range shards in a process pool')
+@click.option('--workers', type=int, help='Worker processes for --parallel (default: MAX_WORKERS setting)')
+@click.option('--mmap', 'memory_map', is_flag=True, help='Extract fields from zero-copy views of memory-mapped files')
+@click.option('--merge-join', is_flag=True, help='Normalize in one ordered pass over PROP/PROP_ENT/IMP_DET/LAND_DET')
 @click.pass_context
-def travis_normalize_sample(ctx, sample_size, output_file):
+def travis_normalize_sample(ctx, sample_size, output_file, columnar, parallel, workers, memory_map, merge_join):
     """Load and normalize a sample of Travis County data."""
     console = ctx.obj['console']
     
     try:
         from ..models.config import Config
         travis_config = Config()
+        travis_config.parsing.max_workers = workers or ctx.obj['config'].parsing.max_workers
         normalizer = TravisCountyNormalizer(travis_config)
         
         console.print(f"[bold blue]🏛️ Travis County Sample Normalization[/bold blue]")
         console.print(f"Sample size: {sample_size:,} properties")
         
         # Load and normalize sample
-        normalized_records = normalizer.load_and_normalize_sample(sample_size)
+        normalized_records = normalizer.load_and_normalize_sample(sample_size, columnar=columnar, parallel=parallel,
+                                                                  memory_map=memory_map, merge_join=merge_join)
         
         if not normalized_records:
             console.print("[red]No records were normalized[/red]")
@@ -923,14 +1047,21 @@ def compare_counties(ctx, sample_size):
 @click.option('--batch-id', help='Custom batch ID for MongoDB storage')
 @click.option('--mongo-uri', help='MongoDB connection URI (overrides environment)')
 @click.option('--database', help='MongoDB database name (overrides environment)')
+@click.option('--columnar', is_flag=True, help='Decode PROP.TXT with the columnar Polars decoder')
+@click.option('--parallel', is_flag=True, help='Extract PROP.TXT/PROP_ENT.TXT byte-range shards in a process pool')
+@click.option('--workers', type=int, help='Worker processes for --parallel (default: MAX_WORKERS setting)')
+@click.option('--mmap', 'memory_map', is_flag=True, help='Extract fields from zero-copy views of memory-mapped files')
+@click.option('--delta', is_flag=True, help='Only write new or changed properties (compares content hashes)')
+@click.option('--merge-join', is_flag=True, help='Stream records from one ordered pass over PROP/PROP_ENT/IMP_DET/LAND_DET into MongoDB; --sample-size 0 loads the whole county')
 @click.pass_context
-def travis_normalize_mongodb(ctx, sample_size, batch_id, mongo_uri, database):
+def travis_normalize_mongodb(ctx, sample_size, batch_id, mongo_uri, database, columnar, parallel, workers, memory_map, delta, merge_join):
     """Load and normalize Travis County data directly to MongoDB."""
     console = ctx.obj['console']
     
     try:
         from ..models.config import Config
         travis_config = Config()
+        travis_config.parsing.max_workers = workers or ctx.obj['config'].parsing.max_workers
         normalizer = TravisCountyNormalizer(travis_config)
         
         console.print(f"[bold blue]🏛️ Travis County → MongoDB Pipeline[/bold blue]")
@@ -938,13 +1069,24 @@ def travis_normalize_mongodb(ctx, sample_size, batch_id, mongo_uri, database):
         
         # Load and normalize Travis data
         console.print("[blue]📊 Loading and normalizing Travis County data...[/blue]")
-        normalized_records = normalizer.load_and_normalize_sample(sample_size)
-        
-        if not normalized_records:
-            console.print("[red]No records were normalized[/red]")
-            return
-        
-        console.print(f"[green]✅ Successfully normalized {len(normalized_records):,} records[/green]")
+        if merge_join:
+            # Records are normalized while they are written; keep the first 100 for the summary below
+            normalized_records = []
+            
+            def stream_records():
+                for record in normalizer.iter_normalized_records(sample_size or None, memory_map):
+                    if len(normalized_records) < 100:
+                        normalized_records.append(record)
+                    yield record
+        else:
+            normalized_records = normalizer.load_and_normalize_sample(sample_size, columnar=columnar, parallel=parallel,
+                                                                      memory_map=memory_map)
+            
+            if not normalized_records:
+                console.print("[red]No records were normalized[/red]")
+                return
+            
+            console.print(f"[green]✅ Successfully normalized {len(normalized_records):,} records[/green]")
         
         # Save directly to MongoDB
         from ..services import MongoDBService
@@ -954,11 +1096,24 @@ def travis_normalize_mongodb(ctx, sample_size, batch_id, mongo_uri, database):
             raise click.ClickException("Failed to connect to MongoDB")
         
         try:
-            result = mongodb.save_properties(
-                normalized_records, 
-                batch_id=batch_id or f"travis_batch_{len(normalized_records)}",
-                source_files=['PROP.TXT', 'PROP_ENT.TXT']
-            )
+            if merge_join:
+                result = mongodb.save_properties_stream(
+                    stream_records(),
+                    batch_id=batch_id or f"travis_batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                    source_files=['PROP.TXT', 'PROP_ENT.TXT', 'IMP_DET.TXT', 'LAND_DET.TXT'],
+                    delta=delta,
+                    writers=mongodb.bulk_writers
+                )
+                if not normalized_records:
+                    console.print("[red]No records were normalized[/red]")
+                    return
+            else:
+                result = mongodb.save_properties(
+                    normalized_records, 
+                    batch_id=batch_id or f"travis_batch_{len(normalized_records)}",
+                    source_files=['PROP.TXT', 'PROP_ENT.TXT'],
+                    delta=delta
+                )
             
             console.print(f"\n[bold green]🎉 Successfully saved to MongoDB![/bold green]")
             console.print(f"📊 Batch ID: {result['batch_id']}")
@@ -1112,6 +1267,34 @@ def dallas_analyze(ctx, sample_size):
         raise click.ClickException(str(e))
 
 
+@cli.command()
+@click.pass_context
+def dallas_build_index(ctx):
+    """Build byte-offset account indexes for the Dallas related CSV files."""
+    console = ctx.obj['console']
+    from ..models.config import Config
+    dallas_config = Config()
+    
+    try:
+        normalizer = DallasCountyNormalizer(dallas_config)
+        console.print("[bold blue]🗂️ Building Dallas County account indexes[/bold blue]\n")
+        
+        for name in normalizer.RELATED_FILES:
+            file_path = normalizer.files[name]
+            if not file_path.exists():
+                console.print(f"[yellow]⚠️ Skipping missing file: {file_path.name}[/yellow]")
+                continue
+            
+            index_path = normalizer.build_account_index(file_path)
+            console.print(f"   💾 {index_path}")
+        
+        console.print("\n[green]🎉 Sample loads will now seek directly to matching rows[/green]")
+        
+    except Exception as e:
+        console.print(f"[red]Error building Dallas indexes: {e}[/red]")
+        raise click.ClickException(str(e))
+
+
 @cli.command()
 @click.option('--sample-size', type=int, default=1000, help='Number of records to process')
 @click.option('--output-file', type=click.Path(), help='Optional JSON output file')
@@ -1167,8 +1350,12 @@ def dallas_normalize_sample(ctx, sample_size, output_file):
 @click.option('--batch-id', help='Custom batch ID for MongoDB storage')
 @click.option('--mongo-uri', help='MongoDB connection URI (overrides environment)')
 @click.option('--database', help='MongoDB database name (overrides environment)')
+@click.option('--full-roll', is_flag=True, help='Stream the entire county instead of a sample')
+@click.option('--batch-size', type=int, help='Records per bulk write (default: CHUNK_SIZE setting with --full-roll, else MONGO_BULK_BATCH_SIZE)')
+@click.option('--unordered', is_flag=True, help='Send unordered bulk writes so the server can apply them in parallel')
+@click.option('--delta', is_flag=True, help='Only write new or changed properties (compares content hashes)')
 @click.pass_context
-def dallas_normalize_mongodb(ctx, sample_size, batch_id, mongo_uri, database):
+def dallas_normalize_mongodb(ctx, sample_size, batch_id, mongo_uri, database, full_roll, batch_size, unordered, delta):
     """Load and normalize Dallas County data directly to MongoDB."""
     console = ctx.obj['console']
     
@@ -1176,9 +1363,42 @@ def dallas_normalize_mongodb(ctx, sample_size, batch_id, mongo_uri, database):
         from ..models.config import Config
         dallas_config = Config()
         normalizer = DallasCountyNormalizer(dallas_config)
+        source_files = ['ACCOUNT_INFO.CSV', 'ACCOUNT_APPRL_YEAR.CSV', 'MULTI_OWNER.CSV']
         
         console.print(f"[bold blue]🏛️ Dallas County → MongoDB Pipeline[/bold blue]")
-        console.print(f"Processing {sample_size:,} properties directly to MongoDB")
+        if full_roll:
+            console.print("Streaming the full Dallas County roll directly to MongoDB")
+        else:
+            console.print(f"Processing {sample_size:,} properties directly to MongoDB")
+        
+        from ..services import MongoDBService
+        mongodb = MongoDBService(mongo_uri=mongo_uri, database=database)
+        
+        if full_roll:
+            if not mongodb.connect():
+                raise click.ClickException("Failed to connect to MongoDB")
+            
+            batch_size = batch_size or ctx.obj['config'].parsing.chunk_size
+            batch_id = batch_id or f"dallas_full_roll_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            
+            try:
+                # Writers save batches while the generator produces records, so the roll is never held in memory
+                saved_count = mongodb.save_properties_stream(
+                    normalizer.normalize_full_roll(),
+                    batch_id=batch_id,
+                    source_files=source_files,
+                    delta=delta,
+                    batch_size=batch_size,
+                    writers=ctx.obj['config'].parsing.max_workers,
+                    ordered=False if unordered else None
+                )['saved_count']
+                
+                console.print(f"\n[bold green]🎉 Successfully saved full roll to MongoDB![/bold green]")
+                console.print(f"📊 Batch ID: {batch_id}")
+                console.print(f"💾 Properties: {saved_count:,}")
+            finally:
+                mongodb.disconnect()
+            return
         
         # Load and normalize Dallas data
         console.print("[blue]📊 Loading and normalizing Dallas County data...[/blue]")
@@ -1191,9 +1411,6 @@ def dallas_normalize_mongodb(ctx, sample_size, batch_id, mongo_uri, database):
         console.print(f"[green]✅ Successfully normalized {len(normalized_records):,} records[/green]")
         
         # Save directly to MongoDB
-        from ..services import MongoDBService
-        mongodb = MongoDBService(mongo_uri=mongo_uri, database=database)
-        
         if not mongodb.connect():
             raise click.ClickException("Failed to connect to MongoDB")
         
@@ -1201,7 +1418,10 @@ def dallas_normalize_mongodb(ctx, sample_size, batch_id, mongo_uri, database):
             result = mongodb.save_properties(
                 normalized_records, 
                 batch_id=batch_id or f"dallas_batch_{len(normalized_records)}",
-                source_files=['ACCOUNT_INFO.CSV', 'ACCOUNT_APPRL_YEAR.CSV', 'MULTI_OWNER.CSV']
+                source_files=source_files,
+                delta=delta,
+                batch_size=batch_size,
+                ordered=False if unordered else None
             )
             
             console.print(f"\n[bold green]🎉 Successfully saved to MongoDB![/bold green]")
@@ -2136,6 +2356,98 @@ def load_dallas_sample_for_frontend(ctx, sample_size, batch_id, mongo_uri, datab
         raise click.ClickException(str(e))
 
 
+def _save_properties_async(mongo_uri, database, properties, **kwargs):
+    """Save properties with AsyncMongoDBService on a short-lived event loop."""
+    import asyncio
+    from ..services import AsyncMongoDBService
+    
+    async def save():
+        mongodb = AsyncMongoDBService(mongo_uri=mongo_uri, database=database)
+        if not await mongodb.connect():
+            raise click.ClickException("Failed to connect to MongoDB")
+        try:
+            return await mongodb.save_properties(properties, **kwargs)
+        finally:
+            mongodb.disconnect()
+    
+    return asyncio.run(save())
+
+
+# Normalizer and source files for each county loaded by load_all_counties_for_frontend
+FRONTEND_COUNTIES = {
+    'travis': (TravisCountyNormalizer, ['PROP.TXT', 'PROP_ENT.TXT', 'IMP_DET.TXT', 'LAND_DET.TXT', 'AGENT.TXT']),
+    'dallas': (DallasCountyNormalizer, ['ACCOUNT_INFO.CSV', 'ACCOUNT_APPRL_YEAR.CSV', 'MULTI_OWNER.CSV']),
+    'harris': (HarrisCountyNormalizer, ['real_acct.txt', 'owners.txt', 'deeds.txt']),
+}
+
+
+def _load_county_for_frontend(county, sample_size, batch_id, mongo_uri=None, database=None,
+                              save_mode='list', writers=1, mongodb=None):
+    """Normalize a sample of one county and save it; returns the save result.
+    
+    Runs in the CLI process with its shared MongoDBService, or in a pool worker
+    (mongodb=None) that opens and closes its own connection.
+    """
+    from functools import partial
+    from ..models.config import Config
+    
+    normalizer_class, source_files = FRONTEND_COUNTIES[county]
+    config = Config()
+    config.county_type = county
+    
+    normalized_records = normalizer_class(config).load_and_normalize_sample(sample_size)
+    if not normalized_records:
+        raise ValueError('No records normalized')
+    
+    owns_connection = mongodb is None and save_mode != 'async'
+    if owns_connection:
+        mongodb = MongoDBService(mongo_uri=mongo_uri, database=database)
+        if not mongodb.connect():
+            raise ConnectionError("Failed to connect to MongoDB")
+    
+    try:
+        if save_mode == 'async':
+            save = partial(_save_properties_async, mongo_uri, database, concurrency=writers)
+        elif save_mode == 'pipeline':
+            save = partial(mongodb.save_properties_stream, writers=writers)
+        else:
+            save = mongodb.save_properties
+        
+        return save(normalized_records, batch_id=f"{batch_id}_{county}", source_files=source_files)
+    finally:
+        if owns_connection:
+            mongodb.disconnect()
+
+
+def _load_counties_in_parallel(counties, batch_id, mongo_uri, database, save_mode, writers, console):
+    """Load each county in its own worker process; returns {county: result or {'error': ...}}."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    
+    results = {}
+    console.print(f"[blue]⚡ Loading {len(counties)} counties in parallel, one worker per county[/blue]")
+    
+    # Polars' thread pool is not fork-safe, so workers start from a fresh interpreter
+    with ProcessPoolExecutor(max_workers=len(counties),
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = {
+            executor.submit(_load_county_for_frontend, county, size, batch_id, mongo_uri, database,
+                            save_mode, writers): county
+            for county, size in counties.items()
+        }
+        for future in as_completed(futures):
+            county = futures[future]
+            try:
+                results[county] = future.result()
+                console.print(f"[green]✅ {county.title()} County: {results[county]['saved_count']:,} properties loaded[/green]")
+            except Exception as e:
+                results[county] = {'error': str(e)}
+                console.print(f"[red]❌ {county.title()} County failed: {e}[/red]")
+    
+    # Report in the usual county order regardless of completion order
+    return {county: results[county] for county in counties}
+
+
 @cli.command()
 @click.option('--travis-size', default=1000, help='Number of Travis County properties to load (default: 1000)')
 @click.option('--dallas-size', default=1000, help='Number of Dallas County properties to load (default: 1000)')
@@ -2143,23 +2455,30 @@ def load_dallas_sample_for_frontend(ctx, sample_size, batch_id, mongo_uri, datab
 @click.option('--batch-id', help='Custom batch ID for tracking all counties')
 @click.option('--mongo-uri', help='MongoDB connection URI (overrides environment)')
 @click.option('--database', help='MongoDB database name (overrides environment)')
-@click.option('--parallel', is_flag=True, help='Process counties in parallel (future enhancement)')
+@click.option('--parallel', is_flag=True, help='Load counties concurrently, one worker process per county')
 @click.option('--force-reload', is_flag=True, help='Force reload even if data exists')
+@click.option('--pipeline', is_flag=True, help='Stream records to concurrent MongoDB writers instead of saving one list')
+@click.option('--async-writes', is_flag=True, help='Save through the asyncio (motor) service with concurrent bulk writes')
 @click.pass_context
-def load_all_counties_for_frontend(ctx, travis_size, dallas_size, harris_size, batch_id, mongo_uri, database, parallel, force_reload):
+def load_all_counties_for_frontend(ctx, travis_size, dallas_size, harris_size, batch_id, mongo_uri, database, parallel, force_reload, pipeline, async_writes):
     """Load samples from all counties into MongoDB for frontend review. Default: 1000 properties from each county."""
     console = ctx.obj['console']
     
     console.print(f"[bold blue]🏛️ Multi-County Frontend Sample Loader[/bold blue]")
     console.print(f"🎯 Target: {travis_size:,} Travis + {dallas_size:,} Dallas + {harris_size:,} Harris = {travis_size + dallas_size + harris_size:,} total properties")
     
-    if parallel:
-        console.print("[yellow]⚠️  Parallel processing not yet implemented - processing sequentially[/yellow]")
-    
     # Generate unified batch ID
     batch_id = batch_id or f"multi_county_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
     console.print(f"📊 Unified Batch ID: {batch_id}")
     
+    counties = {
+        county: size
+        for county, size in (('travis', travis_size), ('dallas', dallas_size), ('harris', harris_size))
+        if size > 0
+    }
+    save_mode = 'async' if async_writes else 'pipeline' if pipeline else 'list'
+    writers = ctx.obj['config'].parsing.max_workers
+    
     # Track results for all counties
     results = {}
     total_loaded = 0
@@ -2173,89 +2492,21 @@ def load_all_counties_for_frontend(ctx, travis_size, dallas_size, harris_size, b
             raise click.ClickException("Failed to connect to MongoDB")
         
         try:
-            # Process Travis County
-            if travis_size > 0:
-                console.print(f"\n[bold cyan]🏛️ Processing Travis County ({travis_size:,} properties)[/bold cyan]")
-                try:
-                    from ..models.config import Config
-                    travis_config = Config()
-                    travis_config.county_type = "travis"
-                    
-                    normalizer = TravisCountyNormalizer(travis_config)
-                    normalized_records = normalizer.load_and_normalize_sample(travis_size)
-                    
-                    if normalized_records:
-                        result = mongodb.save_properties(
-                            normalized_records,
-                            batch_id=f"{batch_id}_travis",
-                            source_files=['PROP.TXT', 'PROP_ENT.TXT', 'IMP_DET.TXT', 'LAND_DET.TXT', 'AGENT.TXT']
-                        )
-                        results['travis'] = result
-                        total_loaded += result['saved_count']
-                        console.print(f"[green]✅ Travis County: {result['saved_count']:,} properties loaded[/green]")
-                    else:
-                        results['travis'] = {'error': 'No records normalized'}
-                        console.print("[red]❌ Travis County: No records normalized[/red]")
-                        
-                except Exception as e:
-                    results['travis'] = {'error': str(e)}
-                    console.print(f"[red]❌ Travis County failed: {e}[/red]")
-            
-            # Process Dallas County
-            if dallas_size > 0:
-                console.print(f"\n[bold cyan]🏛️ Processing Dallas County ({dallas_size:,} properties)[/bold cyan]")
-                try:
-                    from ..models.config import Config
-                    dallas_config = Config()
-                    dallas_config.county_type = "dallas"
-                    
-                    normalizer = DallasCountyNormalizer(dallas_config)
-                    normalized_records = normalizer.load_and_normalize_sample(dallas_size)
-                    
-                    if normalized_records:
-                        result = mongodb.save_properties(
-                            normalized_records,
-                            batch_id=f"{batch_id}_dallas",
-                            source_files=['ACCOUNT_INFO.CSV', 'ACCOUNT_APPRL_YEAR.CSV', 'MULTI_OWNER.CSV']
-                        )
-                        results['dallas'] = result
-                        total_loaded += result['saved_count']
-                        console.print(f"[green]✅ Dallas County: {result['saved_count']:,} properties loaded[/green]")
-                    else:
-                        results['dallas'] = {'error': 'No records normalized'}
-                        console.print("[red]❌ Dallas County: No records normalized[/red]")
-                        
-                except Exception as e:
-                    results['dallas'] = {'error': str(e)}
-                    console.print(f"[red]❌ Dallas County failed: {e}[/red]")
-            
-            # Process Harris County
-            if harris_size > 0:
-                console.print(f"\n[bold cyan]🏛️ Processing Harris County ({harris_size:,} properties)[/bold cyan]")
-                try:
-                    from ..models.config import Config
-                    harris_config = Config()
-                    harris_config.county_type = "harris"
-                    
-                    normalizer = HarrisCountyNormalizer(harris_config)
-                    normalized_records = normalizer.load_and_normalize_sample(harris_size)
-                    
-                    if normalized_records:
-                        result = mongodb.save_properties(
-                            normalized_records,
-                            batch_id=f"{batch_id}_harris",
-                            source_files=['real_acct.txt', 'owners.txt', 'deeds.txt']
-                        )
-                        results['harris'] = result
-                        total_loaded += result['saved_count']
-                        console.print(f"[bold green]✅ Harris County: {result['saved_count']:,} properties loaded[/bold green]")
-                    else:
-                        results['harris'] = {'error': 'No records normalized'}
-                        console.print("[red]❌ Harris County: No records normalized[/red]")
-                        
-                except Exception as e:
-                    results['harris'] = {'error': str(e)}
-                    console.print(f"[red]❌ Harris County failed: {e}[/red]")
+            if parallel and len(counties) > 1:
+                results = _load_counties_in_parallel(counties, batch_id, mongo_uri, database, save_mode,
+                                                     writers, console)
+            else:
+                for county, size in counties.items():
+                    console.print(f"\n[bold cyan]🏛️ Processing {county.title()} County ({size:,} properties)[/bold cyan]")
+                    try:
+                        results[county] = _load_county_for_frontend(county, size, batch_id, mongo_uri, database,
+                                                                    save_mode, writers, mongodb)
+                        console.print(f"[green]✅ {county.title()} County: {results[county]['saved_count']:,} properties loaded[/green]")
+                    except Exception as e:
+                        results[county] = {'error': str(e)}
+                        console.print(f"[red]❌ {county.title()} County failed: {e}[/red]")
+            
+            total_loaded = sum(result.get('saved_count', 0) for result in results.values())
             
             # Summary report
             console.print(f"\n" + "=" * 60)
@@ -2286,12 +2537,6 @@ def load_all_counties_for_frontend(ctx, travis_size, dallas_size, harris_size, b
             console.print(f"   📈 Stats: /api/stats")
             console.print(f"   🔍 Filter by county in the frontend dropdown")
             
-            # Future scalability notes
-            if parallel:
-                console.print(f"\n[bold yellow]💡 Future Enhancement:[/bold yellow]")
-                console.print(f"   Parallel processing will be implemented for faster loading")
-                console.print(f"   Estimated time savings: 60-70% with parallel processing")
-            
         finally:
             mongodb.disconnect()
             
@@ -1,5 +1,6 @@
 """Configuration models using Pydantic."""
 
+import os
 from pathlib import Path
 from typing import Optional, Dict, Any
 from pydantic import BaseModel, Field
@@ -13,6 +14,12 @@ class ParsingOptions(BaseModel):
     skip_errors: bool = Field(default=True, description="Skip rows with parsing errors")
     output_format: str = Field(default="parquet", description="Output format (parquet, csv, json)")
     clean_data: bool = Field(default=True, description="Apply data cleaning transformations")
+    persist_account_keys: bool = Field(default=False, description="Cache normalized account ID columns next to the output")
+    strategy_probe_rows: Optional[int] = Field(default=None, description="Probe CSV parse strategies on this many head rows before a full parse")
+    stage_parquet: bool = Field(
+        default_factory=lambda: os.getenv("STAGE_PARQUET", "").lower() == "true",
+        description="Read raw source files through typed Parquet copies under output_dir/staging"
+    )
     
     # Travis County specific options
     extract_improvements: bool = Field(default=True, description="Extract improvement details")
@@ -61,6 +68,11 @@ class TravisCountyConfig(BaseModel):
     # Processing options
     max_records_per_file: Optional[int] = Field(default=None, description="Maximum records to process per file")
     validate_field_positions: bool = Field(default=True, description="Validate field positions during extraction")
+    files_sorted_by_account: bool = Field(
+        default=False,
+        description="Account-keyed files are ordered by account ID, so scans for a set of accounts can binary search "
+                    "and stop early (falls back to a full read if an out-of-order account is seen)"
+    )
 
 
 class Config(BaseModel):
@@ -132,6 +144,10 @@ class Config(BaseModel):
             parsing_dict["extract_land_details"] = extract_land_details.lower() == "true"
         if extract_tax_entities := os.getenv("EXTRACT_TAX_ENTITIES"):
             parsing_dict["extract_tax_entities"] = extract_tax_entities.lower() == "true"
+        if persist_account_keys := os.getenv("PERSIST_ACCOUNT_KEYS"):
+            parsing_dict["persist_account_keys"] = persist_account_keys.lower() == "true"
+        if strategy_probe_rows := os.getenv("STRATEGY_PROBE_ROWS"):
+            parsing_dict["strategy_probe_rows"] = int(strategy_probe_rows)
             
         if parsing_dict:
             config_dict["parsing"] = ParsingOptions(**parsing_dict)
@@ -14,13 +14,18 @@ Account IDs are 17-digit format (e.g., "38075500070120000")
 """
 
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Generator, Tuple
+import csv
+import io
+import tempfile
 import polars as pl
 import pandas as pd
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
 from ..models.config import Config
+from ..utils.file_utils import file_fingerprint
+from ..utils.staging import ParquetStage
 
 
 def normalize_dallas_account_id(account_id: str) -> str:
@@ -33,9 +38,52 @@ def normalize_dallas_account_id(account_id: str) -> str:
     return clean_id.zfill(17)
 
 
+def normalize_dallas_account_ids(account_ids: pd.Series) -> pd.Series:
+    """Vectorized normalize_dallas_account_id for a whole column of account numbers."""
+    return (
+        account_ids.fillna('').astype(str)
+        .str.replace(r'\D', '', regex=True)
+        .str.zfill(17)
+    )
+
+
+class AccountIndex:
+    """Row positions of each account in a related Dallas file, grouped once for O(1) lookups."""
+    
+    def __init__(self, df: Optional[pd.DataFrame], key_column: str = 'account_id_norm'):
+        self.df = df
+        if df is None or df.empty:
+            self.positions = {}
+        else:
+            self.positions = df.groupby(key_column, sort=False).indices
+    
+    def __len__(self) -> int:
+        return len(self.positions)
+    
+    def first(self, account_id: str) -> Optional[pd.Series]:
+        """Return the first row for an account in file order, or None."""
+        positions = self.positions.get(account_id)
+        if positions is None:
+            return None
+        return self.df.iloc[positions[0]]
+    
+    def records(self, account_id: str) -> List[Dict[str, Any]]:
+        """Return every row for an account as dicts, in file order."""
+        positions = self.positions.get(account_id)
+        if positions is None:
+            return []
+        return self.df.iloc[positions].to_dict('records')
+
+
 class DallasCountyNormalizer:
     """Normalizer for Dallas County Appraisal District data."""
     
+    # Files joined onto ACCOUNT_INFO by account number
+    RELATED_FILES = ('account_apprl', 'multi_owner', 'res_detail', 'com_detail', 'land_detail')
+    
+    # Target on-disk size of one full-roll partition across all files
+    FULL_ROLL_PARTITION_BYTES = 64 * 1024 * 1024
+    
     def __init__(self, config: Config):
         self.config = config
         self.console = Console()
@@ -138,7 +186,7 @@ class DallasCountyNormalizer:
         self.console.print(f"✅ Loaded {len(account_info_df):,} account records")
         
         # Normalize account IDs for joining
-        account_info_df['account_id_norm'] = account_info_df['ACCOUNT_NUM'].apply(normalize_dallas_account_id)
+        account_info_df['account_id_norm'] = self._account_keys(self.files['account_info'], account_info_df)
         
         # Get the account IDs we're working with for efficient filtering
         target_account_ids = set(account_info_df['account_id_norm'])
@@ -152,82 +200,133 @@ class DallasCountyNormalizer:
         land_detail_df = self._load_and_filter_csv(self.files['land_detail'], target_account_ids, 'ACCOUNT_NUM')
         
         if account_apprl_df is not None:
-            account_apprl_df['account_id_norm'] = account_apprl_df['ACCOUNT_NUM'].apply(normalize_dallas_account_id)
             self.console.print(f"✅ Loaded {len(account_apprl_df):,} appraisal records (filtered)")
         
         if multi_owner_df is not None:
-            multi_owner_df['account_id_norm'] = multi_owner_df['ACCOUNT_NUM'].apply(normalize_dallas_account_id)
             self.console.print(f"✅ Loaded {len(multi_owner_df):,} multi-owner records (filtered)")
         
         if res_detail_df is not None:
-            res_detail_df['account_id_norm'] = res_detail_df['ACCOUNT_NUM'].apply(normalize_dallas_account_id)
             self.console.print(f"✅ Loaded {len(res_detail_df):,} residential detail records (filtered)")
         
         if com_detail_df is not None:
-            com_detail_df['account_id_norm'] = com_detail_df['ACCOUNT_NUM'].apply(normalize_dallas_account_id)
             self.console.print(f"✅ Loaded {len(com_detail_df):,} commercial detail records (filtered)")
         
         if land_detail_df is not None:
-            land_detail_df['account_id_norm'] = land_detail_df['ACCOUNT_NUM'].apply(normalize_dallas_account_id)
             self.console.print(f"✅ Loaded {len(land_detail_df):,} land detail records (filtered)")
         
         self.console.print(f"[blue]🔄 Normalizing to unified format...[/blue]")
         
-        # Create unified records
-        normalized_records = []
+        normalized_records = list(self._join_related_records(account_info_df, {
+            'account_apprl': account_apprl_df,
+            'multi_owner': multi_owner_df,
+            'res_detail': res_detail_df,
+            'com_detail': com_detail_df,
+            'land_detail': land_detail_df
+        }))
+        
+        self.console.print(f"[green]🎉 Successfully normalized {len(normalized_records):,} records[/green]")
+        return normalized_records
+
+    def _join_related_records(self, account_info_df: pd.DataFrame,
+                              related_dfs: Dict[str, Optional[pd.DataFrame]]) -> Generator[Dict[str, Any], None, None]:
+        """Hash-join the related files onto ACCOUNT_INFO rows and yield each account in the unified model.
+        
+        Each related frame is grouped by account once, so every account is matched
+        with dictionary lookups instead of filtering the related frames per account.
+        """
+        indexes = {name: AccountIndex(related_dfs.get(name)) for name in self.RELATED_FILES}
         
         for _, account_row in account_info_df.iterrows():
             account_id = account_row['account_id_norm']
             
-            # Get related data
-            apprl_data = None
-            if account_apprl_df is not None:
-                apprl_matches = account_apprl_df[account_apprl_df['account_id_norm'] == account_id]
-                if len(apprl_matches) > 0:
-                    apprl_data = apprl_matches.iloc[0]
-            
-            # Get additional owners
-            additional_owners = []
-            if multi_owner_df is not None:
-                owner_matches = multi_owner_df[multi_owner_df['account_id_norm'] == account_id]
-                additional_owners = owner_matches.to_dict('records')
-            
-            # Get residential details
-            res_data = None
-            if res_detail_df is not None:
-                res_matches = res_detail_df[res_detail_df['account_id_norm'] == account_id]
-                if len(res_matches) > 0:
-                    res_data = res_matches.iloc[0]
+            # Get related data (appraisal, residential, commercial and land use the first match)
+            unified_record = self._map_to_unified_model(
+                account_row,
+                indexes['account_apprl'].first(account_id),
+                indexes['multi_owner'].records(account_id),
+                indexes['res_detail'].first(account_id),
+                indexes['com_detail'].first(account_id),
+                indexes['land_detail'].first(account_id)
+            )
             
-            # Get commercial details
-            com_data = None
-            if com_detail_df is not None:
-                com_matches = com_detail_df[com_detail_df['account_id_norm'] == account_id]
-                if len(com_matches) > 0:
-                    com_data = com_matches.iloc[0]
+            yield unified_record
+
+    def normalize_full_roll(self, num_partitions: Optional[int] = None) -> Generator[Dict[str, Any], None, None]:
+        """Stream the entire Dallas roll as unified records with bounded memory.
+        
+        ACCOUNT_INFO and the related files are read in chunks and partitioned to
+        temporary CSV files by a hash of the normalized account ID, then joined one
+        partition at a time (a grace hash join). Only one partition of each file is
+        held in memory, and records are yielded partition by partition rather than
+        in ACCOUNT_INFO order.
+        """
+        if not self.files['account_info'].exists():
+            self.console.print("[red]Failed to load core account information[/red]")
+            return
+        
+        source_files = ['account_info'] + list(self.RELATED_FILES)
+        if num_partitions is None:
+            total_bytes = sum(self.files[name].stat().st_size for name in source_files if self.files[name].exists())
+            num_partitions = total_bytes // self.FULL_ROLL_PARTITION_BYTES + 1
+        
+        self.console.print(f"[blue]🏛️ Streaming full Dallas County roll ({num_partitions:,} partitions)[/blue]")
+        
+        partition_parent = self.config.output_dir
+        partition_parent.mkdir(parents=True, exist_ok=True)
+        
+        with tempfile.TemporaryDirectory(prefix='dallas_partitions_', dir=partition_parent) as temp_dir:
+            partition_dir = Path(temp_dir)
             
-            # Get land details
-            land_data = None
-            if land_detail_df is not None:
-                land_matches = land_detail_df[land_detail_df['account_id_norm'] == account_id]
-                if len(land_matches) > 0:
-                    land_data = land_matches.iloc[0]
+            for name in source_files:
+                rows = self._partition_csv(self.files[name], partition_dir / name, num_partitions)
+                self.console.print(f"✅ Partitioned {rows:,} {name} records")
             
-            # Create unified record
-            unified_record = self._map_to_unified_model(
-                account_row, apprl_data, additional_owners, res_data, com_data, land_data
-            )
+            total_records = 0
+            for partition in range(num_partitions):
+                account_info_df = self._load_csv_file(partition_dir / 'account_info' / f'{partition}.csv')
+                if account_info_df is None:
+                    continue
+                
+                related_dfs = {
+                    name: self._load_csv_file(partition_dir / name / f'{partition}.csv')
+                    for name in self.RELATED_FILES
+                }
+                
+                for unified_record in self._join_related_records(account_info_df, related_dfs):
+                    total_records += 1
+                    yield unified_record
+        
+        self.console.print(f"[green]🎉 Successfully normalized {total_records:,} records[/green]")
+
+    def _partition_csv(self, file_path: Path, partition_dir: Path, num_partitions: int) -> int:
+        """Split a DCAD CSV into hash partitions on account_id_norm, preserving file order within each."""
+        if not file_path.exists():
+            return 0
+        
+        partition_dir.mkdir(parents=True, exist_ok=True)
+        written = set()
+        rows = 0
+        
+        for chunk in self._read_csv_chunks(file_path, self.config.parsing.chunk_size):
+            partitions = pd.util.hash_pandas_object(chunk['account_id_norm'], index=False).to_numpy() % num_partitions
             
-            normalized_records.append(unified_record)
+            for partition, partition_chunk in chunk.groupby(partitions, sort=False):
+                partition_chunk.to_csv(partition_dir / f'{partition}.csv', mode='a', index=False,
+                                       header=partition not in written)
+                written.add(partition)
+            rows += len(chunk)
         
-        self.console.print(f"[green]🎉 Successfully normalized {len(normalized_records):,} records[/green]")
-        return normalized_records
+        return rows
 
     def _load_csv_file(self, file_path: Path, sample_size: Optional[int] = None) -> Optional[pd.DataFrame]:
         """Load CSV file with error handling."""
         if not file_path.exists():
             return None
         
+        staged_df = self._parquet_stage().read_pandas(file_path, n_rows=sample_size or None)
+        if staged_df is not None:
+            return staged_df
+        
         try:
             if sample_size:
                 df = pd.read_csv(file_path, nrows=sample_size, dtype=str)
@@ -243,30 +342,28 @@ class DallasCountyNormalizer:
         if not file_path.exists():
             return None
         
+        # Seek straight to the matching rows when dallas-build-index has been run
+        indexed_df = self._load_indexed_rows(file_path, target_account_ids)
+        if indexed_df is not None:
+            return indexed_df if len(indexed_df) > 0 else None
+        
         try:
             # Read file in chunks to efficiently filter large files
             chunk_size = 50000
             filtered_chunks = []
+            found_accounts = set()
             
-            for chunk in pd.read_csv(file_path, dtype=str, chunksize=chunk_size):
-                # Normalize account IDs in the chunk
-                chunk['account_id_norm'] = chunk[account_column].apply(normalize_dallas_account_id)
-                
+            for chunk in self._read_csv_chunks(file_path, chunk_size, account_column):
                 # Filter to only accounts we care about
                 filtered_chunk = chunk[chunk['account_id_norm'].isin(target_account_ids)]
                 
                 if len(filtered_chunk) > 0:
                     filtered_chunks.append(filtered_chunk)
+                    found_accounts.update(filtered_chunk['account_id_norm'])
                 
-                # Stop early if we've found all our target accounts
-                if len(filtered_chunks) > 0:
-                    found_accounts = set()
-                    for fc in filtered_chunks:
-                        found_accounts.update(fc['account_id_norm'])
-                    
-                    # If we've found most of our target accounts, we can stop early
-                    if len(found_accounts) >= len(target_account_ids) * 0.9:
-                        break
+                # If we've found most of our target accounts, we can stop early
+                if len(found_accounts) >= len(target_account_ids) * 0.9:
+                    break
             
             if filtered_chunks:
                 result_df = pd.concat(filtered_chunks, ignore_index=True)
@@ -278,6 +375,185 @@ class DallasCountyNormalizer:
             self.console.print(f"[red]Error loading and filtering {file_path.name}: {e}[/red]")
             return None
 
+    def _account_index_path(self, file_path: Path) -> Path:
+        """Location of the byte-offset index for the current contents of a DCAD CSV."""
+        return self.config.output_dir / 'dallas_index' / f"{file_path.stem}_{file_fingerprint(file_path)}.parquet"
+
+    def build_account_index(self, file_path: Path, account_column: str = 'ACCOUNT_NUM') -> Optional[Path]:
+        """Record the byte offset and length of every row of a DCAD CSV, sorted by normalized account ID.
+        
+        The index is written as parquet under output_dir/dallas_index and named by the
+        file's fingerprint, so it is ignored once the export is replaced. Sorting by
+        account lets parquet row-group statistics skip most of the index on lookup.
+        """
+        if not file_path.exists():
+            return None
+        
+        offsets, lengths, raw_ids = [], [], []
+        
+        with open(file_path, 'rb') as f:
+            header = f.readline()
+            column_names = next(csv.reader([header.decode('utf-8', errors='ignore')]))
+            account_position = column_names.index(account_column)
+            
+            offset = len(header)
+            for row_offset, row in self._iter_csv_rows(f, offset):
+                if row.strip():
+                    values = next(csv.reader([row.decode('utf-8', errors='ignore')]))
+                    offsets.append(row_offset)
+                    lengths.append(len(row))
+                    raw_ids.append(values[account_position] if len(values) > account_position else None)
+        
+        index_df = pd.DataFrame({
+            'account_id_norm': normalize_dallas_account_ids(pd.Series(raw_ids, dtype=object)),
+            'offset': pd.Series(offsets, dtype='int64'),
+            'length': pd.Series(lengths, dtype='int64')
+        }).sort_values('account_id_norm', kind='stable')
+        
+        index_path = self._account_index_path(file_path)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        for stale_path in index_path.parent.glob(f"{file_path.stem}_*.parquet"):
+            stale_path.unlink()
+        index_df.to_parquet(index_path, index=False, row_group_size=65536)
+        
+        self.console.print(f"✅ Indexed {len(index_df):,} {file_path.name} rows")
+        return index_path
+
+    def _iter_csv_rows(self, f, offset: int) -> Generator[Tuple[int, bytes], None, None]:
+        """Yield (offset, raw bytes) for each CSV row, keeping quoted line breaks inside their row."""
+        row_offset = offset
+        row = b''
+        for line in f:
+            row += line
+            offset += len(line)
+            # An odd number of quotes means a quoted field continues on the next line
+            if row.count(b'"') % 2 == 0:
+                yield row_offset, row
+                row_offset = offset
+                row = b''
+        if row:
+            yield row_offset, row
+
+    def _load_indexed_rows(self, file_path: Path, target_account_ids: set) -> Optional[pd.DataFrame]:
+        """Read only the rows for target_account_ids using the byte-offset index.
+        
+        Returns None when no index exists for the current file contents, so the
+        caller falls back to scanning the CSV.
+        """
+        index_path = self._account_index_path(file_path)
+        if not index_path.exists():
+            return None
+        
+        try:
+            matches = pd.read_parquet(
+                index_path, filters=[('account_id_norm', 'in', sorted(target_account_ids))]
+            ).sort_values('offset')
+            
+            # Coalesce adjacent rows into single reads
+            ranges = []
+            for offset, length in zip(matches['offset'], matches['length']):
+                if ranges and ranges[-1][1] == offset:
+                    ranges[-1][1] = offset + length
+                else:
+                    ranges.append([offset, offset + length])
+            
+            with open(file_path, 'rb') as f:
+                buffer = io.BytesIO()
+                buffer.write(f.readline())
+                for start, end in ranges:
+                    f.seek(start)
+                    row_bytes = f.read(end - start)
+                    buffer.write(row_bytes if row_bytes.endswith(b'\n') else row_bytes + b'\n')
+            
+            buffer.seek(0)
+            df = pd.read_csv(buffer, dtype=str)
+            df['account_id_norm'] = matches['account_id_norm'].to_numpy()
+            return df
+        except Exception as e:
+            self.console.print(f"[yellow]⚠️ Could not use account index for {file_path.name}: {e}[/yellow]")
+            return None
+
+    def _read_csv_chunks(self, file_path: Path, chunk_size: int,
+                         account_column: str = 'ACCOUNT_NUM') -> Generator[pd.DataFrame, None, None]:
+        """Read a DCAD CSV in chunks with the normalized account_id_norm column attached.
+        
+        With ParsingOptions.stage_parquet on, a staged Parquet copy is streamed instead
+        of the CSV; a complete CSV scan writes that copy as it goes.
+        """
+        persisted_keys = self._load_persisted_account_keys(file_path, account_column)
+        offset = 0
+        
+        for chunk in self._iter_raw_chunks(file_path, chunk_size):
+            if persisted_keys is not None:
+                chunk['account_id_norm'] = persisted_keys[offset:offset + len(chunk)]
+            else:
+                chunk['account_id_norm'] = normalize_dallas_account_ids(chunk[account_column])
+            offset += len(chunk)
+            yield chunk
+
+    def _iter_raw_chunks(self, file_path: Path, chunk_size: int) -> Generator[pd.DataFrame, None, None]:
+        """Yield the raw string columns of a DCAD CSV, through its staged Parquet copy when enabled."""
+        stage = self._parquet_stage()
+        
+        staged_chunks = stage.iter_pandas_batches(file_path, chunk_size)
+        if staged_chunks is not None:
+            yield from staged_chunks
+            return
+        
+        # Only the county's own exports are staged, not temporary partition files
+        if not stage.enabled or file_path not in self.files.values():
+            yield from pd.read_csv(file_path, dtype=str, chunksize=chunk_size)
+            return
+        
+        columns = list(pd.read_csv(file_path, dtype=str, nrows=0).columns)
+        with stage.writer(file_path, columns) as write_chunk:
+            for chunk in pd.read_csv(file_path, dtype=str, chunksize=chunk_size):
+                write_chunk(chunk)
+                yield chunk
+        self.console.print(f"[blue]💾 Staged {file_path.name} as Parquet[/blue]")
+
+    def _parquet_stage(self) -> ParquetStage:
+        return ParquetStage(self.config.output_dir, self.config.parsing.stage_parquet)
+
+    def _account_keys(self, file_path: Path, df: pd.DataFrame, account_column: str = 'ACCOUNT_NUM') -> pd.Series:
+        """Normalized account IDs for the leading rows of a DCAD CSV loaded into df."""
+        persisted_keys = self._load_persisted_account_keys(file_path, account_column)
+        if persisted_keys is not None:
+            return pd.Series(persisted_keys[:len(df)], index=df.index)
+        return normalize_dallas_account_ids(df[account_column])
+
+    def _load_persisted_account_keys(self, file_path: Path, account_column: str = 'ACCOUNT_NUM'):
+        """Load the account_id_norm column persisted for this exact source file, computing it on first use.
+        
+        Keys are cached as parquet under output_dir/dallas_keys, named by the file's
+        fingerprint so a replaced export is normalized again. Returns None when
+        ParsingOptions.persist_account_keys is off or the cache cannot be used.
+        """
+        if not self.config.parsing.persist_account_keys:
+            return None
+        
+        try:
+            keys_dir = self.config.output_dir / 'dallas_keys'
+            keys_path = keys_dir / f"{file_path.stem}_{file_fingerprint(file_path)}.parquet"
+            
+            if keys_path.exists():
+                return pd.read_parquet(keys_path)['account_id_norm'].to_numpy()
+            
+            account_ids = pd.read_csv(file_path, dtype=str, usecols=[account_column])[account_column]
+            keys = normalize_dallas_account_ids(account_ids)
+            
+            keys_dir.mkdir(parents=True, exist_ok=True)
+            # Older caches for the same file are stale once its fingerprint changes
+            for stale_path in keys_dir.glob(f"{file_path.stem}_*.parquet"):
+                stale_path.unlink()
+            keys.to_frame('account_id_norm').to_parquet(keys_path, index=False)
+            self.console.print(f"[blue]💾 Persisted normalized account keys for {file_path.name}[/blue]")
+            
+            return keys.to_numpy()
+        except Exception as e:
+            self.console.print(f"[yellow]⚠️ Could not use persisted account keys for {file_path.name}: {e}[/yellow]")
+            return None
+
     def _map_to_unified_model(
         self, 
         account_row: pd.Series, 
@@ -2,14 +2,82 @@
 
 import polars as pl
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
 from ..models import Config
+from ..utils.file_utils import count_lines, file_fingerprint
+from ..utils.staging import ParquetStage
+from ..utils.stream_utils import read_delimited_normalized
 from .base import BaseParser
 
 
+def harris_account_id_expr(column: str = "acct") -> pl.Expr:
+    """Normalize Harris account numbers to the 13-digit zero-padded format with Polars string kernels."""
+    return (
+        pl.col(column).cast(pl.Utf8).fill_null("")
+        .str.strip_chars()
+        .str.replace_all(r"\D", "")
+        .str.zfill(13)
+    )
+
+
+def _struct_expr(spec: Dict[str, Any]) -> pl.Expr:
+    """Build a struct expression from a {field: source column or nested spec} mapping."""
+    return pl.struct([
+        (_struct_expr(source) if isinstance(source, dict) else pl.col(source)).alias(field_name)
+        for field_name, source in spec.items()
+    ])
+
+
+def _spec_columns(spec: Dict[str, Any]) -> List[str]:
+    """Source columns referenced by a struct spec."""
+    columns = []
+    for source in spec.values():
+        columns.extend(_spec_columns(source) if isinstance(source, dict) else [source])
+    return columns
+
+
+# Related-record layouts for the columnar normalizer (same fields as _create_json_normalized_data)
+OWNER_FIELDS = {"line_number": "ln_num", "name": "name", "aka": "aka", "ownership_percentage": "pct_own"}
+DEED_FIELDS = {"date_of_sale": "dos", "clerk_year": "clerk_yr", "clerk_id": "clerk_id", "deed_id": "deed_id"}
+PERMIT_FIELDS = {
+    "permit_id": "id",
+    "agency_id": "agency_id",
+    "status": "status",
+    "description": "dscr",
+    "dor_code": "dor_cd",
+    "permit_type": "permit_type",
+    "permit_type_description": "permit_tp_descr",
+    "property_type": "property_tp",
+    "issue_date": "issue_date",
+    "year": "yr",
+    "site_address": {
+        "site_number": "site_num",
+        "site_prefix": "site_pfx",
+        "site_street": "site_str",
+        "site_type": "site_tp",
+        "site_suffix": "site_sfx",
+        "site_apartment": "site_apt"
+    }
+}
+MINERAL_FIELDS = {
+    "dor_code": "dor_cd",
+    "rail_lease_num": "Rail_leasenum",
+    "interest_type": "Type_Interest",
+    "interest_percent": "Interest_Percent"
+}
+TIEBACK_FIELDS = {
+    "account_id": "acct",
+    "type": "tp",
+    "description": "dscr",
+    "related_account_id": "related_acct",
+    "percentage": "pct"
+}
+NEIGHBORHOOD_FIELDS = {"group_code": "grp_cd", "description": "dscr"}
+
+
 class HarrisCountyNormalizer(BaseParser):
     """Normalize and combine all Harris County data files into a single dataset."""
     
@@ -32,7 +100,7 @@ class HarrisCountyNormalizer(BaseParser):
     def normalize_all_files(self, output_path: Optional[Path] = None, 
                           format: str = "json", include_all_fields: bool = True,
                           sample_size: Optional[int] = None, 
-                          use_chunking: bool = True) -> Dict[str, Any]:
+                          use_chunking: bool = True, columnar: bool = False) -> Dict[str, Any]:
         """
         Normalize all county files into a single dataset keyed by account number.
         
@@ -42,6 +110,7 @@ class HarrisCountyNormalizer(BaseParser):
             include_all_fields: Include all related data (owners, deeds, permits)
             sample_size: Limit processing to first N records for testing
             use_chunking: Process large files in chunks for memory efficiency
+            columnar: Join related data with Polars group_by/join for JSON output
         
         Returns:
             Dictionary with normalization results
@@ -84,7 +153,12 @@ class HarrisCountyNormalizer(BaseParser):
             # Step 3: Normalize and combine
             normalize_task = progress.add_task("Normalizing data...", total=1)
             
-            if format.lower() == "json":
+            if format.lower() == "json" and columnar:
+                normalized_data = self._records_from_columnar(self._create_columnar_normalized_data(
+                    real_accounts_df, owners_df, deeds_df, permits_df,
+                    tieback_df, neighborhood_df, mineral_df
+                ))
+            elif format.lower() == "json":
                 normalized_data = self._create_json_normalized_data(
                     real_accounts_df, owners_df, deeds_df, permits_df, 
                     tieback_df, neighborhood_df, mineral_df
@@ -116,12 +190,16 @@ class HarrisCountyNormalizer(BaseParser):
             }
         }
     
-    def load_and_normalize_sample(self, sample_size: int) -> List[Dict[str, Any]]:
+    def load_and_normalize_sample(self, sample_size: int, columnar: bool = False,
+                                  lazy: bool = True) -> List[Dict[str, Any]]:
         """
         Load and normalize a sample of Harris County properties for frontend use.
         
         Args:
             sample_size: Number of properties to load
+            columnar: Join related data with Polars group_by/join instead of Python dict lookups
+            lazy: Scan owners, deeds, permits, parcel tieback and mineral rights lazily and
+                only materialize rows for the sampled accounts
             
         Returns:
             List of normalized property records
@@ -135,18 +213,32 @@ class HarrisCountyNormalizer(BaseParser):
                 return []
             
             # Load related data files
-            owners_df = self._load_owners()
-            deeds_df = self._load_deeds()
-            permits_df = self._load_permits()
-            tieback_df = self._load_parcel_tieback()
+            if lazy:
+                account_ids = real_accounts_df.select(harris_account_id_expr("acct")).to_series()
+                owners_df = self._load_related_for_accounts("owners", account_ids)
+                deeds_df = self._load_related_for_accounts("deeds", account_ids)
+                permits_df = self._load_related_for_accounts("permits", account_ids)
+                tieback_df = self._load_related_for_accounts("parcel_tieback", account_ids)
+                mineral_df = self._load_related_for_accounts("mineral_rights", account_ids)
+            else:
+                owners_df = self._load_owners()
+                deeds_df = self._load_deeds()
+                permits_df = self._load_permits()
+                tieback_df = self._load_parcel_tieback()
+                mineral_df = self._load_mineral_rights()
             neighborhood_df = self._load_neighborhood_codes()
-            mineral_df = self._load_mineral_rights()
             
             # Normalize to unified format
-            normalized_data = self._create_json_normalized_data(
-                real_accounts_df, owners_df, deeds_df, permits_df, 
-                tieback_df, neighborhood_df, mineral_df
-            )
+            if columnar:
+                normalized_data = self._records_from_columnar(self._create_columnar_normalized_data(
+                    real_accounts_df, owners_df, deeds_df, permits_df,
+                    tieback_df, neighborhood_df, mineral_df
+                ))
+            else:
+                normalized_data = self._create_json_normalized_data(
+                    real_accounts_df, owners_df, deeds_df, permits_df, 
+                    tieback_df, neighborhood_df, mineral_df
+                )
             
             # Convert to list format for MongoDB
             if isinstance(normalized_data, dict):
@@ -169,7 +261,8 @@ class HarrisCountyNormalizer(BaseParser):
     def _load_real_accounts(self, sample_size: Optional[int] = None, use_chunking: bool = True) -> pl.DataFrame:
         """Load and clean real accounts data with specialized line-ending handling."""
         file_path = self.config.get_file_path(self.config.real_accounts_file)
-        return self._load_real_accounts_specialized(file_path, sample_size)
+        return self._load_staged(file_path, lambda: self._load_real_accounts_specialized(file_path, sample_size),
+                                 sample_size)
     
     def _detect_delimiter(self, file_path: Path) -> str:
         """Detect the delimiter used in the file."""
@@ -212,145 +305,330 @@ class HarrisCountyNormalizer(BaseParser):
     def _load_owners(self) -> pl.DataFrame:
         """Load owners data with specialized CRLF and encoding handling."""
         file_path = self.config.get_file_path(self.config.owners_file)
-        return self._load_owners_specialized(file_path)
+        return self._load_staged(file_path, lambda: self._load_owners_specialized(file_path))
     
     def _load_deeds(self) -> pl.DataFrame:
         """Load deeds data.""" 
         file_path = self.config.get_file_path(self.config.deeds_file)
-        return self._robust_csv_load(file_path, "deeds.txt")
+        return self._load_staged(file_path, lambda: self._robust_csv_load(file_path, "deeds.txt"))
     
     def _load_permits(self) -> pl.DataFrame:
         """Load permits data with special handling for unescaped quotes."""
         file_path = self.config.get_file_path(self.config.permits_file)
-        return self._load_permits_specialized(file_path)
+        return self._load_staged(file_path, lambda: self._load_permits_specialized(file_path))
     
     def _load_parcel_tieback(self) -> pl.DataFrame:
         """Load parcel tieback relationships."""
         file_path = self.config.get_file_path(self.config.parcel_tieback_file)
-        return self._robust_csv_load(file_path, "parcel_tieback.txt")
+        return self._load_staged(file_path, lambda: self._robust_csv_load(file_path, "parcel_tieback.txt"))
     
     def _load_neighborhood_codes(self) -> pl.DataFrame:
         """Load neighborhood code lookup."""
         file_path = self.config.get_file_path("real_neighborhood_code.txt")
-        return self._robust_csv_load(file_path, "real_neighborhood_code.txt")
+        return self._load_staged(file_path, lambda: self._robust_csv_load(file_path, "real_neighborhood_code.txt"))
     
     def _load_mineral_rights(self) -> pl.DataFrame:
         """Load mineral rights data."""
         file_path = self.config.get_file_path("real_mnrl.txt")
-        return self._robust_csv_load(file_path, "real_mnrl.txt")
+        return self._load_staged(file_path, lambda: self._robust_csv_load(file_path, "real_mnrl.txt"))
     
-    def _robust_csv_load(self, file_path: Path, filename: str, sample_size: Optional[int] = None) -> pl.DataFrame:
-        """Robust CSV loading with comprehensive error handling and data quality validation."""
+    def _load_staged(self, file_path: Path, loader: Callable[[], pl.DataFrame],
+                     sample_size: Optional[int] = None) -> pl.DataFrame:
+        """Load a raw file through its Parquet staging copy when ParsingOptions.stage_parquet is on.
         
-        original_file_size = file_path.stat().st_size / (1024 * 1024)  # Size in MB
+        A full parse is staged on first use; a sample is read from the staged copy
+        when one exists but is never staged itself.
+        """
+        stage = ParquetStage(self.config.output_dir, self.config.parsing.stage_parquet)
         
-        try:
-            # First try polars with strict settings
-            df = pl.read_csv(file_path, separator="\t", has_header=True, ignore_errors=True)
-            self.console.print(f"✅ {filename}: {len(df):,} rows loaded with polars")
+        staged_df = stage.read(file_path, n_rows=sample_size)
+        if staged_df is not None:
+            self.console.print(f"⚡ {file_path.name}: {len(staged_df):,} rows from staged Parquet")
+            return staged_df
+        
+        if sample_size is not None:
+            return loader()
+        return stage.load(file_path, loader)
+    
+    def _load_related_for_accounts(self, name: str, account_ids: pl.Series) -> pl.DataFrame:
+        """
+        Load only the rows of a related file that belong to the given normalized account IDs.
+        
+        The file is read with pl.scan_csv and the account IDs are applied as a semi-join,
+        so Polars streams the file and only materializes matching rows. Column types and
+        cleanup follow the eager loader; if the lazy scan fails the eager loader is used.
+        """
+        loaders = {
+            "owners": (self.config.owners_file, self._load_owners),
+            "deeds": (self.config.deeds_file, self._load_deeds),
+            "permits": (self.config.permits_file, self._load_permits),
+            "parcel_tieback": (self.config.parcel_tieback_file, self._load_parcel_tieback),
+            "mineral_rights": ("real_mnrl.txt", self._load_mineral_rights),
+        }
+        filename, eager_loader = loaders[name]
+        file_path = self.config.get_file_path(filename)
+        unique_ids = account_ids.unique()
+        sample_keys = pl.DataFrame({"_account_key": unique_ids}).lazy()
+        
+        # A staged copy already carries the eager loader's types and cleanup
+        staged_path = ParquetStage(self.config.output_dir, self.config.parsing.stage_parquet).find(file_path)
+        if staged_path is not None:
+            df = (
+                pl.scan_parquet(staged_path)
+                .with_columns(harris_account_id_expr("acct").alias("_account_key"))
+                .join(sample_keys, on="_account_key", how="semi")
+                .drop("_account_key")
+                .collect()
+            )
+            self.console.print(f"⚡ {filename}: {len(df):,} rows for {len(unique_ids):,} sampled accounts (staged Parquet)")
             return df
+        
+        try:
+            # owners and permits are read as strings by their pandas loaders, the rest are inferred
+            all_strings = name in ("owners", "permits")
+            lazy_df = pl.scan_csv(
+                file_path,
+                separator="\t",
+                has_header=True,
+                quote_char=None if name == "permits" else '"',
+                infer_schema_length=0 if all_strings else 100,
+                encoding="utf8-lossy",
+                ignore_errors=True,
+                truncate_ragged_lines=True
+            )
             
-        except Exception as e:
-            self.console.print(f"[yellow]Polars failed for {filename}, using robust pandas parsing...[/yellow]")
-            import pandas as pd
+            lazy_df = (
+                lazy_df.with_columns(harris_account_id_expr("acct").alias("_account_key"))
+                .join(sample_keys, on="_account_key", how="semi")
+                .drop("_account_key")
+            )
             
-            # Get expected row count from file
-            with open(file_path, 'rb') as f:
-                line_count = sum(1 for _ in f) - 1  # Subtract header
-                
-            self.console.print(f"📊 {filename}: {original_file_size:.1f}MB, ~{line_count:,} expected rows")
+            if name == "owners":
+                lazy_df = lazy_df.with_columns(
+                    pl.col("name").str.replace_all("�", " ", literal=True).str.strip_chars()
+                )
+            elif name == "permits":
+                lazy_df = lazy_df.with_columns(
+                    pl.col("dscr").str.strip_chars().str.strip_chars('"').str.strip_chars()
+                )
             
-            best_df = None
-            best_row_count = 0
-            parsing_method = "none"
+            df = lazy_df.collect()
+            self.console.print(f"✅ {filename}: {len(df):,} rows for {len(unique_ids):,} sampled accounts (lazy scan)")
+            return df
             
-            # Advanced parsing strategies to handle embedded newlines and malformed data
-            strategies = [
-                {
-                    "name": "Multi-line aware parsing",
-                    "params": {
-                        "sep": "\t", "dtype": str, "encoding": "utf-8",
-                        "quoting": 1, "doublequote": True, "skipinitialspace": True,
-                        "on_bad_lines": "warn", "encoding_errors": "replace",
-                        "nrows": sample_size, "engine": "python"  # Python engine handles complex cases better
-                    }
-                },
-                {
-                    "name": "Fixed-width fallback", 
-                    "params": {
-                        "sep": "\t", "dtype": str, "encoding": "utf-8",
-                        "quoting": 3, "on_bad_lines": "skip", "engine": "python",
-                        "encoding_errors": "replace", "nrows": sample_size,
-                        "skip_blank_lines": True, "comment": None
-                    }
-                },
-                {
-                    "name": "Robust with line cleaning",
-                    "params": {
-                        "sep": "\t", "dtype": str, "encoding": "latin-1", 
-                        "quoting": 3, "on_bad_lines": "skip", "engine": "c",
-                        "nrows": sample_size, "low_memory": False
-                    }
-                },
-                {
-                    "name": "Minimal parsing (last resort)",
-                    "params": {
-                        "sep": "\t", "dtype": str, "encoding": "cp1252",
-                        "quoting": 3, "on_bad_lines": "skip", "engine": "python",
-                        "nrows": sample_size, "error_bad_lines": False,
-                        "warn_bad_lines": False  # Suppress warnings for this final attempt
-                    }
+        except Exception as e:
+            self.console.print(f"[yellow]Lazy scan failed for {filename} ({str(e)[:50]}), loading eagerly...[/yellow]")
+            return eager_loader()
+    
+    def _robust_csv_load(self, file_path: Path, filename: str, sample_size: Optional[int] = None) -> pl.DataFrame:
+        """Robust CSV loading with comprehensive error handling and data quality validation.
+        
+        The strategy that worked for a file is remembered (see _save_parse_strategy),
+        so later runs on the unchanged file go straight to it.
+        """
+        
+        cached = self._load_parse_strategy(file_path)
+        
+        if cached is None or cached["strategy"] == "polars":
+            try:
+                # First try polars with strict settings
+                df = pl.read_csv(file_path, separator="\t", has_header=True, ignore_errors=True)
+                self.console.print(f"✅ {filename}: {len(df):,} rows loaded with polars")
+                if cached is None:
+                    self._save_parse_strategy(file_path, "polars")
+                return df
+                
+            except Exception as e:
+                self.console.print(f"[yellow]Polars failed for {filename}, using robust pandas parsing...[/yellow]")
+                cached = None
+        else:
+            self.console.print(f"[blue]♻️ {filename}: using cached parse strategy '{cached['strategy']}'[/blue]")
+        
+        return self._robust_pandas_load(file_path, filename, sample_size, cached)
+    
+    def _csv_parse_strategies(self, sample_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Pandas parsing strategies for _robust_csv_load, in order of preference."""
+        # Advanced parsing strategies to handle embedded newlines and malformed data
+        return [
+            {
+                "name": "Multi-line aware parsing",
+                "params": {
+                    "sep": "\t", "dtype": str, "encoding": "utf-8",
+                    "quoting": 1, "doublequote": True, "skipinitialspace": True,
+                    "on_bad_lines": "warn", "encoding_errors": "replace",
+                    "nrows": sample_size, "engine": "python"  # Python engine handles complex cases better
+                }
+            },
+            {
+                "name": "Fixed-width fallback", 
+                "params": {
+                    "sep": "\t", "dtype": str, "encoding": "utf-8",
+                    "quoting": 3, "on_bad_lines": "skip", "engine": "python",
+                    "encoding_errors": "replace", "nrows": sample_size,
+                    "skip_blank_lines": True, "comment": None
+                }
+            },
+            {
+                "name": "Robust with line cleaning",
+                "params": {
+                    "sep": "\t", "dtype": str, "encoding": "latin-1", 
+                    "quoting": 3, "on_bad_lines": "skip", "engine": "c",
+                    "nrows": sample_size, "low_memory": False
                 }
-            ]
+            },
+            {
+                "name": "Minimal parsing (last resort)",
+                "params": {
+                    "sep": "\t", "dtype": str, "encoding": "cp1252",
+                    "quoting": 3, "on_bad_lines": "skip", "engine": "python",
+                    "nrows": sample_size, "error_bad_lines": False,
+                    "warn_bad_lines": False  # Suppress warnings for this final attempt
+                }
+            }
+        ]
+        
+    def _robust_pandas_load(self, file_path: Path, filename: str, sample_size: Optional[int] = None,
+                            cached: Optional[Dict[str, Any]] = None) -> pl.DataFrame:
+        """Try the pandas strategies in turn and keep the most complete parse."""
+        import pandas as pd
+        
+        original_file_size = file_path.stat().st_size / (1024 * 1024)  # Size in MB
+        
+        # Get expected row count from file
+        if cached is not None and cached.get("expected_rows") is not None:
+            line_count = cached["expected_rows"]
+        else:
+            line_count = count_lines(file_path) - 1  # Subtract header
             
-            for strategy in strategies:
-                try:
-                    df = pd.read_csv(file_path, **strategy["params"])
-                    
-                    # Check data quality
-                    row_count = len(df)
-                    completeness = (line_count - row_count) / line_count if line_count > 0 else 0
-                    
-                    if row_count > best_row_count:
-                        best_df = df
-                        best_row_count = row_count
-                        parsing_method = strategy["name"]
-                    
-                    # Report quality metrics
-                    quality_icon = "✅" if completeness < 0.05 else "⚠️" if completeness < 0.15 else "❌"
-                    self.console.print(f"{quality_icon} {strategy['name']}: {row_count:,} rows ({completeness*100:.1f}% data loss)")
+        self.console.print(f"📊 {filename}: {original_file_size:.1f}MB, ~{line_count:,} expected rows")
+        
+        best_df = None
+        best_row_count = 0
+        parsing_method = "none"
+        
+        strategies = self._csv_parse_strategies(sample_size)
+        if cached is not None:
+            preferred = cached["strategy"]
+        elif self.config.parsing.strategy_probe_rows:
+            preferred = self._probe_parse_strategies(file_path, strategies, line_count)
+        else:
+            preferred = None
+        # Try the cached or probed winner first; the rest remain as fallbacks
+        strategies.sort(key=lambda strategy: strategy["name"] != preferred)
+        
+        for strategy in strategies:
+            try:
+                df = pd.read_csv(file_path, **strategy["params"])
+                
+                # Check data quality
+                row_count = len(df)
+                completeness = (line_count - row_count) / line_count if line_count > 0 else 0
+                
+                if row_count > best_row_count:
+                    best_df = df
+                    best_row_count = row_count
+                    parsing_method = strategy["name"]
+                
+                # Report quality metrics
+                quality_icon = "✅" if completeness < 0.05 else "⚠️" if completeness < 0.15 else "❌"
+                self.console.print(f"{quality_icon} {strategy['name']}: {row_count:,} rows ({completeness*100:.1f}% data loss)")
+                
+                # If we got >95% of expected rows, use this method
+                if completeness < 0.05:
+                    break
                     
-                    # If we got >95% of expected rows, use this method
-                    if completeness < 0.05:
-                        break
-                        
-                except Exception as e:
-                    self.console.print(f"❌ {strategy['name']}: Failed - {str(e)[:50]}...")
-                    continue
-            
-            if best_df is None:
-                raise Exception(f"All parsing strategies failed for {filename}")
-            
-            # Final data quality report
-            final_completeness = (line_count - best_row_count) / line_count if line_count > 0 else 0
-            quality_score = "🟢 Excellent" if final_completeness < 0.02 else "🟡 Good" if final_completeness < 0.10 else "🔴 Poor"
-            
-            self.console.print(f"📋 {filename} Quality Report:")
-            self.console.print(f"   Method: {parsing_method}")
-            self.console.print(f"   Rows: {best_row_count:,} of {line_count:,} expected ({final_completeness*100:.1f}% loss)")
-            self.console.print(f"   Quality: {quality_score}")
-            
-            # Add metadata to track data quality (use setattr to avoid pandas warning)
-            setattr(best_df, '_parsing_metadata', {
-                "filename": filename,
-                "method": parsing_method,
-                "expected_rows": line_count,
-                "actual_rows": best_row_count,
-                "data_loss_pct": final_completeness * 100,
-                "file_size_mb": original_file_size
-            })
-            
-            return pl.from_pandas(best_df)
+            except Exception as e:
+                self.console.print(f"❌ {strategy['name']}: Failed - {str(e)[:50]}...")
+                continue
+        
+        if best_df is None:
+            raise Exception(f"All parsing strategies failed for {filename}")
+        
+        self._save_parse_strategy(file_path, parsing_method, line_count)
+        
+        # Final data quality report
+        final_completeness = (line_count - best_row_count) / line_count if line_count > 0 else 0
+        quality_score = "🟢 Excellent" if final_completeness < 0.02 else "🟡 Good" if final_completeness < 0.10 else "🔴 Poor"
+        
+        self.console.print(f"📋 {filename} Quality Report:")
+        self.console.print(f"   Method: {parsing_method}")
+        self.console.print(f"   Rows: {best_row_count:,} of {line_count:,} expected ({final_completeness*100:.1f}% loss)")
+        self.console.print(f"   Quality: {quality_score}")
+        
+        # Add metadata to track data quality (use setattr to avoid pandas warning)
+        setattr(best_df, '_parsing_metadata', {
+            "filename": filename,
+            "method": parsing_method,
+            "expected_rows": line_count,
+            "actual_rows": best_row_count,
+            "data_loss_pct": final_completeness * 100,
+            "file_size_mb": original_file_size
+        })
+        
+        return pl.from_pandas(best_df)
+    
+    def _probe_parse_strategies(self, file_path: Path, strategies: List[Dict[str, Any]],
+                                line_count: int) -> Optional[str]:
+        """Return the first strategy that parses a head sample of the file nearly completely."""
+        import pandas as pd
+        
+        probe_rows = self.config.parsing.strategy_probe_rows
+        expected_rows = min(probe_rows, line_count)
+        
+        for strategy in strategies:
+            try:
+                params = dict(strategy["params"], nrows=probe_rows)
+                if len(pd.read_csv(file_path, **params)) >= expected_rows * 0.95:
+                    self.console.print(f"🔎 Probe: '{strategy['name']}' parsed the first {expected_rows:,} rows")
+                    return strategy["name"]
+            except Exception:
+                continue
+        
+        return None
+    
+    def _parse_strategy_cache_path(self) -> Path:
+        return self.config.output_dir / "parse_strategies.json"
+    
+    def _load_parse_strategy(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Return the cached parse strategy for a file if its fingerprint is unchanged."""
+        import json
+        
+        try:
+            with open(self._parse_strategy_cache_path()) as f:
+                entry = json.load(f).get(str(file_path.resolve()))
+        except (OSError, ValueError):
+            return None
+        
+        if entry and entry.get("fingerprint") == file_fingerprint(file_path):
+            return entry
+        return None
+    
+    def _save_parse_strategy(self, file_path: Path, strategy: str, expected_rows: Optional[int] = None):
+        """Remember the strategy that parsed a file, keyed by the file's fingerprint."""
+        import json
+        
+        if strategy == "none":
+            return
+        
+        cache_path = self._parse_strategy_cache_path()
+        try:
+            with open(cache_path) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        
+        cache[str(file_path.resolve())] = {
+            "fingerprint": file_fingerprint(file_path),
+            "strategy": strategy,
+            "expected_rows": expected_rows
+        }
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "w") as f:
+                json.dump(cache, f, indent=2)
+        except OSError as e:
+            self.console.print(f"[yellow]Could not save parse strategy cache: {e}[/yellow]")
     
     def _load_permits_specialized(self, file_path: Path) -> pl.DataFrame:
         """Specialized permits loader that handles unescaped quotes correctly."""
@@ -445,59 +723,19 @@ class HarrisCountyNormalizer(BaseParser):
         
         self.console.print(f"🔧 Loading real_acct.txt with specialized line-ending handling...")
         
-        import pandas as pd
-        import tempfile
-        import os
-        
-        # Pre-process the file to normalize line endings
-        temp_file = None
+        # Line endings and encodings are normalized while streaming into the CSV reader
         try:
-            # Create a temporary file with normalized line endings
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as temp_f:
-                temp_file = temp_f.name
-                
-                self.console.print(f"🔄 Preprocessing file to normalize line endings...")
-                
-                line_count = 0
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line in f:
-                        # Normalize line endings: remove \r and ensure single \n
-                        clean_line = line.replace('\r\n', '\n').replace('\r', '\n').rstrip('\n')
-                        temp_f.write(clean_line + '\n')
-                        line_count += 1
-                        
-                        # Stop if we have enough for sampling
-                        if sample_size and line_count > sample_size:
-                            break
+            df = read_delimited_normalized(file_path, delimiter='\t', max_rows=sample_size)
             
-            self.console.print(f"✅ Preprocessed {line_count:,} lines")
+            self.console.print(f"✅ Successfully loaded {len(df):,} real account records")
             
-            # Now use pandas to read the cleaned file
-            try:
-                df = pd.read_csv(
-                    temp_file,
-                    sep='\t',
-                    dtype=str,
-                    encoding='utf-8',
-                    on_bad_lines='skip',
-                    engine='python',  # Better handling of edge cases
-                    nrows=sample_size
-                )
-                
-                self.console.print(f"✅ Successfully loaded {len(df):,} real account records")
-                
-                return pl.from_pandas(df)
-                
-            except Exception as e:
-                self.console.print(f"❌ Pandas failed on preprocessed file: {e}")
-                
-                # Final fallback: manual line parsing
-                return self._parse_real_accounts_manually(temp_file, sample_size)
-        
-        finally:
-            # Clean up temp file
-            if temp_file and os.path.exists(temp_file):
-                os.unlink(temp_file)
+            return df
+            
+        except Exception as e:
+            self.console.print(f"❌ Streaming parse failed: {e}")
+            
+            # Final fallback: manual line parsing
+            return self._parse_real_accounts_manually(str(file_path), sample_size)
     
     def _parse_real_accounts_manually(self, file_path: str, sample_size: Optional[int] = None) -> pl.DataFrame:
         """Manual parsing for real accounts when all else fails."""
@@ -599,61 +837,15 @@ class HarrisCountyNormalizer(BaseParser):
         return self._preprocess_owners_binary(file_path)
     
     def _preprocess_owners_binary(self, file_path: Path) -> pl.DataFrame:
-        """Preprocess owners.txt in binary mode to handle encoding issues."""
+        """Read owners.txt through the streaming normalizer to handle encoding issues."""
         
-        import pandas as pd
-        import tempfile
-        import os
+        self.console.print("🔄 Normalizing owners.txt line endings and encodings while streaming...")
         
-        temp_file = None
-        try:
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', encoding='utf-8') as temp_f:
-                temp_file = temp_f.name
-                
-                self.console.print("🔄 Preprocessing owners.txt to fix encoding issues...")
-                
-                line_count = 0
-                with open(file_path, 'rb') as f:
-                    for line_bytes in f:
-                        try:
-                            # Try utf-8 first, then latin1 as fallback
-                            try:
-                                line = line_bytes.decode('utf-8')
-                            except UnicodeDecodeError:
-                                line = line_bytes.decode('latin1', errors='replace')
-                            
-                            # Normalize line endings and clean up
-                            clean_line = line.replace('\r\n', '\n').replace('\r', '\n').strip()
-                            
-                            # Skip empty lines
-                            if clean_line:
-                                temp_f.write(clean_line + '\n')
-                                line_count += 1
-                                
-                        except Exception:
-                            # Skip completely problematic lines
-                            continue
-            
-            self.console.print(f"✅ Preprocessed {line_count:,} lines")
-            
-            # Now read the cleaned file
-            df = pd.read_csv(
-                temp_file,
-                sep='\t',
-                dtype=str,
-                encoding='utf-8',
-                on_bad_lines='skip',
-                engine='python'
-            )
-            
-            self.console.print(f"✅ Final result: {len(df):,} owner records")
-            
-            return pl.from_pandas(df)
-            
-        finally:
-            # Clean up temp file
-            if temp_file and os.path.exists(temp_file):
-                os.unlink(temp_file)
+        df = read_delimited_normalized(file_path, delimiter='\t', fallback_encoding='latin1')
+        
+        self.console.print(f"✅ Final result: {len(df):,} owner records")
+        
+        return df
     
     def _create_json_normalized_data(self, real_accounts_df, owners_df, deeds_df, 
                                    permits_df, tieback_df, neighborhood_df, mineral_df) -> List[Dict]:
@@ -765,185 +957,259 @@ class HarrisCountyNormalizer(BaseParser):
         for row in real_accounts_df.iter_rows(named=True):
             account_id = normalize_account_id(row["acct"])  # Normalize for consistent joining
             
-            # Base property record
-            property_record = {
-                "account_id": account_id,
-                "county": "harris",
-                "year": row.get("yr"),
-                "property_address": {
-                    "street_number": row.get("str_num"),
-                    "street_prefix": row.get("str_pfx"),
-                    "street_name": row.get("str"),
-                    "street_suffix": row.get("str_sfx"),
-                    "street_direction": row.get("str_sfx_dir"),
-                    "unit": row.get("str_unit"),
-                    "street_address": row.get("site_addr_1"),  # Fixed: changed from full_address to street_address
-                    "full_address": row.get("site_addr_1"),
-                    "city": row.get("site_addr_2"),
-                    "zip_code": row.get("site_addr_3")
-                },
-                "mailing_address": {
-                    "name": row.get("mailto"),
-                    "address_1": row.get("mail_addr_1"),
-                    "address_2": row.get("mail_addr_2"),
-                    "city": row.get("mail_city"),
-                    "state": row.get("mail_state"),
-                    "zip": row.get("mail_zip"),
-                    "country": row.get("mail_country")
-                },
-                "property_details": {
-                    "year_improved": row.get("yr_impr"),
-                    "year_annexed": row.get("yr_annexed"),
-                    "building_area": row.get("bld_ar"),
-                    "land_area": row.get("land_ar"),
-                    "acreage": row.get("acreage"),
-                    "school_district": row.get("school_dist"),
-                    "state_class": row.get("state_class"),
-                    "economic_area": row.get("econ_area"),
-                    "economic_building_class": row.get("econ_bld_class"),
-                    "center_code": row.get("center_code"),
-                    "market_area_1": row.get("Market_Area_1"),
-                    "market_area_1_description": row.get("Market_Area_1_Dscr"),
-                    "market_area_2": row.get("Market_Area_2"),
-                    "market_area_2_description": row.get("Market_Area_2_Dscr"),
-                    "neighborhood_code": row.get("Neighborhood_Code"),
-                    "neighborhood_group": row.get("Neighborhood_Grp")
-                },
-                "valuation": {
-                    "land_value": row.get("land_val"),
-                    "building_value": row.get("bld_val"),
-                    "extra_features_value": row.get("x_features_val"),
-                    "agricultural_value": row.get("ag_val"),
-                    "assessed_value": row.get("assessed_val"),
-                    "total_appraised_value": row.get("tot_appr_val"),
-                    "market_value": row.get("tot_mkt_val"),  # Fixed: changed from total_market_value to market_value
-                    "total_market_value": row.get("tot_mkt_val"),  # Keep both for compatibility
-                    "new_construction_value": row.get("new_construction_val"),
-                    "total_rcn_value": row.get("tot_rcn_val"),
-                    "prior_values": {
-                        "land": row.get("prior_land_val"),
-                        "building": row.get("prior_bld_val"),
-                        "extra_features": row.get("prior_x_features_val"),
-                        "agricultural": row.get("prior_ag_val"),
-                        "total_appraised": row.get("prior_tot_appr_val"),
-                        "total_market": row.get("prior_tot_mkt_val")
-                    },
-                    "value_changes": {
-                        "land_change": self._calculate_value_change(row.get("land_val"), row.get("prior_land_val")),
-                        "building_change": self._calculate_value_change(row.get("bld_val"), row.get("prior_bld_val")),
-                        "total_market_change": self._calculate_value_change(row.get("tot_mkt_val"), row.get("prior_tot_mkt_val"))
-                    }
-                },
-                "legal_status": {
-                    "value_status": row.get("value_status"),
-                    "noticed": row.get("noticed") == "Y",
-                    "notice_date": row.get("notice_dt"),
-                    "protested": row.get("protested") == "Y",
-                    "certified_date": row.get("certified_date"),
-                    "revision_date": row.get("rev_dt"),
-                    "revision_by": row.get("rev_by"),
-                    "new_owner_date": row.get("new_own_dt"),
-                    "legal_description": [
-                        row.get("lgl_1"), row.get("lgl_2"), 
-                        row.get("lgl_3"), row.get("lgl_4")
-                    ],
-                    "jurisdictions": row.get("jurs")
-                }
-            }
-            
-            # Add related data arrays using efficient lookups
-            if account_id in owners_dict:
-                property_record["owners"] = owners_dict[account_id]
-            
-            if account_id in deeds_dict:
-                property_record["deeds"] = deeds_dict[account_id]
-            
-            if account_id in permits_dict:
-                property_record["permits"] = permits_dict[account_id]
-            
             # Add neighborhood info
             market_area_1 = row.get("Market_Area_1")
-            if market_area_1 and market_area_1 in neighborhood_lookup:
-                property_record["neighborhood"] = neighborhood_lookup[market_area_1]
-            
-            # Add mineral rights if available
-            if account_id in mineral_dict:
-                property_record["mineral_rights"] = mineral_dict[account_id]
-            
-            # Add parcel relationships if available
-            if account_id in tieback_dict:
-                property_record["parcel_relationships"] = tieback_dict[account_id]
             
-            # Create tax entities field for consistency with unified schema
-            tax_entities = []
-            
-            # Add school district as a tax entity
-            if row.get("school_dist"):
-                tax_entities.append({
-                    "entity_name": f"School District {row.get('school_dist')}",
-                    "entity_type": "SCHOOL",
-                    "jurisdiction_id": row.get("school_dist"),
-                    "assessed_value": row.get("assessed_val"),
-                    "market_value": row.get("tot_mkt_val"),
-                    "taxable_value": row.get("assessed_val"),
-                    "tax_rate": None,  # Harris County doesn't provide tax rates
-                    "description": "School District"
-                })
+            property_record = self._build_property_record(row, account_id, {
+                "owners": owners_dict.get(account_id),
+                "deeds": deeds_dict.get(account_id),
+                "permits": permits_dict.get(account_id),
+                "neighborhood": neighborhood_lookup.get(market_area_1) if market_area_1 else None,
+                "mineral_rights": mineral_dict.get(account_id),
+                "parcel_relationships": tieback_dict.get(account_id)
+            })
             
-            # Add county as a tax entity
+            normalized_records.append(property_record)
+        
+        return normalized_records
+    
+    def _create_columnar_normalized_data(self, real_accounts_df, owners_df, deeds_df,
+                                         permits_df, tieback_df, neighborhood_df, mineral_df) -> pl.DataFrame:
+        """
+        Join the related files onto real accounts as nested Arrow columns.
+        
+        Account numbers are normalized with Polars expressions, and owners, deeds,
+        permits and parcel relationships are aggregated into list-of-struct columns
+        with group_by().agg() instead of building per-row Python dicts. The result has
+        one row per real account, an ``account_id`` column and the related columns
+        (null when an account has no related rows).
+        """
+        frame = real_accounts_df.with_row_index("_row_order").with_columns(
+            harris_account_id_expr("acct").alias("account_id")
+        )
+        
+        related = [
+            (owners_df, OWNER_FIELDS, "owners", False),
+            (deeds_df, DEED_FIELDS, "deeds", False),
+            (permits_df, PERMIT_FIELDS, "permits", False),
+            (mineral_df, MINERAL_FIELDS, "mineral_rights", True),
+            (tieback_df, TIEBACK_FIELDS, "parcel_relationships", False),
+        ]
+        for df, spec, alias, last_only in related:
+            if df is None:
+                continue
+            frame = frame.join(self._aggregate_by_account(df, spec, alias, last_only), on="account_id", how="left")
+        
+        if neighborhood_df is not None and "Market_Area_1" in frame.columns:
+            # The row-wise lookup keeps the last entry for a repeated code
+            lookup = (
+                self._with_missing_columns(neighborhood_df, ["cd"] + _spec_columns(NEIGHBORHOOD_FIELDS))
+                .select([
+                    pl.col("cd").cast(pl.Utf8).alias("_neighborhood_key"),
+                    _struct_expr(NEIGHBORHOOD_FIELDS).alias("neighborhood")
+                ])
+                .unique("_neighborhood_key", keep="last", maintain_order=True)
+            )
+            market_area = pl.col("Market_Area_1").cast(pl.Utf8)
+            frame = frame.with_columns(
+                pl.when(market_area != "").then(market_area).alias("_neighborhood_key")
+            ).join(lookup, on="_neighborhood_key", how="left").drop("_neighborhood_key")
+        
+        return frame.sort("_row_order").drop("_row_order")
+    
+    def _aggregate_by_account(self, df: pl.DataFrame, spec: Dict[str, Any], alias: str,
+                              last_only: bool = False) -> pl.DataFrame:
+        """Group a related file by normalized account into a list-of-struct (or last struct) column."""
+        record = _struct_expr(spec)
+        return (
+            self._with_missing_columns(df, ["acct"] + _spec_columns(spec))
+            .with_columns(harris_account_id_expr("acct").alias("account_id"))
+            .group_by("account_id", maintain_order=True)
+            .agg((record.last() if last_only else record).alias(alias))
+        )
+    
+    def _with_missing_columns(self, df: pl.DataFrame, columns: List[str]) -> pl.DataFrame:
+        """Add null columns for any referenced column the file does not have."""
+        missing = [column for column in dict.fromkeys(columns) if column not in df.columns]
+        return df.with_columns([pl.lit(None).alias(column) for column in missing]) if missing else df
+    
+    def _records_from_columnar(self, frame: pl.DataFrame) -> List[Dict]:
+        """Build unified property records from the nested frame of _create_columnar_normalized_data."""
+        related_fields = ["owners", "deeds", "permits", "neighborhood", "mineral_rights", "parcel_relationships"]
+        normalized_records = []
+        
+        for row in frame.iter_rows(named=True):
+            related = {field_name: row.get(field_name) for field_name in related_fields}
+            normalized_records.append(self._build_property_record(row, row["account_id"], related))
+        
+        return normalized_records
+    
+    def _build_property_record(self, row: Dict[str, Any], account_id: str,
+                               related: Dict[str, Any]) -> Dict[str, Any]:
+        """Build one unified property record from a real_acct row and its related data.
+        
+        ``related`` maps record fields (owners, deeds, permits, neighborhood,
+        mineral_rights, parcel_relationships) to their values; None entries are omitted.
+        """
+        # Base property record
+        property_record = {
+            "account_id": account_id,
+            "county": "harris",
+            "year": row.get("yr"),
+            "property_address": {
+                "street_number": row.get("str_num"),
+                "street_prefix": row.get("str_pfx"),
+                "street_name": row.get("str"),
+                "street_suffix": row.get("str_sfx"),
+                "street_direction": row.get("str_sfx_dir"),
+                "unit": row.get("str_unit"),
+                "street_address": row.get("site_addr_1"),  # Fixed: changed from full_address to street_address
+                "full_address": row.get("site_addr_1"),
+                "city": row.get("site_addr_2"),
+                "zip_code": row.get("site_addr_3")
+            },
+            "mailing_address": {
+                "name": row.get("mailto"),
+                "address_1": row.get("mail_addr_1"),
+                "address_2": row.get("mail_addr_2"),
+                "city": row.get("mail_city"),
+                "state": row.get("mail_state"),
+                "zip": row.get("mail_zip"),
+                "country": row.get("mail_country")
+            },
+            "property_details": {
+                "year_improved": row.get("yr_impr"),
+                "year_annexed": row.get("yr_annexed"),
+                "building_area": row.get("bld_ar"),
+                "land_area": row.get("land_ar"),
+                "acreage": row.get("acreage"),
+                "school_district": row.get("school_dist"),
+                "state_class": row.get("state_class"),
+                "economic_area": row.get("econ_area"),
+                "economic_building_class": row.get("econ_bld_class"),
+                "center_code": row.get("center_code"),
+                "market_area_1": row.get("Market_Area_1"),
+                "market_area_1_description": row.get("Market_Area_1_Dscr"),
+                "market_area_2": row.get("Market_Area_2"),
+                "market_area_2_description": row.get("Market_Area_2_Dscr"),
+                "neighborhood_code": row.get("Neighborhood_Code"),
+                "neighborhood_group": row.get("Neighborhood_Grp")
+            },
+            "valuation": {
+                "land_value": row.get("land_val"),
+                "building_value": row.get("bld_val"),
+                "extra_features_value": row.get("x_features_val"),
+                "agricultural_value": row.get("ag_val"),
+                "assessed_value": row.get("assessed_val"),
+                "total_appraised_value": row.get("tot_appr_val"),
+                "market_value": row.get("tot_mkt_val"),  # Fixed: changed from total_market_value to market_value
+                "total_market_value": row.get("tot_mkt_val"),  # Keep both for compatibility
+                "new_construction_value": row.get("new_construction_val"),
+                "total_rcn_value": row.get("tot_rcn_val"),
+                "prior_values": {
+                    "land": row.get("prior_land_val"),
+                    "building": row.get("prior_bld_val"),
+                    "extra_features": row.get("prior_x_features_val"),
+                    "agricultural": row.get("prior_ag_val"),
+                    "total_appraised": row.get("prior_tot_appr_val"),
+                    "total_market": row.get("prior_tot_mkt_val")
+                },
+                "value_changes": {
+                    "land_change": self._calculate_value_change(row.get("land_val"), row.get("prior_land_val")),
+                    "building_change": self._calculate_value_change(row.get("bld_val"), row.get("prior_bld_val")),
+                    "total_market_change": self._calculate_value_change(row.get("tot_mkt_val"), row.get("prior_tot_mkt_val"))
+                }
+            },
+            "legal_status": {
+                "value_status": row.get("value_status"),
+                "noticed": row.get("noticed") == "Y",
+                "notice_date": row.get("notice_dt"),
+                "protested": row.get("protested") == "Y",
+                "certified_date": row.get("certified_date"),
+                "revision_date": row.get("rev_dt"),
+                "revision_by": row.get("rev_by"),
+                "new_owner_date": row.get("new_own_dt"),
+                "legal_description": [
+                    row.get("lgl_1"), row.get("lgl_2"), 
+                    row.get("lgl_3"), row.get("lgl_4")
+                ],
+                "jurisdictions": row.get("jurs")
+            }
+        }
+        
+        # Add related data arrays and lookups when present
+        for field_name, value in related.items():
+            if value is not None:
+                property_record[field_name] = value
+        
+        # Create tax entities field for consistency with unified schema
+        tax_entities = []
+        
+        # Add school district as a tax entity
+        if row.get("school_dist"):
             tax_entities.append({
-                "entity_name": "Harris County",
-                "entity_type": "COUNTY",
-                "jurisdiction_id": "HARRIS",
+                "entity_name": f"School District {row.get('school_dist')}",
+                "entity_type": "SCHOOL",
+                "jurisdiction_id": row.get("school_dist"),
+                "assessed_value": row.get("assessed_val"),
+                "market_value": row.get("tot_mkt_val"),
+                "taxable_value": row.get("assessed_val"),
+                "tax_rate": None,  # Harris County doesn't provide tax rates
+                "description": "School District"
+            })
+        
+        # Add county as a tax entity
+        tax_entities.append({
+            "entity_name": "Harris County",
+            "entity_type": "COUNTY",
+            "jurisdiction_id": "HARRIS",
+            "assessed_value": row.get("assessed_val"),
+            "market_value": row.get("tot_mkt_val"),
+            "taxable_value": row.get("assessed_val"),
+            "tax_rate": None,
+            "description": "County Government"
+        })
+        
+        # Add city/municipality if available
+        if row.get("site_addr_2") and row.get("site_addr_2").strip():
+            city_name = row.get("site_addr_2").strip()
+            tax_entities.append({
+                "entity_name": f"City of {city_name}",
+                "entity_type": "CITY",
+                "jurisdiction_id": city_name.upper().replace(" ", "_"),
                 "assessed_value": row.get("assessed_val"),
                 "market_value": row.get("tot_mkt_val"),
                 "taxable_value": row.get("assessed_val"),
                 "tax_rate": None,
-                "description": "County Government"
+                "description": "Municipal Government"
             })
-            
-            # Add city/municipality if available
-            if row.get("site_addr_2") and row.get("site_addr_2").strip():
-                city_name = row.get("site_addr_2").strip()
-                tax_entities.append({
-                    "entity_name": f"City of {city_name}",
-                    "entity_type": "CITY",
-                    "jurisdiction_id": city_name.upper().replace(" ", "_"),
-                    "assessed_value": row.get("assessed_val"),
-                    "market_value": row.get("tot_mkt_val"),
-                    "taxable_value": row.get("assessed_val"),
-                    "tax_rate": None,
-                    "description": "Municipal Government"
-                })
-            
-            # Add jurisdictions if available
-            if row.get("jurs") and row.get("jurs").strip():
-                jurisdictions = row.get("jurs").strip().split(",")
-                for jur in jurisdictions:
-                    jur = jur.strip()
-                    if jur:
-                        tax_entities.append({
-                            "entity_name": f"Jurisdiction: {jur}",
-                            "entity_type": "JURISDICTION",
-                            "jurisdiction_id": jur.upper().replace(" ", "_"),
-                            "assessed_value": row.get("assessed_val"),
-                            "market_value": row.get("tot_mkt_val"),
-                            "taxable_value": row.get("assessed_val"),
-                            "tax_rate": None,
-                            "description": "Special Jurisdiction"
-                        })
-            
-            property_record["tax_entities"] = tax_entities
-            
-            # Add improvements field for unified schema compatibility
-            property_record["improvements"] = self._build_improvements(row)
-            
-            # Add land details field for unified schema compatibility
-            property_record["land_details"] = self._build_land_details(row)
-            
-            normalized_records.append(property_record)
         
-        return normalized_records
+        # Add jurisdictions if available
+        if row.get("jurs") and row.get("jurs").strip():
+            jurisdictions = row.get("jurs").strip().split(",")
+            for jur in jurisdictions:
+                jur = jur.strip()
+                if jur:
+                    tax_entities.append({
+                        "entity_name": f"Jurisdiction: {jur}",
+                        "entity_type": "JURISDICTION",
+                        "jurisdiction_id": jur.upper().replace(" ", "_"),
+                        "assessed_value": row.get("assessed_val"),
+                        "market_value": row.get("tot_mkt_val"),
+                        "taxable_value": row.get("assessed_val"),
+                        "tax_rate": None,
+                        "description": "Special Jurisdiction"
+                    })
+        
+        property_record["tax_entities"] = tax_entities
+        
+        # Add improvements field for unified schema compatibility
+        property_record["improvements"] = self._build_improvements(row)
+        
+        # Add land details field for unified schema compatibility
+        property_record["land_details"] = self._build_land_details(row)
+        
+        return property_record
     
     def _build_improvements(self, row) -> List[Dict[str, Any]]:
         """Build improvements list for unified schema compatibility."""
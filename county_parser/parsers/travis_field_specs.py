@@ -10,10 +10,26 @@ ANALYSIS RESULTS:
 - Several field positions were incorrect and have been corrected
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Any
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 import re
 
+import polars as pl
+
+
+# Travis County stores financial values in ten-millionths - these fields are
+# converted to dollars on extraction
+TEN_MILLIONTHS_FIELDS = frozenset([
+    'assessed_value_1', 'land_value', 'improvement_value', 'market_value', 'appraised_value',
+    'entity_assessed_value', 'entity_market_value', 'entity_taxable_value',
+    'prior_year_value', 'tax_amount', 'exemption_amount'
+])
+
+# Two-digit month prefixes used to tell MMDDYYYY dates apart from YYYYMMDD
+MONTH_PREFIXES = ['01', '02', '03', '04', '05', '06', '07', '08', '09', '10', '11', '12']
+
 
 @dataclass
 class FixedWidthField:
@@ -28,54 +44,80 @@ class FixedWidthField:
     def length(self) -> int:
         return self.end - self.start
     
-    def extract(self, line: str) -> Any:
-        """Extract and convert field value from line."""
+    @cached_property
+    def converter(self) -> Callable[[str], Any]:
+        """This field's type conversion for a stripped, non-blank value, bound once per field."""
+        return _build_converter(self.name, self.type)
+    
+    def extract(self, line: Union[str, memoryview]) -> Any:
+        """Extract and convert field value from line.
+        
+        Lines may also be byte buffers (e.g. memory-mapped views); the field is
+        then only decoded to text when it is not blank or all zeros.
+        """
         if len(line) < self.end:
             return None
             
-        value = line[self.start:self.end].strip()
+        if isinstance(line, str):
+            value = line[self.start:self.end].strip()
+        else:
+            raw = bytes(line[self.start:self.end]).strip()
+            if not raw.strip(b'0'):
+                return None
+            value = raw.decode('utf-8', errors='ignore').strip()
         
         if not value or value == "0" * len(value):
             return None
-            
-        try:
-            if self.type == 'int':
-                # Handle numeric values that might have leading zeros
-                clean_val = value.lstrip('0') or '0'
+        
+        return self.converter(value)
+
+
+def _build_converter(name: str, field_type: str) -> Callable[[str], Any]:
+    """Build the converter for one field; values that fail to convert are returned as strings."""
+    if field_type == 'int':
+        # Travis County stores financial values in ten-millionths - convert to dollars
+        scaled = name in TEN_MILLIONTHS_FIELDS
+        
+        def convert_int(value: str) -> Any:
+            # Handle numeric values that might have leading zeros
+            clean_val = value.lstrip('0') or '0'
+            try:
                 int_value = int(clean_val) if clean_val.isdigit() else 0
-                
-                # Travis County stores financial values in ten-millionths - convert to dollars  
-                if self.name in ['assessed_value_1', 'land_value', 'improvement_value', 'market_value', 'appraised_value',
-                                'entity_assessed_value', 'entity_market_value', 'entity_taxable_value', 
-                                'prior_year_value', 'tax_amount', 'exemption_amount']:
-                    return int_value / 1000000000.0  # Convert ten-millionths to dollars
-                    
-                return int_value
-            elif self.type == 'float':
-                clean_val = value.lstrip('0') or '0'
+            except ValueError:
+                return value
+            return int_value / 1000000000.0 if scaled else int_value
+        
+        return convert_int
+    
+    if field_type == 'float':
+        # Tax rates in Travis County are stored in a scaled format - convert to percentage decimal
+        divisor = 1000000000.0 if name == 'tax_rate' else 100
+        
+        def convert_float(value: str) -> Any:
+            clean_val = value.lstrip('0') or '0'
+            try:
                 float_value = float(clean_val) if clean_val.replace('.', '').isdigit() else 0.0
-                
-                # Tax rates in Travis County are stored in a scaled format - convert to percentage decimal
-                if self.name == 'tax_rate':
-                    return float_value / 1000000000.0  # Convert to decimal percentage (e.g., 0.025 for 2.5%)
-                
-                return float_value / 100
-            elif self.type == 'date':
-                # Handle various date formats
-                if len(value) == 8:  # MMDDYYYY or YYYYMMDD
-                    if value[:2] in ['01', '02', '03', '04', '05', '06', '07', '08', '09', '10', '11', '12']:
-                        return f"{value[4:]}-{value[:2]}-{value[2:4]}"  # MMDDYYYY -> YYYY-MM-DD
-                    else:
-                        return f"{value[:4]}-{value[4:6]}-{value[6:8]}"  # YYYYMMDD -> YYYY-MM-DD
-                elif len(value) == 10:  # MM-DD-YYYY
-                    return value.replace('-', '/')
+            except ValueError:
                 return value
-            else:
-                # Clean up string fields
-                cleaned = value.strip()
-                return cleaned if cleaned else None
-        except (ValueError, TypeError):
-            return value  # Return as string if conversion fails
+            return float_value / divisor
+        
+        return convert_float
+    
+    if field_type == 'date':
+        def convert_date(value: str) -> str:
+            # Handle various date formats
+            if len(value) == 8:  # MMDDYYYY or YYYYMMDD
+                if value[:2] in MONTH_PREFIXES:
+                    return f"{value[4:]}-{value[:2]}-{value[2:4]}"  # MMDDYYYY -> YYYY-MM-DD
+                return f"{value[:4]}-{value[4:6]}-{value[6:8]}"  # YYYYMMDD -> YYYY-MM-DD
+            if len(value) == 10:  # MM-DD-YYYY
+                return value.replace('-', '/')
+            return value
+        
+        return convert_date
+    
+    # String values arrive stripped and non-blank
+    return str
 
 
 # PROP.TXT Field Specifications (9,247 characters per line) - CORRECTED POSITIONS
@@ -150,6 +192,279 @@ PROP_ENT_FIELDS = [
 ]
 
 
+# IMP_DET.TXT Field Specifications - improvement details per property
+IMP_DET_FIELDS = [
+    FixedWidthField("account_id", 0, 12, 'str', "Property account ID"),
+    FixedWidthField("improvement_id", 12, 22, 'str', "Improvement identifier"),
+    FixedWidthField("improvement_type", 22, 42, 'str', "Type of improvement"),
+    FixedWidthField("improvement_class", 42, 62, 'str', "Improvement classification"),
+    FixedWidthField("year_built", 62, 66, 'int', "Year improvement was built"),
+    FixedWidthField("square_footage", 66, 76, 'int', "Square footage of improvement"),
+    FixedWidthField("value", 76, 86, 'int', "Value of improvement in ten-millionths"),
+    FixedWidthField("description", 86, 136, 'str', "Improvement description"),
+]
+
+# LAND_DET.TXT Field Specifications - land segments per property
+LAND_DET_FIELDS = [
+    FixedWidthField("account_id", 0, 12, 'str', "Property account ID"),
+    FixedWidthField("land_id", 12, 22, 'str', "Land identifier"),
+    FixedWidthField("land_type", 22, 42, 'str', "Type of land"),
+    FixedWidthField("land_description", 42, 92, 'str', "Land description"),
+    FixedWidthField("land_class", 92, 112, 'str', "Land classification code"),
+    FixedWidthField("land_area", 112, 122, 'int', "Land area in square feet"),
+    FixedWidthField("land_value", 122, 132, 'int', "Land value in ten-millionths"),
+]
+
+# AGENT.TXT Field Specifications
+# Note: AGENT.TXT contains standalone agent records, not property-specific agents
+AGENT_FIELDS = [
+    FixedWidthField("agent_id", 0, 12, 'str', "Agent identifier"),
+    FixedWidthField("agent_name", 12, 72, 'str', "Agent name"),
+    FixedWidthField("agent_address", 72, 142, 'str', "Agent address"),
+    FixedWidthField("agent_city", 142, 162, 'str', "Agent city"),
+    FixedWidthField("agent_state", 162, 165, 'str', "Agent state"),
+    FixedWidthField("agent_zip", 165, 175, 'str', "Agent ZIP code"),
+]
+
+# ABS_SUBD.TXT Field Specifications
+ABS_SUBD_FIELDS = [
+    FixedWidthField("subdivision_id", 0, 12, 'str', "Subdivision identifier"),
+    FixedWidthField("subdivision_name", 12, 62, 'str', "Subdivision name"),
+    FixedWidthField("subdivision_type", 62, 82, 'str', "Type of subdivision"),
+    FixedWidthField("city", 82, 112, 'str', "City where subdivision is located"),
+    FixedWidthField("county", 112, 132, 'str', "County where subdivision is located"),
+]
+
+
+def compile_decoder(fields: List[FixedWidthField],
+                    min_line_length: int = 100) -> Callable[[Union[str, memoryview]], Dict[str, Any]]:
+    """Compile fields into a single function that decodes a line into a record.
+    
+    Positions and converters are bound once, so decoding a line allocates only
+    the record and its values. The result matches calling extract on each
+    field and keeping the non-None values; lines shorter than min_line_length
+    decode to an empty record.
+    """
+    bound = tuple((field.name, field.start, field.end, field.converter) for field in fields)
+    
+    def decode(line: Union[str, memoryview]) -> Dict[str, Any]:
+        length = len(line)
+        if length < min_line_length:
+            return {}
+        
+        record = {}
+        if isinstance(line, str):
+            for name, start, end, convert in bound:
+                if end <= length:
+                    value = line[start:end].strip()
+                    if value.strip('0'):
+                        record[name] = convert(value)
+        else:
+            for name, start, end, convert in bound:
+                if end <= length:
+                    raw = bytes(line[start:end]).strip()
+                    if raw.strip(b'0'):
+                        value = raw.decode('utf-8', errors='ignore').strip()
+                        if value.strip('0'):
+                            record[name] = convert(value)
+        return record
+    
+    return decode
+
+
+@dataclass(eq=False)
+class RecordLayout:
+    """Field layout of one Travis County file.
+    
+    ``key`` matches the TravisCountyConfig ``<key>_file`` setting naming the
+    file, and ``line_length_setting`` names the config setting holding its
+    expected line length, if any.
+    """
+    key: str
+    fields: Tuple[FixedWidthField, ...]
+    key_field: str = "account_id"
+    line_length_setting: Optional[str] = None
+    min_line_length: int = 100
+    _decoders: Dict[Optional[frozenset], Callable] = field(default_factory=dict, repr=False)
+    
+    def fields_for(self, names: Optional[Iterable[str]] = None) -> List[FixedWidthField]:
+        """The fields named in a projection plus the key field, in layout order (all fields for None)."""
+        if names is None:
+            return list(self.fields)
+        if isinstance(names, str):
+            names = [names]
+        
+        wanted = set(names)
+        unknown = wanted - {spec.name for spec in self.fields}
+        if unknown:
+            raise ValueError(f"Unknown {self.key} fields: {', '.join(sorted(unknown))}")
+        wanted.add(self.key_field)
+        return [spec for spec in self.fields if spec.name in wanted]
+    
+    def decoder(self, names: Optional[Iterable[str]] = None) -> Callable[[Union[str, memoryview]], Dict[str, Any]]:
+        """Decoder for a projection of the layout, compiled once per distinct projection."""
+        projection = None if names is None else frozenset([names] if isinstance(names, str) else names)
+        decode = self._decoders.get(projection)
+        if decode is None:
+            decode = compile_decoder(self.fields_for(projection), self.min_line_length)
+            self._decoders[projection] = decode
+        return decode
+    
+    @cached_property
+    def decode(self) -> Callable[[Union[str, memoryview]], Dict[str, Any]]:
+        """Decoder for a whole line, compiled on first use."""
+        return self.decoder()
+
+
+# Layouts for every Travis file with known field positions, keyed like the
+# normalizer's files. Supporting another file (IMP_ATR, IMP_INFO, LAWSUIT, ARB,
+# MOBILE_HOME_INFO, ...) only takes its field list and an entry here.
+TRAVIS_LAYOUTS: Dict[str, RecordLayout] = {
+    layout.key: layout for layout in (
+        RecordLayout("properties", tuple(PROP_FIELDS), line_length_setting="property_line_length"),
+        RecordLayout("property_entities", tuple(PROP_ENT_FIELDS), line_length_setting="entity_line_length"),
+        RecordLayout("improvements", tuple(IMP_DET_FIELDS)),
+        RecordLayout("land_details", tuple(LAND_DET_FIELDS)),
+        RecordLayout("agents", tuple(AGENT_FIELDS), key_field="agent_id"),
+        RecordLayout("subdivisions", tuple(ABS_SUBD_FIELDS), key_field="subdivision_id"),
+    )
+}
+
+
+def get_layout(key: str) -> RecordLayout:
+    """Look up a Travis record layout by file key."""
+    try:
+        return TRAVIS_LAYOUTS[key]
+    except KeyError:
+        raise KeyError(
+            f"No Travis record layout for '{key}' (known layouts: {', '.join(sorted(TRAVIS_LAYOUTS))})"
+        ) from None
+
+
+def validate_layouts(travis_config) -> None:
+    """Check every registered layout against the Travis configuration.
+    
+    Raises ValueError listing each layout whose file is not configured, and
+    each field that is empty, starts before the line or ends past the
+    configured line length.
+    """
+    problems = []
+    for layout in TRAVIS_LAYOUTS.values():
+        if not hasattr(travis_config, f"{layout.key}_file"):
+            problems.append(f"{layout.key}: no '{layout.key}_file' setting in the Travis configuration")
+        if layout.key_field not in {field.name for field in layout.fields}:
+            problems.append(f"{layout.key}: key field '{layout.key_field}' is not in the layout")
+        
+        line_length = getattr(travis_config, layout.line_length_setting) if layout.line_length_setting else None
+        for field in layout.fields:
+            if field.start < 0 or field.start >= field.end:
+                problems.append(f"{layout.key}.{field.name}: invalid span {field.start}-{field.end}")
+            elif line_length is not None and field.end > line_length:
+                problems.append(
+                    f"{layout.key}.{field.name}: ends at {field.end}, past the {line_length}-character line"
+                )
+    
+    if problems:
+        raise ValueError("Invalid Travis record layouts:\n  " + "\n  ".join(problems))
+
+
+def _divide_expr(expr: pl.Expr, divisor: float) -> pl.Expr:
+    """Divide an expression with numpy so results match Python's float division exactly.
+    
+    Polars rewrites division by a scalar as multiplication by its reciprocal,
+    which can differ from FixedWidthField.extract in the last bit.
+    """
+    return expr.cast(pl.Float64).map_batches(
+        lambda s: pl.Series(s.name, s.to_numpy() / divisor, nan_to_null=True),
+        return_dtype=pl.Float64
+    )
+
+
+def fixed_width_field_expr(field: FixedWidthField, line_column: str = "line") -> pl.Expr:
+    """
+    Build a Polars expression that decodes one fixed-width field from a column of lines.
+
+    The conversion rules mirror FixedWidthField.extract so the columnar decoder
+    produces the same values as the line-by-line extractor: blank, all-zero and
+    truncated fields become null, financial fields are scaled from ten-millionths
+    and dates are reformatted. Malformed numbers become null instead of raw strings.
+    """
+    line = pl.col(line_column)
+    raw = line.str.slice(field.start, field.length).str.strip_chars()
+    value = pl.when(
+        (line.str.len_chars() >= field.end) & (raw != "") & ~raw.str.contains(r"^0+$")
+    ).then(raw)
+
+    if field.type == 'int':
+        int_value = (
+            pl.when(value.str.contains(r"^[0-9]+$")).then(value.cast(pl.Int64, strict=False))
+            .when(value.is_not_null()).then(pl.lit(0, dtype=pl.Int64))
+        )
+        if field.name in TEN_MILLIONTHS_FIELDS:
+            return _divide_expr(int_value, 1000000000.0).alias(field.name)
+        return int_value.alias(field.name)
+
+    if field.type == 'float':
+        float_value = (
+            pl.when(value.str.contains(r"^[0-9.]+$")).then(value.cast(pl.Float64, strict=False))
+            .when(value.is_not_null()).then(pl.lit(0.0, dtype=pl.Float64))
+        )
+        divisor = 1000000000.0 if field.name == 'tax_rate' else 100
+        return _divide_expr(float_value, divisor).alias(field.name)
+
+    if field.type == 'date':
+        length = value.str.len_chars()
+        return (
+            pl.when((length == 8) & value.str.slice(0, 2).is_in(MONTH_PREFIXES))
+            .then(pl.concat_str([value.str.slice(4), value.str.slice(0, 2), value.str.slice(2, 2)], separator="-"))
+            .when(length == 8)
+            .then(pl.concat_str([value.str.slice(0, 4), value.str.slice(4, 2), value.str.slice(6, 2)], separator="-"))
+            .when(length == 10)
+            .then(value.str.replace_all("-", "/", literal=True))
+            .otherwise(value)
+            .alias(field.name)
+        )
+
+    return value.alias(field.name)
+
+
+def read_fixed_width_lines(file_path: Union[str, Path], n_rows: Optional[int] = None) -> pl.DataFrame:
+    """
+    Read a fixed-width file into a single-column ``line`` frame using the native CSV reader.
+
+    A separator byte that never appears in the exports keeps every line in one
+    column; blank lines come back as nulls and are dropped by the decoder.
+    """
+    return pl.read_csv(
+        file_path,
+        has_header=False,
+        schema={"line": pl.Utf8},
+        separator="\x1f",
+        quote_char=None,
+        encoding="utf8-lossy",
+        truncate_ragged_lines=True,
+        n_rows=n_rows
+    )
+
+
+def decode_fixed_width_frame(lines: pl.DataFrame, fields: List[FixedWidthField],
+                             line_column: str = "line", min_line_length: int = 100) -> pl.DataFrame:
+    """
+    Slice every field out of a frame of raw lines in a single columnar pass.
+
+    Lines are right-stripped and lines shorter than ``min_line_length`` are
+    skipped, matching the validation done by TravisFieldExtractor.
+    """
+    stripped = pl.col(line_column).str.strip_chars_end()
+    return (
+        lines.lazy()
+        .with_columns(stripped.alias(line_column))
+        .filter(pl.col(line_column).str.len_chars() >= min_line_length)
+        .select([fixed_width_field_expr(field, line_column) for field in fields])
+        .collect()
+    )
+
+
 class TravisFieldExtractor:
     """Extract fields from Travis County fixed-width records."""
     
@@ -157,176 +472,53 @@ class TravisFieldExtractor:
         self.prop_fields = {field.name: field for field in PROP_FIELDS}
         self.prop_ent_fields = {field.name: field for field in PROP_ENT_FIELDS}
     
-    def extract_property_record(self, line: str) -> Dict[str, Any]:
-        """Extract all fields from a PROP.TXT line."""
-        if len(line) < 100:  # Basic validation
-            return {}
-            
-        record = {}
-        for field_name, field_spec in self.prop_fields.items():
-            try:
-                value = field_spec.extract(line)
-                if value is not None:
-                    record[field_name] = value
-            except Exception as e:
-                # Continue extraction even if one field fails
-                record[field_name] = None
-                
-        return record
+    def extract_property_record(self, line: str, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Extract fields from a PROP.TXT line (only account_id and ``fields`` when given)."""
+        return TRAVIS_LAYOUTS['properties'].decoder(fields)(line)
     
-    def extract_entity_record(self, line: str) -> Dict[str, Any]:
-        """Extract all fields from a PROP_ENT.TXT line."""
-        if len(line) < 100:
-            return {}
-            
-        record = {}
-        for field_name, field_spec in self.prop_ent_fields.items():
-            try:
-                value = field_spec.extract(line)
-                if value is not None:
-                    record[field_name] = value
-            except Exception as e:
-                record[field_name] = None
-                
-        return record
+    def extract_entity_record(self, line: str, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Extract fields from a PROP_ENT.TXT line (only account_id and ``fields`` when given)."""
+        return TRAVIS_LAYOUTS['property_entities'].decoder(fields)(line)
     
-    def get_account_id(self, line: str) -> Optional[str]:
+    def get_account_id(self, line: Union[str, memoryview]) -> Optional[str]:
         """Quickly extract just the account ID from any line."""
         if len(line) >= 12:
-            account_id = line[0:12].strip()
+            if isinstance(line, str):
+                account_id = line[0:12].strip()
+            else:
+                account_id = bytes(line[0:12]).decode('utf-8', errors='ignore').strip()
             return account_id if account_id else None
         return None
 
-    def extract_improvement_record(self, line: str) -> Optional[Dict[str, Any]]:
-        """Extract a single improvement record from IMP_DET.TXT line."""
-        if not line or len(line) < 100:
-            return None
-            
-        record = {}
-        
-        # Define improvement fields inline since they keep getting removed
-        improvement_fields = [
-            FixedWidthField("account_id", 0, 12, 'str', "Property account ID"),
-            FixedWidthField("improvement_id", 12, 22, 'str', "Improvement identifier"),
-            FixedWidthField("improvement_type", 22, 42, 'str', "Type of improvement"),
-            FixedWidthField("improvement_class", 42, 62, 'str', "Improvement classification"),
-            FixedWidthField("year_built", 62, 66, 'int', "Year improvement was built"),
-            FixedWidthField("square_footage", 66, 76, 'int', "Square footage of improvement"),
-            FixedWidthField("value", 76, 86, 'int', "Value of improvement in ten-millionths"),
-            FixedWidthField("description", 86, 136, 'str', "Improvement description"),
-        ]
-        
-        for field in improvement_fields:
-            try:
-                value = field.extract(line)
-                if value is not None:
-                    record[field.name] = value
-            except Exception as e:
-                # Skip problematic fields but continue processing
-                continue
+    def extract_layout_record(self, layout_key: str, line: str,
+                              fields: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+        """Extract a record with a registered layout, or None if its key field is missing.
         
+        ``fields`` projects the record onto those fields plus the key field;
+        the other fields are neither sliced nor converted.
+        """
+        if not line:
+            return None
+        layout = get_layout(layout_key)
+        record = layout.decoder(fields)(line)
         # Only return record if it has essential fields
-        if record.get('account_id'):
-            return record
-        
-        return None
+        return record if record.get(layout.key_field) else None
 
-    def extract_land_detail_record(self, line: str) -> Optional[Dict[str, Any]]:
+    def extract_improvement_record(self, line: str, fields: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+        """Extract a single improvement record from IMP_DET.TXT line."""
+        return self.extract_layout_record('improvements', line, fields)
+
+    def extract_land_detail_record(self, line: str, fields: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
         """Extract a single land detail record from LAND_DET.TXT line."""
-        if not line or len(line) < 100:
-            return None
-            
-        record = {}
-        
-        # Define land detail fields inline since they keep getting removed
-        land_detail_fields = [
-            FixedWidthField("account_id", 0, 12, 'str', "Property account ID"),
-            FixedWidthField("land_id", 12, 22, 'str', "Land identifier"),
-            FixedWidthField("land_type", 22, 42, 'str', "Type of land"),
-            FixedWidthField("land_description", 42, 92, 'str', "Land description"),
-            FixedWidthField("land_class", 92, 112, 'str', "Land classification code"),
-            FixedWidthField("land_area", 112, 122, 'int', "Land area in square feet"),
-            FixedWidthField("land_value", 122, 132, 'int', "Land value in ten-millionths"),
-        ]
-        
-        for field in land_detail_fields:
-            try:
-                value = field.extract(line)
-                if value is not None:
-                    record[field.name] = value
-            except Exception as e:
-                # Skip problematic fields but continue processing
-                continue
-        
-        # Only return record if it has essential fields
-        if record.get('account_id'):
-            return record
-        
-        return None
+        return self.extract_layout_record('land_details', line, fields)
 
-    def extract_agent_record(self, line: str) -> Optional[Dict[str, Any]]:
+    def extract_agent_record(self, line: str, fields: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
         """Extract a single agent record from AGENT.TXT line."""
-        if not line or len(line) < 100:
-            return None
-            
-        record = {}
-        
-        # Define agent fields inline since they keep getting removed
-        # Note: AGENT.TXT contains standalone agent records, not property-specific agents
-        agent_fields = [
-            FixedWidthField("agent_id", 0, 12, 'str', "Agent identifier"),
-            FixedWidthField("agent_name", 12, 72, 'str', "Agent name"),
-            FixedWidthField("agent_address", 72, 142, 'str', "Agent address"),
-            FixedWidthField("agent_city", 142, 162, 'str', "Agent city"),
-            FixedWidthField("agent_state", 162, 165, 'str', "Agent state"),
-            FixedWidthField("agent_zip", 165, 175, 'str', "Agent ZIP code"),
-        ]
-        
-        for field in agent_fields:
-            try:
-                value = field.extract(line)
-                if value is not None:
-                    record[field.name] = value
-            except Exception as e:
-                # Skip problematic fields but continue processing
-                continue
-        
-        # Only return record if it has essential fields
-        if record.get('agent_id'):
-            return record
-        
-        return None
+        return self.extract_layout_record('agents', line, fields)
 
-    def extract_subdivision_record(self, line: str) -> Optional[Dict[str, Any]]:
+    def extract_subdivision_record(self, line: str, fields: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
         """Extract a single subdivision record from ABS_SUBD.TXT line."""
-        if not line or len(line) < 100:
-            return None
-            
-        record = {}
-        
-        # Define subdivision fields inline since they keep getting removed
-        subdivision_fields = [
-            FixedWidthField("subdivision_id", 0, 12, 'str', "Subdivision identifier"),
-            FixedWidthField("subdivision_name", 12, 62, 'str', "Subdivision name"),
-            FixedWidthField("subdivision_type", 62, 82, 'str', "Type of subdivision"),
-            FixedWidthField("city", 82, 112, 'str', "City where subdivision is located"),
-            FixedWidthField("county", 112, 132, 'str', "County where subdivision is located"),
-        ]
-        
-        for field in subdivision_fields:
-            try:
-                value = field.extract(line)
-                if value is not None:
-                    record[field.name] = value
-            except Exception as e:
-                # Skip problematic fields but continue processing
-                continue
-        
-        # Only return record if it has essential fields
-        if record.get('subdivision_id'):
-            return record
-        
-        return None
+        return self.extract_layout_record('subdivisions', line, fields)
 
 
 def normalize_travis_account_id(account_id: str) -> str:
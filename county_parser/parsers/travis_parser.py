@@ -13,15 +13,386 @@ IMPROVED VERSION: Now uses corrected field specifications and better data proces
 import polars as pl
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Generator
+from typing import Dict, Iterable, List, Optional, Tuple, Any, Generator
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+import bisect
+import io
 import json
+import mmap
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import logging
 
+from ..models.config import TravisCountyConfig
+from ..utils.staging import ParquetStage
+
 # Import Travis field extractor
-from .travis_field_specs import TravisFieldExtractor, map_to_unified_model
+from .travis_field_specs import (
+    TravisFieldExtractor, map_to_unified_model, PROP_FIELDS, TRAVIS_LAYOUTS,
+    read_fixed_width_lines, decode_fixed_width_frame, validate_layouts
+)
+
+
+def get_record_stride(file_path: Path, line_length: Optional[int] = None) -> Optional[int]:
+    """
+    Return the byte length of one fixed-width record including its line terminator.
+    
+    Returns None when the file is not made of equal-length records (the first
+    line has an unexpected length or the file size is not a whole number of
+    records), in which case callers must fall back to newline scanning.
+    """
+    with open(file_path, 'rb') as f:
+        first_line = f.readline()
+    
+    if not first_line:
+        return None
+    
+    stride = len(first_line)
+    terminator_length = len(first_line) - len(first_line.rstrip(b'\r\n'))
+    if line_length is not None and stride - terminator_length != line_length:
+        return None
+    
+    file_size = file_path.stat().st_size
+    # The final record may be missing its line terminator
+    if file_size % stride != 0 and (file_size + terminator_length) % stride != 0:
+        return None
+    
+    return stride
+
+
+def compute_shard_ranges(file_path: Path, num_shards: int, line_length: Optional[int] = None,
+                         max_bytes: Optional[int] = None, start: int = 0) -> List[Tuple[int, int]]:
+    """
+    Split a fixed-width file into contiguous byte ranges that start on record boundaries.
+    
+    Covers the bytes from start (a record boundary) up to max_bytes, or the end
+    of the file. With a fixed record stride the boundaries are computed
+    arithmetically; otherwise each approximate boundary is advanced to the next newline.
+    """
+    file_size = file_path.stat().st_size
+    if max_bytes is not None:
+        file_size = min(file_size, max_bytes)
+    if file_size <= start:
+        return []
+    
+    num_shards = max(1, num_shards)
+    stride = get_record_stride(file_path, line_length)
+    length = file_size - start
+    
+    if stride:
+        total_records = -(-length // stride)
+        records_per_shard = -(-total_records // num_shards)
+        boundaries = [min(file_size, start + i * records_per_shard * stride) for i in range(num_shards + 1)]
+    else:
+        boundaries = [start]
+        with open(file_path, 'rb') as f:
+            for i in range(1, num_shards):
+                f.seek(max(boundaries[-1], start + length * i // num_shards))
+                f.readline()
+                boundaries.append(min(file_size, f.tell()))
+        boundaries.append(file_size)
+    
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def _read_shard_lines(file_path: str, start: int, end: int) -> Generator[str, None, None]:
+    """Yield the non-empty, right-stripped lines of one byte range."""
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        position = start
+        while position < end:
+            raw_line = f.readline()
+            if not raw_line:
+                break
+            position += len(raw_line)
+            line = raw_line.decode('utf-8', errors='ignore').rstrip()
+            if line:
+                yield line
+
+
+def _rstripped_end(buffer: mmap.mmap, start: int, end: int, block_size: int = 256) -> int:
+    """Return the end offset of buffer[start:end] with trailing whitespace removed."""
+    while end > start:
+        block_start = max(start, end - block_size)
+        stripped = buffer[block_start:end].rstrip()
+        if stripped:
+            return block_start + len(stripped)
+        end = block_start
+    return start
+
+
+def iter_mapped_lines(file_path: Path, start: int = 0,
+                      end: Optional[int] = None) -> Generator[memoryview, None, None]:
+    """
+    Yield zero-copy views of the non-empty lines of a memory-mapped file.
+    
+    Views exclude the line terminator and trailing whitespace, like the
+    right-stripped lines of _read_file_in_chunks, but field positions are byte
+    offsets and nothing is decoded until FixedWidthField.extract reads a field.
+    Each view is released when the next line is requested, so callers must copy
+    out anything they keep.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer, memoryview(buffer) as view:
+            end = len(buffer) if end is None else min(end, len(buffer))
+            position = start
+            while position < end:
+                newline = buffer.find(b'\n', position)
+                line_end = len(buffer) if newline == -1 else newline
+                content_end = _rstripped_end(buffer, position, line_end)
+                if content_end > position:
+                    line = view[position:content_end]
+                    try:
+                        yield line
+                    finally:
+                        line.release()
+                position = line_end + 1
+
+
+def _extract_shard(file_path: str, start: int, end: int, record_type: str,
+                   account_ids: Optional[frozenset] = None, columnar: bool = False,
+                   memory_map: bool = False,
+                   fields: Optional[Tuple[str, ...]] = None) -> Tuple[List[Dict], Dict[str, int]]:
+    """
+    Extract the records in one byte range of PROP.TXT or PROP_ENT.TXT.
+    
+    Runs in a worker process, so it only takes picklable arguments and returns
+    the records in file order together with extraction counters. ``fields``
+    projects each record onto those fields plus account_id.
+    """
+    extractor = TravisFieldExtractor()
+    records = []
+    stats = {'successful_extractions': 0, 'failed_extractions': 0, 'missing_account_ids': 0}
+    
+    if record_type == 'property' and columnar:
+        with open(file_path, 'rb') as f:
+            f.seek(start)
+            data = f.read(end - start)
+        frame = decode_fixed_width_frame(read_fixed_width_lines(io.BytesIO(data)),
+                                         TRAVIS_LAYOUTS['properties'].fields_for(fields))
+        for row in frame.iter_rows(named=True):
+            if row['account_id']:
+                records.append({name: value for name, value in row.items() if value is not None})
+            else:
+                stats['missing_account_ids'] += 1
+        stats['successful_extractions'] = len(records)
+        return records, stats
+    
+    if memory_map:
+        lines = iter_mapped_lines(Path(file_path), start, end)
+    else:
+        lines = _read_shard_lines(file_path, start, end)
+    
+    for line in lines:
+        try:
+            if record_type == 'property':
+                record = extractor.extract_property_record(line, fields)
+                if record and record.get('account_id'):
+                    records.append(record)
+                    stats['successful_extractions'] += 1
+                else:
+                    stats['missing_account_ids'] += 1
+            else:
+                account_id = extractor.get_account_id(line)
+                if account_id and (account_ids is None or account_id in account_ids):
+                    record = extractor.extract_entity_record(line, fields)
+                    if record:
+                        records.append(record)
+                        stats['successful_extractions'] += 1
+        except Exception:
+            stats['failed_extractions'] += 1
+    
+    return records, stats
+
+def account_sort_key(account_id: str) -> Tuple[int, int, str]:
+    """Order account IDs numerically, whether or not they are zero-padded."""
+    if account_id.isdigit():
+        return (0, int(account_id), '')
+    return (1, 0, account_id)
+
+
+def iter_account_groups(records: Iterable[Dict], source: str = 'input') -> Generator[Tuple[str, List[Dict]], None, None]:
+    """
+    Group consecutive records that share an account_id.
+    
+    The records must be ordered by account ID (as the Travis exports are);
+    a ValueError naming source is raised as soon as the order goes backwards.
+    """
+    current_id = None
+    current_key = None
+    group = []
+    
+    for record in records:
+        account_id = record['account_id']
+        if account_id != current_id:
+            key = account_sort_key(account_id)
+            if current_key is not None and key < current_key:
+                raise ValueError(f"{source} is not ordered by account ID ({current_id} before {account_id})")
+            if group:
+                yield current_id, group
+            current_id, current_key, group = account_id, key, []
+        group.append(record)
+    
+    if group:
+        yield current_id, group
+
+
+def merge_join_by_account(primary: Iterable[Tuple[str, List[Dict]]],
+                          *related: Iterable[Tuple[str, List[Dict]]]) -> Generator[Tuple[str, List[Dict], List[List[Dict]]], None, None]:
+    """
+    Sorted merge-join of account groups from iter_account_groups.
+    
+    Yields (account_id, primary records, [records from each related input]) for
+    every primary account, advancing all inputs in lockstep. Related accounts
+    with no primary record are skipped; an account missing from a related input
+    gets an empty list. Only one group per input is held at a time.
+    """
+    related = [iter(groups) for groups in related]
+    heads = [next(groups, None) for groups in related]
+    
+    for account_id, primary_records in primary:
+        key = account_sort_key(account_id)
+        matches = []
+        
+        for index, groups in enumerate(related):
+            head = heads[index]
+            while head is not None and account_sort_key(head[0]) < key:
+                head = next(groups, None)
+            
+            if head is not None and head[0] == account_id:
+                matches.append(head[1])
+                head = next(groups, None)
+            else:
+                matches.append([])
+            heads[index] = head
+        
+        yield account_id, primary_records, matches
+
+
+class AccountOffsetIndex:
+    """
+    Locate accounts in an account-ordered Travis file without scanning it.
+    
+    Files of equal-length records (see get_record_stride) are bisected directly
+    on record number, reading only the account field of O(log n) records from a
+    memory map. Without a configured line_length the stride guessed from the
+    first line is only trusted once every record boundary has been checked.
+    Other files get a sparse index of every ``sparse_interval``-th line's
+    account and offset, built in one pass on first use; a lookup bisects the
+    sparse index and scans at most one interval. Lines are returned
+    right-stripped and decoded, like _read_shard_lines.
+    """
+    
+    def __init__(self, file_path: Path, line_length: Optional[int] = None,
+                 sparse_interval: int = 1024, key_width: int = 12):
+        self.file_path = Path(file_path)
+        self.key_width = key_width
+        self.sparse_interval = sparse_interval
+        self.stride = get_record_stride(self.file_path, line_length)
+        
+        self._file = open(self.file_path, 'rb')
+        self.size = os.fstat(self._file.fileno()).st_size
+        self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+        self._sparse_keys = None
+        self._sparse_offsets = None
+        
+        if self.stride and line_length is None and not self._stride_holds():
+            self.stride = None
+    
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _stride_holds(self) -> bool:
+        """Whether a line terminator ends every stride-long record (a final unterminated record is allowed)."""
+        terminators = self._buffer[self.stride - 1::self.stride]
+        return terminators.count(b'\n') == len(terminators)
+    
+    def _line_end(self, offset: int) -> int:
+        newline = self._buffer.find(b'\n', offset)
+        return self.size if newline == -1 else newline
+    
+    def _account_at(self, offset: int) -> str:
+        return self._buffer[offset:offset + self.key_width].decode('utf-8', errors='ignore').strip()
+    
+    def _build_sparse_index(self):
+        keys, offsets = [], []
+        offset = line_number = 0
+        while offset < self.size:
+            line_end = self._line_end(offset)
+            account_id = self._account_at(offset)
+            if account_id:
+                if line_number % self.sparse_interval == 0:
+                    keys.append(account_sort_key(account_id))
+                    offsets.append(offset)
+                line_number += 1
+            offset = line_end + 1
+        self._sparse_keys, self._sparse_offsets = keys, offsets
+    
+    def lower_bound(self, account_id: str) -> int:
+        """Byte offset of the first record whose account is not before account_id."""
+        key = account_sort_key(account_id)
+        
+        if self.stride:
+            low, high = 0, -(-self.size // self.stride)
+            while low < high:
+                middle = (low + high) // 2
+                if account_sort_key(self._account_at(middle * self.stride)) < key:
+                    low = middle + 1
+                else:
+                    high = middle
+            return min(low * self.stride, self.size)
+        
+        if self._sparse_keys is None:
+            self._build_sparse_index()
+        # Start from the last sampled line before the account and scan forward
+        position = bisect.bisect_left(self._sparse_keys, key)
+        offset = self._sparse_offsets[position - 1] if position else 0
+        while offset < self.size:
+            account_id = self._account_at(offset)
+            if account_id and account_sort_key(account_id) >= key:
+                return offset
+            offset = self._line_end(offset) + 1
+        return self.size
+    
+    def iter_lines(self, start: int = 0, end: Optional[int] = None) -> Generator[str, None, None]:
+        """Yield the non-empty, right-stripped lines from a record boundary up to end (default: end of file)."""
+        offset = start
+        end = self.size if end is None else end
+        while offset < end:
+            line_end = self._line_end(offset)
+            line = self._buffer[offset:line_end].decode('utf-8', errors='ignore').rstrip()
+            if line:
+                yield line
+            offset = line_end + 1
+    
+    def range(self, first_id: str, last_id: str) -> Generator[str, None, None]:
+        """Yield the lines of every account from first_id through last_id, inclusive."""
+        last_key = account_sort_key(last_id)
+        for line in self.iter_lines(self.lower_bound(first_id)):
+            account_id = line[:self.key_width].strip()
+            if account_id and account_sort_key(account_id) > last_key:
+                return
+            yield line
+    
+    def lookup(self, account_id: str) -> List[str]:
+        """All lines of one account (an empty list when it is not in the file)."""
+        key = account_sort_key(account_id)
+        return [line for line in self.range(account_id, account_id)
+                if account_sort_key(line[:self.key_width].strip()) == key]
+
 
 class TravisCountyNormalizer:
     """Normalizer for Travis County appraisal data."""
@@ -29,6 +400,7 @@ class TravisCountyNormalizer:
     def __init__(self, config=None):
         self.config = config
         self.console = Console()
+        self.travis_config = getattr(config, 'travis_config', None) or TravisCountyConfig()
         
         # Setup logging
         logging.basicConfig(level=logging.INFO)
@@ -47,9 +419,14 @@ class TravisCountyNormalizer:
             'subdivisions': travis_data_dir / 'ABS_SUBD.TXT'
         }
         
-        # Initialize field extractor
+        # Initialize field extractor, checking the record layouts against the configured line lengths
+        if self.travis_config.validate_field_positions:
+            validate_layouts(self.travis_config)
         self.field_extractor = TravisFieldExtractor()
         
+        # AccountOffsetIndex per file key, opened on first lookup
+        self._account_indexes = {}
+        
         # Data quality metrics
         self.processing_stats = {
             'total_properties': 0,
@@ -129,9 +506,251 @@ class TravisCountyNormalizer:
             self.processing_stats['processing_errors'].append(str(e))
             yield []
     
-    def extract_property_records(self, max_records: Optional[int] = None) -> Dict[str, Dict]:
-        """Extract property records from PROP.TXT with improved error handling."""
+    def _iter_lines(self, file_path: Path, memory_map: bool = False) -> Generator[Any, None, None]:
+        """Yield the non-empty lines of a file, as zero-copy memoryviews when memory_map is set."""
+        if memory_map:
+            yield from iter_mapped_lines(file_path)
+        else:
+            for chunk in self._read_file_in_chunks(file_path):
+                yield from chunk
+    
+    def close(self):
+        """Close the AccountOffsetIndex files and memory maps opened by lookups and windowed scans."""
+        for index in self._account_indexes.values():
+            index.close()
+        self._account_indexes.clear()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def account_index(self, file_key: str) -> AccountOffsetIndex:
+        """The AccountOffsetIndex of one account-keyed file (e.g. 'properties'), opened once until close()."""
+        index = self._account_indexes.get(file_key)
+        if index is None or index.file_path != self.files[file_key]:
+            if index is not None:
+                index.close()
+            line_lengths = {
+                'properties': self.travis_config.property_line_length,
+                'property_entities': self.travis_config.entity_line_length,
+            }
+            index = AccountOffsetIndex(self.files[file_key], line_lengths.get(file_key))
+            self._account_indexes[file_key] = index
+        return index
+    
+    def get_property(self, account_id: str, fields: Optional[Iterable[str]] = None) -> Optional[Dict]:
+        """Look up one PROP.TXT record by binary search (the last one if the account repeats)."""
+        records = [
+            record for record in (self.field_extractor.extract_property_record(line, fields)
+                                  for line in self.account_index('properties').lookup(account_id))
+            if record and record.get('account_id')
+        ]
+        return records[-1] if records else None
+    
+    def get_entities(self, account_id: str, fields: Optional[Iterable[str]] = None) -> List[Dict]:
+        """Look up the PROP_ENT.TXT records of one account by binary search."""
+        return [
+            record for record in (self.field_extractor.extract_entity_record(line, fields)
+                                  for line in self.account_index('property_entities').lookup(account_id))
+            if record
+        ]
+    
+    def get_property_range(self, first_id: str, last_id: str,
+                           fields: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+        """PROP.TXT records for accounts first_id through last_id, keyed like extract_property_records."""
+        property_records = {}
+        for line in self.account_index('properties').range(first_id, last_id):
+            record = self.field_extractor.extract_property_record(line, fields)
+            if record and record.get('account_id'):
+                property_records[record['account_id']] = record
+        return property_records
+    
+    def _iter_account_lines(self, file_key: str, account_ids: Optional[set] = None,
+                            memory_map: bool = False) -> Generator[Any, None, None]:
+        """
+        Yield the lines of an account-keyed file that can hold any of account_ids.
+        
+        With TravisCountyConfig.files_sorted_by_account the scan starts at the
+        first requested account (found by binary search) and stops as soon as it
+        passes the last one, instead of reading the whole file. If the scan meets
+        an account out of order, the file is not sorted after all: it warns and
+        reads the rest of the file, plus the part before the window, in full.
+        """
+        file_path = self.files[file_key]
+        if not account_ids or not self.travis_config.files_sorted_by_account:
+            yield from self._iter_lines(file_path, memory_map)
+            return
+        
+        index = self.account_index(file_key)
+        first_id = min(account_ids, key=account_sort_key)
+        last_key = account_sort_key(max(account_ids, key=account_sort_key))
+        start = index.lower_bound(first_id)
+        lines = iter_mapped_lines(file_path, start) if memory_map else index.iter_lines(start)
+        
+        previous_key = None
+        for line in lines:
+            account_id = self.field_extractor.get_account_id(line)
+            if account_id:
+                key = account_sort_key(account_id)
+                if previous_key is not None and key < previous_key:
+                    self.console.print(f"[yellow]⚠️ {file_path.name} is not ordered by account ID; "
+                                       f"reading the whole file[/yellow]")
+                    yield line
+                    yield from lines
+                    yield from iter_mapped_lines(file_path, 0, start) if memory_map else index.iter_lines(0, start)
+                    return
+                if key > last_key:
+                    return
+                previous_key = key
+            yield line
+    
+    def extract_property_frame(self, max_records: Optional[int] = None,
+                               fields: Optional[Iterable[str]] = None) -> pl.DataFrame:
+        """Decode PROP.TXT into a Polars frame with one column per PROP_FIELDS entry.
+        
+        Every field is sliced and converted with native string kernels in a single
+        pass, instead of calling FixedWidthField.extract per field per line. With
+        ParsingOptions.stage_parquet on, the decoded frame is staged as Parquet and
+        reused while PROP.TXT is unchanged. ``fields`` limits the frame to those
+        columns plus account_id; a projected frame is decoded on its own and
+        never staged.
+        
+        max_records counts decoded records, not raw lines, so blank and short
+        lines do not shrink the sample and every path returns the same records
+        as the line-by-line extractor.
+        """
+        prop_file = self.files['properties']
+        selected = TRAVIS_LAYOUTS['properties'].fields_for(fields)
+        
+        stage = self._parquet_stage()
+        # The staged frame only holds decoded records, so n_rows already counts records
+        staged_frame = stage.read(prop_file, variant='decoded', n_rows=max_records)
+        if staged_frame is not None:
+            return staged_frame.select([spec.name for spec in selected])
+        
+        def decode(lines: pl.DataFrame) -> pl.DataFrame:
+            frame = decode_fixed_width_frame(lines, selected)
+            return frame.filter(pl.col('account_id').is_not_null())
+        
+        if max_records is not None:
+            # Read more lines until enough of them decode to records or the file runs out
+            n_rows = max_records
+            while True:
+                lines = read_fixed_width_lines(prop_file, n_rows=n_rows)
+                frame = decode(lines)
+                if len(frame) >= max_records or len(lines) < n_rows:
+                    return frame.head(max_records)
+                n_rows *= 2
+        
+        if fields is not None:
+            return decode(read_fixed_width_lines(prop_file))
+        return stage.load(prop_file, lambda: decode(read_fixed_width_lines(prop_file)), variant='decoded')
+    
+    def _parquet_stage(self) -> ParquetStage:
+        parsing = getattr(self.config, 'parsing', None)
+        enabled = parsing is not None and parsing.stage_parquet
+        return ParquetStage(getattr(self.config, 'output_dir', Path('output')), enabled)
+    
+    def _extract_property_records_columnar(self, max_records: Optional[int] = None,
+                                           fields: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+        """Build the property record dict from the columnar PROP.TXT decoder."""
+        property_records = {}
+        
+        frame = self.extract_property_frame(max_records, fields)
+        
+        for row in frame.iter_rows(named=True):
+            property_records[row['account_id']] = {
+                field_name: value for field_name, value in row.items() if value is not None
+            }
+        
+        self.processing_stats['successful_extractions'] += len(frame)
+        return property_records
+    
+    def _get_max_workers(self) -> int:
+        """Number of worker processes for sharded extraction (ParsingOptions.max_workers)."""
+        parsing = getattr(self.config, 'parsing', None)
+        return max(1, parsing.max_workers if parsing else os.cpu_count() or 1)
+    
+    def _extract_in_shards(self, file_path: Path, record_type: str, line_length: int,
+                           account_ids: Optional[set] = None, max_records: Optional[int] = None,
+                           columnar: bool = False, memory_map: bool = False,
+                           fields: Optional[Iterable[str]] = None) -> List[Dict]:
+        """
+        Extract PROP.TXT or PROP_ENT.TXT records with a process pool, one byte range per worker.
+        
+        Records are returned in file order; worker counters are merged into processing_stats.
+        max_records counts extracted records (after the account_ids filter), as the
+        serial extractors do. Without a filter on a fixed-stride file only the
+        leading max_records records are read at first, and the rest of the file
+        only if blank lines or lines without an account left the sample short.
+        Otherwise the file is read in shards, in order, until enough records
+        have been extracted.
+        """
+        max_workers = self._get_max_workers()
+        shared_ids = frozenset(account_ids) if account_ids is not None else None
+        projection = tuple(fields) if fields is not None else None
+        
+        # Byte ranges (start, end) read one after another until max_records are found
+        passes = [(0, None)]
+        num_shards = max_workers
+        if max_records:
+            stride = get_record_stride(file_path, line_length) if account_ids is None else None
+            head_bytes = max_records * stride if stride else None
+            if head_bytes is not None and head_bytes < file_path.stat().st_size:
+                passes = [(0, head_bytes), (head_bytes, None)]
+            # Smaller shards let the scan stop soon after the limit is reached
+            num_shards = max_workers * 4
+        
+        self.console.print(f"[blue]⚡ Extracting {file_path.name} in shards with {max_workers} workers[/blue]")
+        
+        records = []
+        # Polars' thread pool is not fork-safe, so workers start from a fresh interpreter
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            for start, end in passes:
+                futures = [
+                    executor.submit(_extract_shard, str(file_path), shard_start, shard_end, record_type,
+                                    shared_ids, columnar, memory_map, projection)
+                    for shard_start, shard_end in compute_shard_ranges(file_path, num_shards, line_length,
+                                                                       end, start)
+                ]
+                for future in futures:
+                    shard_records, shard_stats = future.result()
+                    records.extend(shard_records)
+                    for key, count in shard_stats.items():
+                        self.processing_stats[key] += count
+                    if max_records and len(records) >= max_records:
+                        break
+                
+                if max_records and len(records) >= max_records:
+                    for future in futures:
+                        future.cancel()
+                    break
+        
+        return records[:max_records] if max_records else records
+    
+    def extract_property_records(self, max_records: Optional[int] = None, columnar: bool = False,
+                                 parallel: bool = False, memory_map: bool = False,
+                                 fields: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+        """Extract property records from PROP.TXT with improved error handling.
+        
+        Args:
+            max_records: Stop after this many property records
+            columnar: Decode the file with the Polars columnar decoder instead of
+                extracting fields line by line
+            parallel: Split the file into byte-range shards and extract them in a
+                process pool of ParsingOptions.max_workers workers
+            memory_map: Extract fields line by line from zero-copy views of a
+                memory-mapped file instead of decoded text lines
+            fields: Only slice and convert these PROP_FIELDS (account_id is
+                always included); None decodes every field
+        """
         prop_file = self.files['properties']
+        if fields is not None:
+            # Reject unknown fields up front instead of failing on every line
+            fields = [spec.name for spec in TRAVIS_LAYOUTS['properties'].fields_for(fields)]
         
         if not prop_file.exists():
             self.console.print(f"[red]Properties file not found: {prop_file}[/red]")
@@ -142,30 +761,50 @@ class TravisCountyNormalizer:
         property_records = {}
         record_count = 0
         
+        if parallel:
+            try:
+                for prop_record in self._extract_in_shards(
+                    prop_file, 'property', self.travis_config.property_line_length,
+                    max_records=max_records, columnar=columnar, memory_map=memory_map, fields=fields
+                ):
+                    property_records[prop_record['account_id']] = prop_record
+                self.processing_stats['total_properties'] = len(property_records)
+                self.console.print(f"[green]✅ Extracted {len(property_records):,} property records (parallel)[/green]")
+            except Exception as e:
+                self.console.print(f"[red]Error extracting properties: {e}[/red]")
+                self.processing_stats['processing_errors'].append(str(e))
+            return property_records
+        
+        if columnar:
+            try:
+                property_records = self._extract_property_records_columnar(max_records, fields)
+                self.processing_stats['total_properties'] = len(property_records)
+                self.console.print(f"[green]✅ Extracted {len(property_records):,} property records (columnar)[/green]")
+            except Exception as e:
+                self.console.print(f"[red]Error extracting properties: {e}[/red]")
+                self.processing_stats['processing_errors'].append(str(e))
+            return property_records
+        
         try:
-            for chunk in self._read_file_in_chunks(prop_file):
-                for line in chunk:
-                    if max_records and record_count >= max_records:
-                        break
-                    
-                    try:
-                        # Extract property record using our corrected field specifications
-                        prop_record = self.field_extractor.extract_property_record(line)
-                        
-                        if prop_record and prop_record.get('account_id'):
-                            property_records[prop_record['account_id']] = prop_record
-                            record_count += 1
-                            self.processing_stats['successful_extractions'] += 1
-                        else:
-                            self.processing_stats['missing_account_ids'] += 1
-                            
-                    except Exception as e:
-                        self.processing_stats['failed_extractions'] += 1
-                        self.logger.warning(f"Failed to extract property record: {e}")
-                        continue
-                
+            for line in self._iter_lines(prop_file, memory_map):
                 if max_records and record_count >= max_records:
                     break
+                
+                try:
+                    # Extract property record using our corrected field specifications
+                    prop_record = self.field_extractor.extract_property_record(line, fields)
+                    
+                    if prop_record and prop_record.get('account_id'):
+                        property_records[prop_record['account_id']] = prop_record
+                        record_count += 1
+                        self.processing_stats['successful_extractions'] += 1
+                    else:
+                        self.processing_stats['missing_account_ids'] += 1
+                        
+                except Exception as e:
+                    self.processing_stats['failed_extractions'] += 1
+                    self.logger.warning(f"Failed to extract property record: {e}")
+                    continue
             
             self.processing_stats['total_properties'] = len(property_records)
             self.console.print(f"[green]✅ Extracted {len(property_records):,} property records[/green]")
@@ -176,9 +815,16 @@ class TravisCountyNormalizer:
         
         return property_records
     
-    def extract_entity_records(self, property_account_ids: set, max_records: Optional[int] = None) -> Dict[str, List[Dict]]:
-        """Extract property entity records from PROP_ENT.TXT, grouped by account_id."""
+    def extract_entity_records(self, property_account_ids: set, max_records: Optional[int] = None,
+                               parallel: bool = False, memory_map: bool = False,
+                               fields: Optional[Iterable[str]] = None) -> Dict[str, List[Dict]]:
+        """Extract property entity records from PROP_ENT.TXT, grouped by account_id.
+        
+        ``fields`` limits each record to those PROP_ENT_FIELDS plus account_id.
+        """
         ent_file = self.files['property_entities']
+        if fields is not None:
+            fields = [spec.name for spec in TRAVIS_LAYOUTS['property_entities'].fields_for(fields)]
         
         if not ent_file.exists():
             self.console.print(f"[yellow]⚠️ Property entities file not found: {ent_file}[/yellow]")
@@ -189,33 +835,44 @@ class TravisCountyNormalizer:
         entity_records = {}
         record_count = 0
         
+        if parallel:
+            try:
+                for entity_record in self._extract_in_shards(
+                    ent_file, 'entity', self.travis_config.entity_line_length,
+                    account_ids=property_account_ids, max_records=max_records, memory_map=memory_map,
+                    fields=fields
+                ):
+                    entity_records.setdefault(entity_record['account_id'], []).append(entity_record)
+                self.processing_stats['total_entities'] = sum(len(entities) for entities in entity_records.values())
+                self.console.print(f"[green]✅ Extracted {self.processing_stats['total_entities']:,} entity records for {len(entity_records):,} properties (parallel)[/green]")
+            except Exception as e:
+                self.console.print(f"[red]Error extracting entities: {e}[/red]")
+                self.processing_stats['processing_errors'].append(str(e))
+            return entity_records
+        
         try:
-            for chunk in self._read_file_in_chunks(ent_file):
-                for line in chunk:
-                    if max_records and record_count >= max_records:
-                        break
-                    
-                    try:
-                        # Quick account ID check for efficiency
-                        account_id = self.field_extractor.get_account_id(line)
-                        
-                        if account_id and account_id in property_account_ids:
-                            entity_record = self.field_extractor.extract_entity_record(line)
-                            
-                            if entity_record:
-                                if account_id not in entity_records:
-                                    entity_records[account_id] = []
-                                entity_records[account_id].append(entity_record)
-                                record_count += 1
-                                self.processing_stats['successful_extractions'] += 1
-                        
-                    except Exception as e:
-                        self.processing_stats['failed_extractions'] += 1
-                        self.logger.warning(f"Failed to extract entity record: {e}")
-                        continue
-                
+            for line in self._iter_account_lines('property_entities', property_account_ids, memory_map):
                 if max_records and record_count >= max_records:
                     break
+                
+                try:
+                    # Quick account ID check for efficiency
+                    account_id = self.field_extractor.get_account_id(line)
+                    
+                    if account_id and account_id in property_account_ids:
+                        entity_record = self.field_extractor.extract_entity_record(line, fields)
+                        
+                        if entity_record:
+                            if account_id not in entity_records:
+                                entity_records[account_id] = []
+                            entity_records[account_id].append(entity_record)
+                            record_count += 1
+                            self.processing_stats['successful_extractions'] += 1
+                    
+                except Exception as e:
+                    self.processing_stats['failed_extractions'] += 1
+                    self.logger.warning(f"Failed to extract entity record: {e}")
+                    continue
             
             self.processing_stats['total_entities'] = sum(len(entities) for entities in entity_records.values())
             self.console.print(f"[green]✅ Extracted {self.processing_stats['total_entities']:,} entity records for {len(entity_records):,} properties[/green]")
@@ -237,51 +894,19 @@ class TravisCountyNormalizer:
         
         unified_records = []
         
+        # Agents are standalone records, not property-specific: every property gets all of them
+        related_agents = agent_records.get('general_agents', []) if agent_records else []
+        
         for account_id, prop_record in property_records.items():
             try:
-                # Get related entity records for this property
-                related_entities = entity_records.get(account_id, [])
-                
-                # Get related improvement records
-                related_improvements = improvement_records.get(account_id, []) if improvement_records else []
-                
-                # Get related land detail records
-                related_land_details = land_detail_records.get(account_id, []) if land_detail_records else []
-                
-                # Get related agent records (agents are standalone, not property-specific)
-                # For now, we'll include all available agents as a general reference
-                related_agents = agent_records.get('general_agents', []) if agent_records else []
-                
-                # Transform to unified format using our corrected field specifications
-                unified_record = map_to_unified_model(prop_record, related_entities)
-                
-                # Add improvements field for unified schema compatibility
-                unified_record['improvements'] = related_improvements
-                
-                # Add land details field for unified schema compatibility
-                unified_record['land_details'] = related_land_details
-                
-                # Add agents field for unified schema compatibility
-                unified_record['agents'] = related_agents
-                
-                # Add subdivision info if available (look up by subdivision code)
-                if subdivision_records and prop_record.get('subdivision_code'):
-                    subdivision_code = prop_record.get('subdivision_code')
-                    if subdivision_code in subdivision_records:
-                        unified_record['subdivision'] = subdivision_records[subdivision_code]
-                
-                # Add processing metadata
-                unified_record['metadata']['last_updated'] = datetime.now().isoformat()
-                unified_record['metadata']['processing_stats'] = {
-                    'extraction_success': True,
-                    'entity_count': len(related_entities),
-                    'improvement_count': len(related_improvements),
-                    'land_detail_count': len(related_land_details),
-                    'agent_count': len(related_agents),
-                    'processing_timestamp': datetime.now().isoformat()
-                }
-                
-                unified_records.append(unified_record)
+                unified_records.append(self._build_unified_record(
+                    prop_record,
+                    entity_records.get(account_id, []),
+                    improvement_records.get(account_id, []) if improvement_records else [],
+                    land_detail_records.get(account_id, []) if land_detail_records else [],
+                    related_agents,
+                    subdivision_records
+                ))
                 
             except Exception as e:
                 self.logger.error(f"Failed to normalize record {account_id}: {e}")
@@ -291,8 +916,137 @@ class TravisCountyNormalizer:
         self.console.print(f"[green]🎉 Successfully normalized {len(unified_records):,} records[/green]")
         return unified_records
     
-    def load_and_normalize_sample(self, sample_size: int = 100) -> List[Dict]:
-        """Load and normalize a sample of Travis County data with improved processing."""
+    def _build_unified_record(self, prop_record: Dict, related_entities: List[Dict],
+                              related_improvements: List[Dict], related_land_details: List[Dict],
+                              related_agents: List[Dict], subdivision_records: Optional[Dict[str, Dict]]) -> Dict:
+        """Assemble one unified record from a property and its related records."""
+        # Transform to unified format using our corrected field specifications
+        unified_record = map_to_unified_model(prop_record, related_entities)
+        
+        # Add improvements field for unified schema compatibility
+        unified_record['improvements'] = related_improvements
+        
+        # Add land details field for unified schema compatibility
+        unified_record['land_details'] = related_land_details
+        
+        # Add agents field for unified schema compatibility
+        unified_record['agents'] = related_agents
+        
+        # Add subdivision info if available (look up by subdivision code)
+        if subdivision_records and prop_record.get('subdivision_code'):
+            subdivision_code = prop_record.get('subdivision_code')
+            if subdivision_code in subdivision_records:
+                unified_record['subdivision'] = subdivision_records[subdivision_code]
+        
+        # Add processing metadata
+        unified_record['metadata']['last_updated'] = datetime.now().isoformat()
+        unified_record['metadata']['processing_stats'] = {
+            'extraction_success': True,
+            'entity_count': len(related_entities),
+            'improvement_count': len(related_improvements),
+            'land_detail_count': len(related_land_details),
+            'agent_count': len(related_agents),
+            'processing_timestamp': datetime.now().isoformat()
+        }
+        
+        return unified_record
+    
+    def _iter_file_records(self, file_key: str, extract, memory_map: bool = False) -> Generator[Dict, None, None]:
+        """Yield the records extract() finds in one Travis file, in file order.
+        
+        A missing file yields nothing, like the dict-based extract_* methods.
+        """
+        file_path = self.files[file_key]
+        if not file_path.exists():
+            self.console.print(f"[yellow]⚠️ {file_path.name} not found, skipping[/yellow]")
+            return
+        
+        for line in self._iter_lines(file_path, memory_map):
+            try:
+                record = extract(line)
+            except Exception as e:
+                self.processing_stats['failed_extractions'] += 1
+                self.logger.warning(f"Failed to extract {file_path.name} record: {e}")
+                continue
+            
+            if record and record.get('account_id'):
+                yield record
+            elif file_key == 'properties':
+                self.processing_stats['missing_account_ids'] += 1
+    
+    def iter_normalized_records(self, max_records: Optional[int] = None,
+                                memory_map: bool = False) -> Generator[Dict, None, None]:
+        """
+        Stream unified records with a sorted merge-join of PROP, PROP_ENT, IMP_DET and LAND_DET.
+        
+        The Travis exports are ordered by account ID, so the four files are read
+        once each, in lockstep, and every unified record is yielded as soon as its
+        account is complete. Memory stays constant in the size of the county,
+        except for the small AGENT.TXT and ABS_SUBD.TXT lookups. Raises ValueError
+        if a file turns out not to be ordered by account ID.
+        
+        Args:
+            max_records: Stop after this many properties (the related files are
+                only read up to the last of their accounts)
+            memory_map: Extract PROP.TXT and PROP_ENT.TXT fields from zero-copy
+                views of memory-mapped files
+        """
+        extractor = self.field_extractor
+        
+        def strip_line(extract):
+            # IMP_DET.TXT and LAND_DET.TXT lines are stripped before extraction, as in their extract_* methods
+            return lambda line: extract(line.strip())
+        
+        properties = self._iter_file_records('properties', extractor.extract_property_record, memory_map)
+        entities = self._iter_file_records('property_entities', extractor.extract_entity_record, memory_map)
+        improvements = self._iter_file_records('improvements', strip_line(extractor.extract_improvement_record))
+        land_details = self._iter_file_records('land_details', strip_line(extractor.extract_land_detail_record))
+        
+        agent_records = self.extract_agent_records(set())
+        related_agents = agent_records.get('general_agents', [])
+        subdivision_records = self.extract_subdivision_records()
+        
+        self.console.print("[blue]🔗 Merge-joining PROP, PROP_ENT, IMP_DET and LAND_DET by account ID...[/blue]")
+        
+        joined = merge_join_by_account(
+            iter_account_groups(properties, 'PROP.TXT'),
+            iter_account_groups(entities, 'PROP_ENT.TXT'),
+            iter_account_groups(improvements, 'IMP_DET.TXT'),
+            iter_account_groups(land_details, 'LAND_DET.TXT')
+        )
+        
+        normalized_count = 0
+        for account_id, prop_group, (related_entities, related_improvements, related_land_details) in joined:
+            # A repeated PROP.TXT account keeps its last record, as extract_property_records does
+            prop_record = prop_group[-1]
+            self.processing_stats['total_properties'] += 1
+            self.processing_stats['total_entities'] += len(related_entities)
+            self.processing_stats['successful_extractions'] += len(prop_group) + len(related_entities)
+            
+            try:
+                unified_record = self._build_unified_record(prop_record, related_entities, related_improvements,
+                                                            related_land_details, related_agents, subdivision_records)
+            except Exception as e:
+                self.logger.error(f"Failed to normalize record {account_id}: {e}")
+                self.processing_stats['processing_errors'].append(f"Normalization failed for {account_id}: {e}")
+                continue
+            
+            yield unified_record
+            normalized_count += 1
+            if max_records and normalized_count >= max_records:
+                break
+        
+        self.console.print(f"[green]🎉 Successfully normalized {normalized_count:,} records (merge-join)[/green]")
+    
+    def load_and_normalize_sample(self, sample_size: int = 100, columnar: bool = False,
+                                  parallel: bool = False, memory_map: bool = False,
+                                  merge_join: bool = False) -> List[Dict]:
+        """Load and normalize a sample of Travis County data with improved processing.
+        
+        With merge_join the records come from iter_normalized_records, a single
+        streaming pass over the account-ordered files (columnar and parallel do
+        not apply to that path).
+        """
         
         self.console.print(f"[blue]🏛️ Processing Travis County sample ({sample_size:,} properties)[/blue]")
         
@@ -306,8 +1060,14 @@ class TravisCountyNormalizer:
             'processing_errors': []
         }
         
+        if merge_join:
+            normalized_records = list(self.iter_normalized_records(sample_size, memory_map))
+            self._display_processing_summary()
+            return normalized_records
+        
         # Step 1: Extract property records
-        property_records = self.extract_property_records(max_records=sample_size)
+        property_records = self.extract_property_records(max_records=sample_size, columnar=columnar,
+                                                         parallel=parallel, memory_map=memory_map)
         
         if not property_records:
             self.console.print("[red]❌ No property records extracted[/red]")
@@ -315,7 +1075,7 @@ class TravisCountyNormalizer:
         
         # Step 2: Extract related entity records
         property_account_ids = set(property_records.keys())
-        entity_records = self.extract_entity_records(property_account_ids)
+        entity_records = self.extract_entity_records(property_account_ids, parallel=parallel, memory_map=memory_map)
         
         # Step 3: Extract improvement records
         improvement_records = self.extract_improvement_records(property_account_ids)
@@ -337,6 +1097,7 @@ class TravisCountyNormalizer:
         
         # Display processing summary
         self._display_processing_summary()
+        self.close()
         
         return normalized_records
     
@@ -450,22 +1211,21 @@ class TravisCountyNormalizer:
             return improvement_records
         
         try:
-            with open(self.files['improvements'], 'r', encoding='utf-8', errors='ignore') as f:
-                for line_num, line in enumerate(f, 1):
-                    if not line.strip():
-                        continue
-                    
-                    try:
-                        record = self.field_extractor.extract_improvement_record(line.strip())
-                        if record and record.get('account_id') in property_account_ids:
-                            account_id = record['account_id']
-                            if account_id not in improvement_records:
-                                improvement_records[account_id] = []
-                            improvement_records[account_id].append(record)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to parse improvement record at line {line_num}: {e}")
-                        continue
-            
+            for line_num, line in enumerate(self._iter_account_lines('improvements', property_account_ids), 1):
+                if not line.strip():
+                    continue
+                
+                try:
+                    record = self.field_extractor.extract_improvement_record(line.strip())
+                    if record and record.get('account_id') in property_account_ids:
+                        account_id = record['account_id']
+                        if account_id not in improvement_records:
+                            improvement_records[account_id] = []
+                        improvement_records[account_id].append(record)
+                except Exception as e:
+                    self.logger.warning(f"Failed to parse improvement record at line {line_num}: {e}")
+                    continue
+        
             self.console.print(f"[green]✅ Extracted {sum(len(records) for records in improvement_records.values()):,} improvement records[/green]")
             
         except Exception as e:
@@ -483,22 +1243,21 @@ class TravisCountyNormalizer:
             return land_detail_records
         
         try:
-            with open(self.files['land_details'], 'r', encoding='utf-8', errors='ignore') as f:
-                for line_num, line in enumerate(f, 1):
-                    if not line.strip():
-                        continue
-                    
-                    try:
-                        record = self.field_extractor.extract_land_detail_record(line.strip())
-                        if record and record.get('account_id') in property_account_ids:
-                            account_id = record['account_id']
-                            if account_id not in land_detail_records:
-                                land_detail_records[account_id] = []
-                            land_detail_records[account_id].append(record)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to parse land detail record at line {line_num}: {e}")
-                        continue
-            
+            for line_num, line in enumerate(self._iter_account_lines('land_details', property_account_ids), 1):
+                if not line.strip():
+                    continue
+                
+                try:
+                    record = self.field_extractor.extract_land_detail_record(line.strip())
+                    if record and record.get('account_id') in property_account_ids:
+                        account_id = record['account_id']
+                        if account_id not in land_detail_records:
+                            land_detail_records[account_id] = []
+                        land_detail_records[account_id].append(record)
+                except Exception as e:
+                    self.logger.warning(f"Failed to parse land detail record at line {line_num}: {e}")
+                    continue
+        
             self.console.print(f"[green]✅ Extracted {sum(len(records) for records in land_detail_records.values()):,} land detail records[/green]")
             
         except Exception as e:
@@ -1,5 +1,6 @@
 """Services package for county data processing."""
 
-from .mongodb_service import MongoDBService
+from .mongodb_service import MongoDBService, compute_content_hash
+from .async_mongodb_service import AsyncMongoDBService
 
-__all__ = ["MongoDBService"]
+__all__ = ["MongoDBService", "AsyncMongoDBService", "compute_content_hash"]
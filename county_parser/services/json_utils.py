@@ -0,0 +1,12 @@
+"""JSON serialization helpers for MongoDB documents."""
+
+from datetime import datetime
+from typing import Any
+
+
+def json_default(value: Any) -> str:
+    """Serialize datetimes as ISO 8601 and anything else (ObjectId, Decimal128) as str.
+
+    Pass as ``default=`` to json.dumps when writing property documents.
+    """
+    return value.isoformat() if isinstance(value, datetime) else str(value)
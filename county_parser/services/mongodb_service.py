@@ -1,16 +1,113 @@
 """MongoDB service for storing county property data."""
 
+import hashlib
 import json
+import queue
+import threading
 import uuid
+import zlib
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, DuplicateKeyError
+from pymongo.errors import BulkWriteError, ConnectionFailure, DuplicateKeyError
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 import os
 
+from .property_stats import (
+    STATS_PROJECTION, batch_stats_deltas, merge_stats_deltas, stats_deltas, stats_operations, summarize_stats
+)
+
+
+def compute_content_hash(record: Dict[str, Any]) -> str:
+    """Stable SHA-256 of a normalized property record, ignoring _id and storage metadata."""
+    content = {key: value for key, value in record.items() if key not in ('_id', 'metadata')}
+    payload = json.dumps(content, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def enhance_property(prop: Dict, batch_id: str, timestamp: datetime,
+                     source_files: Optional[List[str]], delta: bool = False) -> Dict:
+    """Copy a property record and attach its storage metadata."""
+    enhanced_prop = dict(prop)  # Copy the property data
+    enhanced_prop["metadata"] = {
+        "batch_id": batch_id,
+        "created_at": timestamp,
+        "updated_at": timestamp,
+        "source_files": source_files or [],
+        "version": "1.0",
+        "ingestion_type": "normalized_delta" if delta else "normalized_bulk",
+        "content_hash": compute_content_hash(prop)
+    }
+    return enhanced_prop
+
+
+def latest_per_account(batch: List[Dict]) -> List[Dict]:
+    """Keep only the last record of each account_id in a batch (repeated accounts replace earlier ones)."""
+    return list({prop["account_id"]: prop for prop in batch}.values())
+
+
+def writer_for_account(account_id: str, writers: int) -> int:
+    """The writer (0 to writers - 1) that saves an account, stable across runs."""
+    return zlib.crc32(str(account_id).encode('utf-8')) % writers
+
+
+def applied_operation_indexes(details: Dict[str, Any], count: int, ordered: bool) -> List[int]:
+    """Indexes of the operations a failed bulk write still applied, from BulkWriteError.details.
+    
+    An ordered bulk write stops at its first error; an unordered one only skips
+    the operations that failed.
+    """
+    failed = {error["index"] for error in details.get("writeErrors", [])}
+    if ordered and failed:
+        return list(range(min(failed)))
+    return [index for index in range(count) if index not in failed]
+
+
+def parse_write_concern(value: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Parse a write concern such as "majority", "1" or "w=1,j=false,wtimeout=5000".
+    
+    Returns keyword arguments for pymongo's WriteConcern, or None to keep the
+    client's default.
+    """
+    if not value:
+        return None
+    
+    def convert(option: str) -> Any:
+        if option.isdigit():
+            return int(option)
+        if option.lower() in ('true', 'false'):
+            return option.lower() == 'true'
+        return option
+    
+    if '=' not in value:
+        return {"w": convert(value.strip())}
+    
+    options = {}
+    for part in value.split(','):
+        key, _, option = part.partition('=')
+        options[key.strip()] = convert(option.strip())
+    return options
+
+
+def client_pool_options(bulk_writers: int = 1) -> Dict[str, Any]:
+    """Connection pool options for MongoClient/AsyncIOMotorClient.
+    
+    MONGO_MAX_POOL_SIZE, MONGO_MIN_POOL_SIZE, MONGO_MAX_IDLE_TIME_MS and
+    MONGO_SERVER_SELECTION_TIMEOUT_MS override the defaults. The default pool
+    leaves room for every concurrent bulk writer.
+    """
+    options = {"maxPoolSize": int(os.getenv('MONGO_MAX_POOL_SIZE', max(100, bulk_writers * 2)))}
+    
+    for option, variable in (("minPoolSize", 'MONGO_MIN_POOL_SIZE'),
+                             ("maxIdleTimeMS", 'MONGO_MAX_IDLE_TIME_MS'),
+                             ("serverSelectionTimeoutMS", 'MONGO_SERVER_SELECTION_TIMEOUT_MS')):
+        if value := os.getenv(variable):
+            options[option] = int(value)
+    
+    return options
+
 
 class MongoDBService:
     """Service for managing MongoDB operations for county data."""
@@ -26,16 +123,26 @@ class MongoDBService:
         )
         self.database_name = database or os.getenv('MONGO_DATABASE', 'county_data')
         
+        # Bulk-load tuning; each can also be passed to save_properties per call
+        self.bulk_batch_size = int(os.getenv('MONGO_BULK_BATCH_SIZE', '1000'))
+        self.bulk_ordered = os.getenv('MONGO_BULK_ORDERED', 'true').lower() == 'true'
+        self.bulk_writers = int(os.getenv('MONGO_BULK_WRITERS', '1'))
+        self.write_concern = parse_write_concern(os.getenv('MONGO_WRITE_CONCERN'))
+        
+        # Keep the per-county property_stats summary current as batches are written
+        self.maintain_stats = os.getenv('MONGO_MAINTAIN_STATS', 'true').lower() == 'true'
+        
         self.client = None
         self.database = None
         self.properties_collection = None
         self.logs_collection = None
+        self.stats_collection = None
         
     def connect(self) -> bool:
         """Connect to MongoDB."""
         try:
             self.console.print("[yellow]🔌 Connecting to MongoDB...[/yellow]")
-            self.client = MongoClient(self.mongo_uri)
+            self.client = MongoClient(self.mongo_uri, **client_pool_options(self.bulk_writers))
             
             # Test connection
             self.client.admin.command('ping')
@@ -43,6 +150,7 @@ class MongoDBService:
             self.database = self.client[self.database_name]
             self.properties_collection = self.database['properties']
             self.logs_collection = self.database['processing_logs']
+            self.stats_collection = self.database['property_stats']
             
             self.console.print("[green]✅ Connected to MongoDB successfully![/green]")
             return True
@@ -60,6 +168,16 @@ class MongoDBService:
             self.client.close()
             self.console.print("[blue]🔌 Disconnected from MongoDB[/blue]")
     
+    def ping(self) -> bool:
+        """Check that the server answers over the existing client and its pool."""
+        if self.client is None:
+            return False
+        try:
+            self.client.admin.command('ping')
+            return True
+        except Exception:
+            return False
+    
     def create_processing_log(self, batch_id: str, total_properties: int, source_files: List[str]) -> str:
         """Create a processing log entry."""
         log_entry = {
@@ -80,7 +198,7 @@ class MongoDBService:
         return str(result.inserted_id)
     
     def update_processing_log(self, batch_id: str, status: str, processed_count: int = None, 
-                            error_message: str = None):
+                            error_message: str = None, total_properties: int = None):
         """Update processing log status."""
         update_data = {
             "status": status,
@@ -89,6 +207,9 @@ class MongoDBService:
         
         if processed_count is not None:
             update_data["processed_properties"] = processed_count
+        
+        if total_properties is not None:
+            update_data["total_properties"] = total_properties
             
         if error_message:
             update_data["error_message"] = error_message
@@ -102,30 +223,43 @@ class MongoDBService:
         )
     
     def save_properties(self, properties_data: List[Dict], batch_id: str = None, 
-                       source_files: List[str] = None) -> Dict[str, Any]:
-        """Save property data to MongoDB with proper timestamping."""
+                       source_files: List[str] = None, delta: bool = False,
+                       batch_size: Optional[int] = None, ordered: Optional[bool] = None,
+                       writers: Optional[int] = None,
+                       write_concern: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Save property data to MongoDB with proper timestamping.
+        
+        Each record is stored with a metadata.content_hash of its normalized fields.
+        With delta set, records whose hash matches the stored one are skipped, so
+        reloading a mostly unchanged roll only writes new and changed accounts.
+        
+        batch_size, ordered, writers and write_concern default to the
+        MONGO_BULK_BATCH_SIZE, MONGO_BULK_ORDERED, MONGO_BULK_WRITERS and
+        MONGO_WRITE_CONCERN settings. With more than one writer the batches are
+        sent concurrently over separate pooled connections (see save_properties_stream).
+        """
         
         if self.database is None:
             raise Exception("Not connected to MongoDB")
         
+        batch_size = batch_size or self.bulk_batch_size
+        writers = writers or self.bulk_writers
+        if writers > 1:
+            return self.save_properties_stream(
+                properties_data, batch_id=batch_id, source_files=source_files, delta=delta,
+                batch_size=batch_size, writers=writers, ordered=ordered, write_concern=write_concern
+            )
+        
         if not batch_id:
             batch_id = f"batch_{uuid.uuid4().hex[:8]}"
         
         timestamp = datetime.now(timezone.utc)
         
         # Add metadata to each property record
-        enhanced_properties = []
-        for prop in properties_data:
-            enhanced_prop = dict(prop)  # Copy the property data
-            enhanced_prop["metadata"] = {
-                "batch_id": batch_id,
-                "created_at": timestamp,
-                "updated_at": timestamp,
-                "source_files": source_files or [],
-                "version": "1.0",
-                "ingestion_type": "normalized_bulk"
-            }
-            enhanced_properties.append(enhanced_prop)
+        enhanced_properties = [
+            enhance_property(prop, batch_id, timestamp, source_files, delta)
+            for prop in properties_data
+        ]
         
         # Create processing log
         log_id = self.create_processing_log(batch_id, len(enhanced_properties), source_files or [])
@@ -133,6 +267,7 @@ class MongoDBService:
         # Save properties with progress tracking
         saved_count = 0
         duplicate_count = 0
+        unchanged_count = 0
         error_count = 0
         
         with Progress(
@@ -147,31 +282,16 @@ class MongoDBService:
             )
             
             try:
-                # Use bulk operations for efficiency
-                from pymongo import ReplaceOne
+                collection = self._bulk_collection(write_concern)
                 
-                operations = []
-                for prop in enhanced_properties:
-                    operations.append(
-                        ReplaceOne(
-                            {"account_id": prop["account_id"]},
-                            prop,
-                            upsert=True
-                        )
-                    )
+                for start in range(0, len(enhanced_properties), batch_size):
+                    batch = enhanced_properties[start:start + batch_size]
                     
-                    # Execute in batches of 1000
-                    if len(operations) >= 1000:
-                        result = self.properties_collection.bulk_write(operations)
-                        saved_count += result.upserted_count + result.modified_count
-                        operations = []
-                        progress.update(task, advance=1000)
-                
-                # Execute remaining operations
-                if operations:
-                    result = self.properties_collection.bulk_write(operations)
-                    saved_count += result.upserted_count + result.modified_count
-                    progress.update(task, advance=len(operations))
+                    batch_saved, batch_unchanged = self._write_batch(batch, delta, ordered, collection)
+                    saved_count += batch_saved
+                    unchanged_count += batch_unchanged
+                    
+                    progress.update(task, advance=len(batch))
                 
                 # Update processing log
                 self.update_processing_log(batch_id, "completed", saved_count)
@@ -179,7 +299,7 @@ class MongoDBService:
                 progress.update(task, description="[green]✅ Properties saved successfully!")
                 
             except Exception as e:
-                error_count = len(enhanced_properties) - saved_count
+                error_count = len(enhanced_properties) - saved_count - unchanged_count
                 self.update_processing_log(batch_id, "failed", saved_count, str(e))
                 raise Exception(f"Failed to save properties: {e}")
         
@@ -187,6 +307,7 @@ class MongoDBService:
             "batch_id": batch_id,
             "saved_count": saved_count,
             "duplicate_count": duplicate_count,
+            "unchanged_count": unchanged_count,
             "error_count": error_count,
             "total_count": len(enhanced_properties),
             "timestamp": timestamp.isoformat(),
@@ -194,10 +315,253 @@ class MongoDBService:
         }
         
         self.console.print(f"[green]🎉 Successfully saved {saved_count:,} properties to MongoDB![/green]")
+        if delta:
+            self.console.print(f"[blue]⏭️ Skipped {unchanged_count:,} unchanged properties[/blue]")
         self.console.print(f"[blue]📊 Batch ID: {batch_id}[/blue]")
         
         return result
     
+    def save_properties_stream(self, properties: Iterable[Dict], batch_id: str = None,
+                               source_files: List[str] = None, delta: bool = False,
+                               batch_size: Optional[int] = None, writers: int = 4,
+                               max_pending_batches: Optional[int] = None, ordered: Optional[bool] = None,
+                               write_concern: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Save properties as a parser yields them, overlapping parsing with writing.
+        
+        The calling thread consumes the iterable and hands batches of batch_size
+        records to a pool of writer threads through bounded queues, one per writer.
+        Each record goes to the writer chosen by writer_for_account, so all
+        versions of an account are written in order by one thread and no two
+        in-flight batches share an account; that keeps the delta comparison and
+        the property_stats deltas based on what is really stored. When a writer
+        falls behind its queue fills up and the producer blocks, so at most
+        max_pending_batches (default 2 per writer) full batches are queued
+        regardless of how many records the iterable produces. Each writer thread
+        checks out its own connection from the client pool. Returns the same
+        summary as save_properties.
+        """
+        
+        if self.database is None:
+            raise Exception("Not connected to MongoDB")
+        
+        batch_size = batch_size or self.bulk_batch_size
+        collection = self._bulk_collection(write_concern)
+        
+        if not batch_id:
+            batch_id = f"batch_{uuid.uuid4().hex[:8]}"
+        
+        timestamp = datetime.now(timezone.utc)
+        log_id = self.create_processing_log(batch_id, 0, source_files or [])
+        
+        queue_size = max(1, (max_pending_batches or writers * 2) // writers)
+        pending = [queue.Queue(maxsize=queue_size) for _ in range(writers)]
+        counts_lock = threading.Lock()
+        counts = {"saved": 0, "unchanged": 0, "written": 0}
+        errors = []
+        
+        def write_batches(batches: queue.Queue):
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    return
+                if errors:
+                    continue  # Drain remaining batches so the producer never blocks
+                try:
+                    batch_saved, batch_unchanged = self._write_batch(batch, delta, ordered, collection)
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                with counts_lock:
+                    counts["saved"] += batch_saved
+                    counts["unchanged"] += batch_unchanged
+                    counts["written"] += len(batch)
+        
+        writer_threads = [threading.Thread(target=write_batches, args=(batches,), daemon=True) for batches in pending]
+        for thread in writer_threads:
+            thread.start()
+        
+        total_count = 0
+        self.console.print(f"[cyan]💾 Streaming properties to MongoDB ({writers} writers, batches of {batch_size:,})...[/cyan]")
+        
+        try:
+            try:
+                batches = [[] for _ in range(writers)]
+                for prop in properties:
+                    writer = writer_for_account(prop["account_id"], writers)
+                    batches[writer].append(enhance_property(prop, batch_id, timestamp, source_files, delta))
+                    total_count += 1
+                    if len(batches[writer]) >= batch_size:
+                        pending[writer].put(batches[writer])
+                        batches[writer] = []
+                    if errors:
+                        break
+                for writer, batch in enumerate(batches):
+                    if batch and not errors:
+                        pending[writer].put(batch)
+            finally:
+                for batches in pending:
+                    batches.put(None)
+                for thread in writer_threads:
+                    thread.join()
+        except Exception as e:
+            # The producer (usually a parser generator) failed; record it once the writers have stopped
+            self.update_processing_log(batch_id, "failed", counts["saved"], str(e), total_properties=total_count)
+            raise
+        
+        saved_count = counts["saved"]
+        unchanged_count = counts["unchanged"]
+        
+        if errors:
+            self.update_processing_log(batch_id, "failed", saved_count, str(errors[0]), total_properties=total_count)
+            raise Exception(f"Failed to save properties: {errors[0]}")
+        
+        self.update_processing_log(batch_id, "completed", saved_count, total_properties=total_count)
+        
+        result = {
+            "batch_id": batch_id,
+            "saved_count": saved_count,
+            "duplicate_count": 0,
+            "unchanged_count": unchanged_count,
+            "error_count": total_count - counts["written"],
+            "total_count": total_count,
+            "timestamp": timestamp.isoformat(),
+            "log_id": log_id
+        }
+        
+        self.console.print(f"[green]🎉 Successfully saved {saved_count:,} properties to MongoDB![/green]")
+        if delta:
+            self.console.print(f"[blue]⏭️ Skipped {unchanged_count:,} unchanged properties[/blue]")
+        self.console.print(f"[blue]📊 Batch ID: {batch_id}[/blue]")
+        
+        return result
+    
+    def _bulk_collection(self, write_concern: Optional[Dict[str, Any]] = None):
+        """The properties collection with the bulk-load write concern applied, if any."""
+        write_concern = write_concern or self.write_concern
+        if not write_concern:
+            return self.properties_collection
+        
+        from pymongo import WriteConcern
+        return self.properties_collection.with_options(write_concern=WriteConcern(**write_concern))
+    
+    def _write_batch(self, batch: List[Dict], delta: bool = False, ordered: Optional[bool] = None,
+                     collection=None) -> Tuple[int, int]:
+        """Upsert one batch of enhanced properties; returns (saved, unchanged) counts.
+        
+        Unordered batches let the server apply the upserts in parallel and keep
+        going past individual failures. A repeated account is written once, with
+        its last record. The stored versions of the batch's accounts are read
+        once, both for the delta comparison and to move their old values out of
+        the property_stats summary; if the bulk write fails part way, the stats
+        still follow the upserts that were applied.
+        """
+        from pymongo import ReplaceOne
+        
+        collection = collection if collection is not None else self.properties_collection
+        ordered = self.bulk_ordered if ordered is None else ordered
+        track_stats = self._tracks_stats()
+        batch = latest_per_account(batch)
+        
+        stored = {}
+        if delta or track_stats:
+            stored = self._stored_documents([prop["account_id"] for prop in batch], track_stats)
+        
+        unchanged_count = 0
+        if delta:
+            changed = [
+                prop for prop in batch
+                if stored.get(prop["account_id"], {}).get("metadata", {}).get("content_hash")
+                != prop["metadata"]["content_hash"]
+            ]
+            unchanged_count = len(batch) - len(changed)
+            batch = changed
+        
+        if not batch:
+            return 0, unchanged_count
+        
+        operations = [ReplaceOne({"account_id": prop["account_id"]}, prop, upsert=True) for prop in batch]
+        try:
+            result = collection.bulk_write(operations, ordered=ordered)
+        except BulkWriteError as e:
+            if track_stats:
+                applied = [batch[index] for index in applied_operation_indexes(e.details, len(batch), ordered)]
+                self._apply_stats_deltas(batch_stats_deltas(stored, applied))
+            raise
+        
+        if track_stats:
+            self._apply_stats_deltas(batch_stats_deltas(stored, batch))
+        
+        if not result.acknowledged:
+            # Unacknowledged (w=0) writes report no counts
+            return len(operations), unchanged_count
+        return result.upserted_count + result.modified_count, unchanged_count
+    
+    def _tracks_stats(self) -> bool:
+        return self.maintain_stats and self.stats_collection is not None
+    
+    
+    def _stored_documents(self, account_ids: List[str], with_stats: bool = False) -> Dict[str, Dict]:
+        """Look up the stored content hash (and stats fields) of each given account that exists."""
+        projection = {"_id": 0, "account_id": 1, "metadata.content_hash": 1}
+        if with_stats:
+            projection.update(STATS_PROJECTION)
+        
+        cursor = self.properties_collection.find({"account_id": {"$in": account_ids}}, projection)
+        return {doc["account_id"]: doc for doc in cursor}
+    
+    def _apply_stats_deltas(self, deltas: Dict[str, Dict[str, Any]]):
+        """Apply per-county stats changes; $inc keeps concurrent writers consistent."""
+        operations = stats_operations(deltas)
+        if operations:
+            self.stats_collection.bulk_write(operations, ordered=False)
+    
+    def get_property_stats(self) -> Dict[str, Any]:
+        """Per-county counts and the value distribution from the property_stats summary.
+        
+        Builds the summary first if it has never been built (e.g. for data
+        loaded before it existed).
+        """
+        if self.database is None:
+            return {}
+        
+        stats_documents = list(self.stats_collection.find({}))
+        if not stats_documents and self.properties_collection.estimated_document_count():
+            self.rebuild_property_stats()
+            stats_documents = list(self.stats_collection.find({}))
+        
+        summary = summarize_stats(stats_documents)
+        updated = [doc["updated_at"] for doc in stats_documents if doc.get("updated_at")]
+        summary["last_updated"] = max(updated).isoformat() if updated else None
+        summary["logs_count"] = self.logs_collection.estimated_document_count()
+        return summary
+    
+    def rebuild_property_stats(self, batch_size: int = 10000) -> int:
+        """Recompute the property_stats summary from a full scan of the properties collection.
+        
+        Incremental updates never shrink min/max, so a rebuild also tightens
+        those after extreme values were replaced. Returns the number of counties.
+        """
+        if self.database is None:
+            raise Exception("Not connected to MongoDB")
+        
+        self.console.print("[yellow]📊 Rebuilding property statistics...[/yellow]")
+        
+        deltas = {}
+        batch = []
+        cursor = self.properties_collection.find({}, STATS_PROJECTION).batch_size(batch_size)
+        for doc in cursor:
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                merge_stats_deltas(deltas, stats_deltas([], batch))
+                batch = []
+        merge_stats_deltas(deltas, stats_deltas([], batch))
+        
+        self.stats_collection.delete_many({})
+        self._apply_stats_deltas(deltas)
+        
+        self.console.print(f"[green]✅ Rebuilt statistics for {len(deltas)} counties[/green]")
+        return len(deltas)
+    
     def get_collection_stats(self) -> Dict[str, Any]:
         """Get collection statistics."""
         if self.database is None:
@@ -223,13 +587,32 @@ class MongoDBService:
             "database_name": self.database_name
         }
     
-    def query_properties(self, filter_query: Dict = None, limit: int = 100) -> List[Dict]:
-        """Query properties with optional filters."""
+    def query_properties(self, filter_query: Dict = None, limit: int = 100, projection: Dict = None,
+                         sort: List[Tuple[str, int]] = None) -> List[Dict]:
+        """Query properties with optional filters, field projection and sort order."""
+        if self.database is None:
+            return []
+        
+        cursor = self.properties_collection.find(filter_query or {}, projection)
+        if sort:
+            cursor = cursor.sort(sort)
+        return list(cursor.limit(limit))
+    
+    def iter_properties(self, filter_query: Dict = None, batch_size: int = 1000, projection: Dict = None,
+                        limit: int = 0) -> Iterator[Dict]:
+        """Stream matching properties from the cursor in account_id order."""
+        if self.database is None:
+            return
+        
+        cursor = self.properties_collection.find(filter_query or {}, projection).sort([("account_id", 1)])
+        yield from cursor.limit(limit).batch_size(batch_size)
+    
+    def aggregate(self, pipeline: List[Dict]) -> List[Dict]:
+        """Run an aggregation pipeline on the properties collection."""
         if self.database is None:
             return []
         
-        cursor = self.properties_collection.find(filter_query or {}).limit(limit)
-        return list(cursor)
+        return list(self.properties_collection.aggregate(pipeline))
     
     def create_backup(self, backup_path: Path):
         """Create a JSON backup of the current data."""
@@ -263,3 +646,4 @@ class MongoDBService:
         
         self.console.print(f"[green]✅ Backup created: {backup_path}[/green]")
         return backup_path
+
@@ -0,0 +1,195 @@
+"""Materialized per-county property statistics maintained at ingest time.
+
+Each county has one summary document in the ``property_stats`` collection with
+its property count and a distribution of effective market values: count, sum,
+min, max and a log-scale histogram from which percentiles are estimated. Writers
+apply the difference between a batch's old and new documents with ``$inc``,
+so the summary stays current without rescanning the properties collection.
+"""
+
+import math
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+# Plausible market values; anything outside is treated as a parsing error
+MIN_VALUE = 0
+MAX_VALUE = 100_000_000
+
+# Histogram buckets per power of ten (each bucket spans about 12%)
+BUCKETS_PER_DECADE = 20
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+# Fields read from a stored document to back out its old contribution
+STATS_PROJECTION = {
+    "_id": 0,
+    "account_id": 1,
+    "county": 1,
+    "valuation.market_value": 1,
+    "valuation.total_market_value": 1,
+    "valuation.assessed_value": 1,
+}
+
+
+def effective_market_value(record: Dict[str, Any]) -> Optional[float]:
+    """The first plausible of market_value, total_market_value and assessed_value.
+
+    Mirrors the order the dashboard has always used for its value statistics.
+    """
+    valuation = record.get("valuation") or {}
+    for field in ("market_value", "total_market_value", "assessed_value"):
+        value = valuation.get(field)
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and MIN_VALUE < value < MAX_VALUE:
+            return float(value)
+    return None
+
+
+def value_bucket(value: float) -> int:
+    """Log-scale histogram bucket of a positive value."""
+    return math.floor(math.log10(value) * BUCKETS_PER_DECADE)
+
+
+def bucket_midpoint(bucket: int) -> float:
+    """Geometric midpoint of a histogram bucket."""
+    return 10 ** ((bucket + 0.5) / BUCKETS_PER_DECADE)
+
+
+def stats_deltas(old_documents: Iterable[Dict], new_documents: Iterable[Dict]) -> Dict[str, Dict[str, Any]]:
+    """Per-county counter changes from replacing old_documents with new_documents.
+
+    Returns ``{county: {"inc": {field: delta}, "min": value, "max": value}}``,
+    ready to turn into updates with stats_operations.
+    """
+    deltas = defaultdict(lambda: {"inc": defaultdict(int), "min": None, "max": None})
+
+    def add(document: Dict, sign: int):
+        county = document.get("county") or "unknown"
+        inc = deltas[county]["inc"]
+        inc["properties_count"] += sign
+
+        value = effective_market_value(document)
+        if value is None:
+            return
+        inc["valued_count"] += sign
+        inc["value_sum"] += sign * value
+        inc[f"histogram.{value_bucket(value)}"] += sign
+
+        if sign > 0:
+            current = deltas[county]
+            current["min"] = value if current["min"] is None else min(current["min"], value)
+            current["max"] = value if current["max"] is None else max(current["max"], value)
+
+    for document in old_documents:
+        add(document, -1)
+    for document in new_documents:
+        add(document, 1)
+
+    return {
+        county: {
+            "inc": {field: delta for field, delta in change["inc"].items() if delta},
+            "min": change["min"],
+            "max": change["max"],
+        }
+        for county, change in deltas.items()
+    }
+
+
+def batch_stats_deltas(stored: Dict[str, Dict], batch: List[Dict]) -> Dict[str, Dict[str, Any]]:
+    """stats_deltas for upserting batch over the stored documents keyed by account_id."""
+    old_documents = [stored[document["account_id"]] for document in batch if document["account_id"] in stored]
+    return stats_deltas(old_documents, batch)
+
+
+def merge_stats_deltas(target: Dict[str, Dict[str, Any]], deltas: Dict[str, Dict[str, Any]]):
+    """Fold one batch's stats_deltas into a running total."""
+    for county, change in deltas.items():
+        if county not in target:
+            target[county] = {"inc": dict(change["inc"]), "min": change["min"], "max": change["max"]}
+            continue
+        current = target[county]
+        for field, delta in change["inc"].items():
+            current["inc"][field] = current["inc"].get(field, 0) + delta
+        if change["min"] is not None:
+            current["min"] = change["min"] if current["min"] is None else min(current["min"], change["min"])
+            current["max"] = change["max"] if current["max"] is None else max(current["max"], change["max"])
+
+
+def stats_operations(deltas: Dict[str, Dict[str, Any]]) -> List:
+    """UpdateOne upserts that apply stats_deltas to the summary collection.
+
+    min and max only ever widen; rebuild the summary to tighten them after
+    extreme values are removed.
+    """
+    from pymongo import UpdateOne
+
+    timestamp = datetime.now(timezone.utc)
+    operations = []
+
+    for county, change in deltas.items():
+        update = {"$set": {"county": county, "updated_at": timestamp}}
+        if change["inc"]:
+            update["$inc"] = change["inc"]
+        if change["min"] is not None:
+            update["$min"] = {"value_min": change["min"]}
+            update["$max"] = {"value_max": change["max"]}
+        operations.append(UpdateOne({"_id": county}, update, upsert=True))
+
+    return operations
+
+
+def summarize_stats(stats_documents: Iterable[Dict]) -> Dict[str, Any]:
+    """Combine per-county summary documents into the /api/stats payload fields."""
+    counties = []
+    histogram = defaultdict(int)
+    total = valued = 0
+    value_sum = 0.0
+    value_min = value_max = None
+
+    for document in stats_documents:
+        count = int(document.get("properties_count", 0))
+        if count <= 0:
+            continue
+        counties.append({"_id": document["county"], "count": count})
+        total += count
+        valued += int(document.get("valued_count", 0))
+        value_sum += document.get("value_sum", 0.0)
+
+        if document.get("value_min") is not None:
+            value_min = document["value_min"] if value_min is None else min(value_min, document["value_min"])
+            value_max = document["value_max"] if value_max is None else max(value_max, document["value_max"])
+
+        for bucket, bucket_count in (document.get("histogram") or {}).items():
+            histogram[int(bucket)] += int(bucket_count)
+
+    counties.sort(key=lambda county: county["count"], reverse=True)
+
+    values = {
+        "avg_value": value_sum / valued if valued else 0,
+        "min_value": value_min or 0,
+        "max_value": value_max or 0,
+        "count": valued,
+        "percentiles": estimate_percentiles(histogram),
+    }
+
+    return {"total_properties": total, "counties": counties, "values": values}
+
+
+def estimate_percentiles(histogram: Dict[int, int]) -> Dict[str, float]:
+    """Estimate PERCENTILES from a value histogram (accurate to one bucket)."""
+    total = sum(count for count in histogram.values() if count > 0)
+    if not total:
+        return {}
+
+    percentiles = {}
+    running = 0
+    targets = iter(PERCENTILES)
+    target = next(targets)
+
+    for bucket in sorted(histogram):
+        running += max(histogram[bucket], 0)
+        while target is not None and running >= total * target / 100:
+            percentiles[f"p{target}"] = round(bucket_midpoint(bucket), 2)
+            target = next(targets, None)
+
+    return percentiles
@@ -0,0 +1,171 @@
+"""
+Tests for joining the Dallas CAD related files onto ACCOUNT_INFO.
+
+Writes small synthetic DCAD CSV exports so the join stages can be checked
+without the real appraisal roll.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from county_parser.models.config import Config
+from county_parser.parsers.dallas_parser import (
+    AccountIndex,
+    DallasCountyNormalizer,
+    normalize_dallas_account_id,
+    normalize_dallas_account_ids,
+)
+
+ACCOUNT_INFO = [
+    {"ACCOUNT_NUM": "00000100000000001", "OWNER_NAME1": "SMITH JOHN", "DIVISION_CD": "RES",
+     "PROPERTY_CITY": "DALLAS", "PROPERTY_ZIPCODE": "75201", "STREET_NUM": "100", "FULL_STREET_NAME": "MAIN ST"},
+    {"ACCOUNT_NUM": "100000000002", "OWNER_NAME1": "ACME LLC", "DIVISION_CD": "COM",
+     "PROPERTY_CITY": "DALLAS", "PROPERTY_ZIPCODE": "75202", "STREET_NUM": "200", "FULL_STREET_NAME": "ELM ST"},
+    {"ACCOUNT_NUM": "00000100000000003", "OWNER_NAME1": "DOE JANE", "DIVISION_CD": "RES",
+     "PROPERTY_CITY": "IRVING", "PROPERTY_ZIPCODE": "75038", "STREET_NUM": "300", "FULL_STREET_NAME": "OAK AVE"},
+]
+
+RELATED_FILES = {
+    "ACCOUNT_APPRL_YEAR.CSV": [
+        {"ACCOUNT_NUM": "00000100000000003", "TOT_VAL": "300000", "LAND_VAL": "100000"},
+        {"ACCOUNT_NUM": "00000100000000001", "TOT_VAL": "250000", "LAND_VAL": "50000"},
+        {"ACCOUNT_NUM": "00000100000000001", "TOT_VAL": "1", "LAND_VAL": "1"},
+    ],
+    "MULTI_OWNER.CSV": [
+        {"ACCOUNT_NUM": "00000100000000001", "OWNER_NAME": "SMITH MARY", "OWNERSHIP_PCT": "25"},
+        {"ACCOUNT_NUM": "00000100000000003", "OWNER_NAME": "DOE JOHN", "OWNERSHIP_PCT": "50"},
+        {"ACCOUNT_NUM": "00000100000000001", "OWNER_NAME": "SMITH JR", "OWNERSHIP_PCT": "25"},
+    ],
+    "RES_DETAIL.CSV": [
+        {"ACCOUNT_NUM": "00000100000000001", "YR_BUILT": "1995", "TOT_LIVING_AREA_SF": "2100"},
+        {"ACCOUNT_NUM": "00000100000000003", "YR_BUILT": "2010", "TOT_LIVING_AREA_SF": "1800"},
+    ],
+    "COM_DETAIL.CSV": [
+        {"ACCOUNT_NUM": "00000100000000002", "GROSS_BLDG_AREA": "50000", "PROPERTY_NAME": "ACME TOWER"},
+    ],
+    "LAND.CSV": [
+        {"ACCOUNT_NUM": "00000100000000002", "ZONING": "CA-1", "AREA_SIZE": "12000.5"},
+        {"ACCOUNT_NUM": "00000100000000001", "ZONING": "R-7.5", "AREA_SIZE": "7500"},
+    ],
+}
+
+
+@pytest.fixture
+def dallas_dir(tmp_path: Path) -> Path:
+    pd.DataFrame(ACCOUNT_INFO).to_csv(tmp_path / "ACCOUNT_INFO.CSV", index=False)
+    for file_name, rows in RELATED_FILES.items():
+        pd.DataFrame(rows).to_csv(tmp_path / file_name, index=False)
+    return tmp_path
+
+
+@pytest.fixture
+def normalizer(dallas_dir: Path) -> DallasCountyNormalizer:
+    normalizer = DallasCountyNormalizer(Config())
+    normalizer.files = {name: dallas_dir / path.name for name, path in normalizer.files.items()}
+    return normalizer
+
+
+def test_account_index_keeps_file_order():
+    df = pd.DataFrame({"account_id_norm": ["b", "a", "b"], "value": [1, 2, 3]})
+    index = AccountIndex(df)
+
+    assert len(index) == 2
+    assert index.first("b")["value"] == 1
+    assert [row["value"] for row in index.records("b")] == [1, 3]
+    assert index.first("missing") is None
+    assert index.records("missing") == []
+    assert AccountIndex(None).first("a") is None
+
+
+def test_sample_joins_related_files_by_account(normalizer):
+    records = {record["account_id"]: record for record in normalizer.load_and_normalize_sample(10)}
+
+    assert list(records) == ["00000100000000001", "00000100000000002", "00000100000000003"]
+
+    smith = records["00000100000000001"]
+    assert smith["valuation"]["total_value"] == 250000
+    assert [owner["name"] for owner in smith["owners"]] == ["SMITH JOHN", "SMITH MARY", "SMITH JR"]
+    assert smith["owners"][0]["percentage"] == 50.0
+    assert smith["property_details"]["year_built"] == 1995
+    assert smith["property_details"]["zoning"] == "R-7.5"
+
+    acme = records["00000100000000002"]
+    assert acme["valuation"] == {}
+    assert acme["property_details"]["commercial_area_sf"] == 50000
+    assert acme["property_details"]["land_area_sf"] == 12000.5
+
+    assert records["00000100000000003"]["valuation"]["total_value"] == 300000
+
+
+@pytest.mark.parametrize("num_partitions", [1, 3])
+def test_full_roll_matches_sample(normalizer, tmp_path, num_partitions):
+    normalizer.config.output_dir = tmp_path / "output"
+    normalizer.config.parsing.chunk_size = 2
+    sample = normalizer.load_and_normalize_sample(10)
+
+    full_roll = list(normalizer.normalize_full_roll(num_partitions=num_partitions))
+
+    by_account = lambda records: sorted(records, key=lambda record: record["account_id"])
+    assert by_account(full_roll) == by_account(sample)
+    # Partition files are cleaned up once the generator finishes
+    assert list((tmp_path / "output").iterdir()) == []
+
+
+def test_vectorized_account_ids_match_scalar_normalization():
+    raw = pd.Series(["38075500070120000", "1000-0000-0002", " 42 ", "", None, "ABC", "123456789012345678"])
+
+    expected = [normalize_dallas_account_id(value) for value in raw]
+
+    assert normalize_dallas_account_ids(raw).tolist() == expected
+
+
+def test_persisted_account_keys_are_reused(normalizer, tmp_path):
+    normalizer.config.output_dir = tmp_path / "output"
+    normalizer.config.parsing.persist_account_keys = True
+
+    first = normalizer.load_and_normalize_sample(10)
+    keys_dir = tmp_path / "output" / "dallas_keys"
+    cached = sorted(path.name.split("_")[0] for path in keys_dir.glob("*.parquet"))
+    second = normalizer.load_and_normalize_sample(10)
+
+    assert cached == ["ACCOUNT", "ACCOUNT", "COM", "LAND", "MULTI", "RES"]
+    assert second == first
+    assert [record["account_id"] for record in first] == [
+        "00000100000000001", "00000100000000002", "00000100000000003"
+    ]
+
+
+def test_account_index_reads_only_matching_rows(normalizer, dallas_dir, tmp_path):
+    normalizer.config.output_dir = tmp_path / "output"
+    # A quoted line break must stay inside its row
+    owners = pd.DataFrame(RELATED_FILES["MULTI_OWNER.CSV"])
+    owners.loc[1, "OWNER_NAME"] = "DOE\nJOHN"
+    owners.to_csv(dallas_dir / "MULTI_OWNER.CSV", index=False)
+    scanned = normalizer.load_and_normalize_sample(10)
+
+    for name in normalizer.RELATED_FILES:
+        assert normalizer.build_account_index(normalizer.files[name]).exists()
+
+    index = pd.read_parquet(normalizer._account_index_path(normalizer.files["multi_owner"]))
+    assert index["account_id_norm"].tolist() == sorted(index["account_id_norm"])
+
+    rows = normalizer._load_indexed_rows(normalizer.files["multi_owner"], {"00000100000000003"})
+    assert rows["OWNER_NAME"].tolist() == ["DOE\nJOHN"]
+    assert normalizer.load_and_normalize_sample(10) == scanned
+
+
+def test_staged_parquet_matches_csv(normalizer, tmp_path):
+    normalizer.config.output_dir = tmp_path / "output"
+    csv_records = normalizer.load_and_normalize_sample(10)
+
+    normalizer.config.parsing.stage_parquet = True
+    staged_roll = list(normalizer.normalize_full_roll(num_partitions=2))
+    staged = sorted(path.name.split(".")[0] for path in (tmp_path / "output" / "staging").glob("*.parquet"))
+    staged_records = normalizer.load_and_normalize_sample(10)
+
+    assert staged == ["ACCOUNT_APPRL_YEAR", "ACCOUNT_INFO", "COM_DETAIL", "LAND", "MULTI_OWNER", "RES_DETAIL"]
+    assert staged_records == csv_records
+    by_account = lambda records: sorted(records, key=lambda record: record["account_id"])
+    assert by_account(staged_roll) == by_account(csv_records)
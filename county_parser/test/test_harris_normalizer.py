@@ -0,0 +1,189 @@
+"""
+Tests for the Harris County normalizer.
+
+Uses small in-memory frames shaped like the HCAD exports so the row-wise and
+columnar normalization paths can be compared without the real files.
+"""
+
+import polars as pl
+import pytest
+
+from county_parser.models.config import Config
+from county_parser.parsers.harris_parser import HarrisCountyNormalizer, harris_account_id_expr
+from county_parser.utils.file_utils import file_fingerprint
+
+
+@pytest.fixture
+def normalizer(tmp_path) -> HarrisCountyNormalizer:
+    return HarrisCountyNormalizer(Config(data_dir=tmp_path, output_dir=tmp_path / "output"))
+
+
+@pytest.fixture
+def harris_frames():
+    real_accounts = pl.DataFrame({
+        "acct": ["0010010000001", "10010000002", "0010010000003"],
+        "yr": ["2025", "2025", "2025"],
+        "site_addr_1": ["100 MAIN ST", "200 ELM ST", "300 OAK AVE"],
+        "site_addr_2": ["HOUSTON", "", "KATY"],
+        "school_dist": ["1", None, "2"],
+        "jurs": ["040, 048", None, ""],
+        "Market_Area_1": ["100", "200", None],
+        "bld_ar": ["2000", None, "1500"],
+        "tot_mkt_val": ["250000", "100000", "300000"],
+        "prior_tot_mkt_val": ["200000", "0", None],
+    })
+    owners = pl.DataFrame({
+        "acct": ["10010000001", "0010010000003", "0010010000001"],
+        "ln_num": [1, 1, 2],
+        "name": ["SMITH JOHN", "DOE JANE", "SMITH MARY"],
+        "pct_own": ["50", "100", "50"],
+    })
+    deeds = pl.DataFrame({
+        "acct": ["10010000002"],
+        "dos": ["2020-01-15"],
+        "clerk_yr": ["2020"],
+        "clerk_id": ["RP-1"],
+        "deed_id": ["1"],
+    })
+    permits = pl.DataFrame({
+        "acct": ["0010010000001"],
+        "id": ["P1"],
+        "status": ["FINAL"],
+        "site_num": ["100"],
+        "site_str": ["MAIN"],
+    })
+    tieback = pl.DataFrame({
+        "acct": ["10010000003"],
+        "tp": ["P"],
+        "related_acct": ["0010010000001"],
+        "pct": ["1.0"],
+    })
+    neighborhood = pl.DataFrame({
+        "cd": ["100", "100", "200"],
+        "grp_cd": ["A", "B", "C"],
+        "dscr": ["OLD", "DOWNTOWN", "MIDTOWN"],
+    })
+    mineral = pl.DataFrame({
+        "acct": ["0010010000002", "10010000002"],
+        "dor_cd": ["X", "Y"],
+        "Interest_Percent": ["0.5", "0.25"],
+    })
+    return real_accounts, owners, deeds, permits, tieback, neighborhood, mineral
+
+
+def test_account_id_expression_matches_row_normalization():
+    frame = pl.DataFrame({"acct": [" 10010000001 ", "001-001-0000-002", None, "123"]})
+
+    normalized = frame.select(harris_account_id_expr("acct")).to_series().to_list()
+
+    assert normalized == ["0010010000001", "0010010000002", "0000000000000", "0000000000123"]
+
+
+def test_columnar_normalization_matches_row_wise(normalizer, harris_frames):
+    expected = normalizer._create_json_normalized_data(*harris_frames)
+
+    frame = normalizer._create_columnar_normalized_data(*harris_frames)
+    records = normalizer._records_from_columnar(frame)
+
+    assert records == expected
+    assert frame.schema["owners"] == pl.List(pl.Struct({
+        "line_number": pl.Int64, "name": pl.Utf8, "aka": pl.Null, "ownership_percentage": pl.Utf8
+    }))
+    assert [owner["name"] for owner in records[0]["owners"]] == ["SMITH JOHN", "SMITH MARY"]
+    assert records[0]["neighborhood"] == {"group_code": "B", "description": "DOWNTOWN"}
+    assert records[1]["mineral_rights"]["dor_code"] == "Y"
+    assert "owners" not in records[1]
+
+
+def write_tsv(path, rows):
+    path.write_text("\n".join("\t".join(row) for row in rows) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def harris_dir(tmp_path):
+    write_tsv(tmp_path / "real_acct.txt", [
+        ["acct", "yr", "site_addr_1", "site_addr_2", "Market_Area_1", "tot_mkt_val"],
+        ["0010010000001", "2025", "100 MAIN ST", "HOUSTON", "100", "250000"],
+        ["0010010000002", "2025", "200 ELM ST", "HOUSTON", "200", "100000"],
+        ["0010010000003", "2025", "300 OAK AVE", "KATY", "100", "300000"],
+    ])
+    write_tsv(tmp_path / "owners.txt", [
+        ["acct", "ln_num", "name", "aka", "pct_own"],
+        ["10010000001", "1", "SMITH JOHN ", "", "50"],
+        ["0010010000009", "1", "NOT SAMPLED", "", "100"],
+        ["0010010000001", "2", "SMITH MARY", "MJ", "50"],
+    ])
+    write_tsv(tmp_path / "deeds.txt", [
+        ["acct", "dos", "clerk_yr", "clerk_id", "deed_id"],
+        ["0010010000002", "2020-01-15", "2020", "RP-1", "1"],
+        ["0010010000009", "2021-02-01", "2021", "RP-2", "2"],
+    ])
+    write_tsv(tmp_path / "permits.txt", [
+        ["acct", "id", "status", "dscr"],
+        ["0010010000003", "P1", "FINAL", '"NEW ROOF" '],
+    ])
+    write_tsv(tmp_path / "parcel_tieback.txt", [
+        ["acct", "tp", "dscr", "related_acct", "pct"],
+        ["0010010000003", "P", "PARENT", "0010010000001", "1.0"],
+    ])
+    write_tsv(tmp_path / "real_neighborhood_code.txt", [["cd", "grp_cd", "dscr"], ["100", "A", "DOWNTOWN"]])
+    write_tsv(tmp_path / "real_mnrl.txt", [["acct", "dor_cd"], ["0010010000009", "X"]])
+    return tmp_path
+
+
+def test_lazy_sample_matches_eager_loaders(harris_dir):
+    normalizer = HarrisCountyNormalizer(Config(data_dir=harris_dir, output_dir=harris_dir / "output"))
+
+    eager = normalizer.load_and_normalize_sample(3, lazy=False)
+    lazy = normalizer.load_and_normalize_sample(3)
+
+    assert lazy == eager
+    assert [record["account_id"] for record in lazy] == ["0010010000001", "0010010000002", "0010010000003"]
+    assert [owner["name"] for owner in lazy[0]["owners"]] == ["SMITH JOHN", "SMITH MARY"]
+    assert lazy[2]["permits"][0]["description"] == "NEW ROOF"
+
+    owners = normalizer._load_related_for_accounts("owners", pl.Series(["0010010000001"]))
+    assert owners["name"].to_list() == ["SMITH JOHN", "SMITH MARY"]
+
+
+def test_parse_strategy_is_cached_per_file(harris_dir):
+    normalizer = HarrisCountyNormalizer(Config(data_dir=harris_dir, output_dir=harris_dir / "output"))
+    path = harris_dir / "owners.txt"
+
+    polars_df = normalizer._robust_csv_load(path, "owners.txt")
+    assert normalizer._load_parse_strategy(path)["strategy"] == "polars"
+
+    normalizer._save_parse_strategy(path, "Robust with line cleaning", 3)
+    cached_df = normalizer._robust_csv_load(path, "owners.txt")
+    assert cached_df["name"].to_list() == polars_df["name"].to_list()
+
+    # Any change to the file invalidates its entry
+    write_tsv(path, [["acct", "name"], ["0010010000001", "SMITH JOHN"]])
+    assert normalizer._load_parse_strategy(path) is None
+
+
+def test_probe_picks_first_complete_strategy(harris_dir):
+    config = Config(data_dir=harris_dir, output_dir=harris_dir / "output")
+    config.parsing.strategy_probe_rows = 2
+    normalizer = HarrisCountyNormalizer(config)
+    path = harris_dir / "owners.txt"
+
+    df = normalizer._robust_pandas_load(path, "owners.txt")
+
+    assert len(df) == 3
+    assert normalizer._load_parse_strategy(path) == {
+        "fingerprint": file_fingerprint(path), "strategy": "Multi-line aware parsing", "expected_rows": 3
+    }
+
+
+def test_staged_parquet_sample_matches_raw_files(harris_dir):
+    normalizer = HarrisCountyNormalizer(Config(data_dir=harris_dir, output_dir=harris_dir / "output"))
+    expected = normalizer.load_and_normalize_sample(3, lazy=False)
+
+    normalizer.config.parsing.stage_parquet = True
+    for loader in (normalizer._load_real_accounts, normalizer._load_owners, normalizer._load_permits):
+        loader()
+
+    assert len(list((harris_dir / "output" / "staging").glob("*.parquet"))) == 3
+    assert normalizer.load_and_normalize_sample(3, lazy=False) == expected
+    assert normalizer.load_and_normalize_sample(3) == expected
@@ -0,0 +1,456 @@
+"""
+Tests for MongoDBService property ingestion.
+
+Uses a small in-memory stand-in for the properties collection so batching and
+hash comparison can be checked without a running MongoDB.
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from county_parser.services.async_mongodb_service import AsyncMongoDBService
+from county_parser.services.mongodb_service import MongoDBService, compute_content_hash, parse_write_concern
+
+
+class InMemoryCollection:
+    """The subset of pymongo's Collection API that save_properties uses."""
+
+    def __init__(self):
+        self.documents = {}
+        self.written = []
+        self.batch_sizes = []
+        self.writer_threads = set()
+        self.ordered = []
+        self.write_concern = None
+        self.updates = []
+
+    def find(self, query, projection=None):
+        if not query:
+            return InMemoryCursor(self.documents.values())
+        account_ids = query["account_id"]["$in"]
+        return InMemoryCursor(self.documents[account_id] for account_id in account_ids
+                              if account_id in self.documents)
+
+    def estimated_document_count(self):
+        return len(self.documents)
+
+    def with_options(self, write_concern=None):
+        self.write_concern = write_concern
+        return self
+
+    def bulk_write(self, operations, ordered=True):
+        self.ordered.append(ordered)
+        self.batch_sizes.append(len(operations))
+        self.writer_threads.add(threading.get_ident())
+        upserted = modified = 0
+        for operation in operations:
+            account_id = operation._filter["account_id"]
+            if account_id in self.documents:
+                modified += 1
+            else:
+                upserted += 1
+            self.documents[account_id] = operation._doc
+            self.written.append(account_id)
+        return SimpleNamespace(acknowledged=True, upserted_count=upserted, modified_count=modified)
+
+    def insert_one(self, document):
+        return SimpleNamespace(inserted_id="log")
+
+    def update_one(self, query, update):
+        self.updates.append(update["$set"])
+
+
+class InMemoryCursor(list):
+    def batch_size(self, size):
+        return self
+
+
+class InMemoryStatsCollection:
+    """Applies the $set/$inc/$min/$max upserts that maintain property_stats."""
+
+    def __init__(self):
+        self.documents = {}
+
+    def find(self, query):
+        return InMemoryCursor(self.documents.values())
+
+    def delete_many(self, query):
+        self.documents.clear()
+
+    def bulk_write(self, operations, ordered=True):
+        for operation in operations:
+            key = operation._filter["_id"]
+            document = self.documents.setdefault(key, {"_id": key})
+            update = operation._doc
+            document.update(update["$set"])
+            for path, delta in update.get("$inc", {}).items():
+                target, field = self._resolve(document, path)
+                target[field] = target.get(field, 0) + delta
+            for field, value in update.get("$min", {}).items():
+                document[field] = min(document.get(field, value), value)
+            for field, value in update.get("$max", {}).items():
+                document[field] = max(document.get(field, value), value)
+
+    @staticmethod
+    def _resolve(document, path):
+        *parents, field = path.split(".")
+        for parent in parents:
+            document = document.setdefault(parent, {})
+        return document, field
+
+
+@pytest.fixture
+def service():
+    service = MongoDBService(mongo_uri="mongodb://unused")
+    service.database = object()
+    service.properties_collection = InMemoryCollection()
+    service.logs_collection = InMemoryCollection()
+    return service
+
+
+def test_content_hash_ignores_metadata_and_key_order():
+    record = {"account_id": "1", "valuation": {"total": 100, "land": 40}}
+    reordered = {"valuation": {"land": 40, "total": 100}, "account_id": "1", "metadata": {"batch_id": "b"}}
+
+    assert compute_content_hash(record) == compute_content_hash(reordered)
+    assert compute_content_hash(record) != compute_content_hash({**record, "valuation": {"total": 101}})
+
+
+def test_delta_writes_only_new_and_changed_accounts(service):
+    roll = [{"account_id": str(i), "value": i} for i in range(5)]
+    first = service.save_properties(roll, batch_id="first")
+
+    supplement = [dict(record) for record in roll] + [{"account_id": "5", "value": 5}]
+    supplement[2]["value"] = 200
+    service.properties_collection.written.clear()
+    second = service.save_properties(supplement, batch_id="second", delta=True)
+
+    assert first["saved_count"] == 5
+    assert service.properties_collection.written == ["2", "5"]
+    assert (second["saved_count"], second["unchanged_count"], second["total_count"]) == (2, 4, 6)
+    assert service.properties_collection.documents["2"]["metadata"]["batch_id"] == "second"
+    assert service.properties_collection.documents["0"]["metadata"]["batch_id"] == "first"
+
+
+def test_stream_pipeline_batches_a_generator(service):
+    produced = []
+
+    def roll():
+        for i in range(25):
+            produced.append(i)
+            yield {"account_id": str(i), "value": i}
+
+    result = service.save_properties_stream(roll(), batch_id="stream", batch_size=10, writers=2)
+
+    collection = service.properties_collection
+    assert (result["saved_count"], result["total_count"], result["error_count"]) == (25, 25, 0)
+    # Accounts are split between the writers by writer_for_account (13 and 12 here)
+    assert sorted(collection.batch_sizes) == [2, 3, 10, 10]
+    assert sorted(collection.documents, key=int) == [str(i) for i in range(25)]
+    assert threading.get_ident() not in collection.writer_threads
+
+    again = service.save_properties_stream(roll(), batch_id="again", batch_size=10, delta=True)
+    assert (again["saved_count"], again["unchanged_count"]) == (0, 25)
+
+
+def test_stream_pipeline_reports_writer_failures(service):
+    def failing_bulk_write(operations, ordered=True):
+        raise RuntimeError("replica set unavailable")
+
+    service.properties_collection.bulk_write = failing_bulk_write
+    records = ({"account_id": str(i)} for i in range(100))
+
+    with pytest.raises(Exception, match="replica set unavailable"):
+        service.save_properties_stream(records, batch_size=10, writers=2, max_pending_batches=1)
+
+
+def test_stream_pipeline_marks_log_failed_when_producer_raises(service):
+    def roll():
+        for i in range(15):
+            yield {"account_id": str(i)}
+        raise ValueError("truncated PROP.TXT")
+
+    with pytest.raises(ValueError, match="truncated"):
+        service.save_properties_stream(roll(), batch_size=10, writers=2)
+
+    log = service.logs_collection.updates[-1]
+    assert (log["status"], log["total_properties"], log["processed_properties"]) == ("failed", 15, 10)
+    assert log["error_message"] == "truncated PROP.TXT"
+
+
+def test_bulk_options_reach_bulk_write(service):
+    roll = [{"account_id": str(i)} for i in range(7)]
+    collection = service.properties_collection
+
+    result = service.save_properties(roll, batch_size=3, ordered=False, write_concern={"w": "majority"})
+
+    assert result["saved_count"] == 7
+    assert collection.batch_sizes == [3, 3, 1]
+    assert collection.ordered == [False, False, False]
+    assert collection.write_concern.document == {"w": "majority"}
+
+    concurrent = service.save_properties(roll, batch_size=2, writers=3)
+    assert concurrent["total_count"] == 7
+    assert sorted(collection.batch_sizes[3:]) == [1, 2, 2, 2]
+    assert collection.ordered[3:] == [True] * 4
+
+
+def test_property_stats_follow_writes_and_match_rebuild(service):
+    service.stats_collection = InMemoryStatsCollection()
+    roll = [
+        {"account_id": str(i), "county": "harris" if i < 6 else "travis",
+         "valuation": {"market_value": 100000 * (i + 1)}}
+        for i in range(10)
+    ]
+    service.save_properties(roll, batch_size=4)
+
+    # A revalued account moves between buckets; a bad value stops counting toward values
+    revised = [dict(record) for record in roll]
+    revised[0] = {**roll[0], "valuation": {"market_value": 50000}}
+    revised[7] = {**roll[7], "valuation": {"market_value": 0, "assessed_value": 10**9}}
+    service.save_properties(revised, batch_size=4, delta=True)
+
+    incremental = service.get_property_stats()
+    assert incremental["total_properties"] == 10
+    assert incremental["counties"] == [{"_id": "harris", "count": 6}, {"_id": "travis", "count": 4}]
+    assert incremental["values"]["count"] == 9
+    assert incremental["values"]["avg_value"] == pytest.approx((5_500_000 - 100000 + 50000 - 800000) / 9)
+    assert incremental["values"]["min_value"] == 50000
+    assert set(incremental["values"]["percentiles"]) == {"p10", "p25", "p50", "p75", "p90"}
+
+    service.rebuild_property_stats(batch_size=3)
+    rebuilt = service.get_property_stats()
+    assert {key: rebuilt[key] for key in ("total_properties", "counties")} == \
+        {key: incremental[key] for key in ("total_properties", "counties")}
+    assert rebuilt["values"] == {**incremental["values"], "avg_value": pytest.approx(incremental["values"]["avg_value"])}
+
+
+def test_property_stats_survive_repeats_and_partial_failures(service):
+    service.stats_collection = InMemoryStatsCollection()
+    record = {"account_id": "1", "county": "travis", "valuation": {"market_value": 100000}}
+
+    # A repeated account counts once, and replacing it does not add to the count
+    service.save_properties([record, dict(record)])
+    service.save_properties([record, record, {**record, "account_id": "2"}])
+    assert service.get_property_stats()["total_properties"] == 2
+
+    # An unordered bulk write that fails on one upsert still counts the others
+    collection = service.properties_collection
+    write_all = collection.bulk_write
+
+    def failing_bulk_write(operations, ordered=True):
+        write_all([operation for index, operation in enumerate(operations) if index != 1], ordered)
+        raise BulkWriteError({"writeErrors": [{"index": 1, "code": 11000, "errmsg": "duplicate key"}]})
+
+    collection.bulk_write = failing_bulk_write
+    roll = [{**record, "account_id": str(i)} for i in range(3, 7)]
+    with pytest.raises(Exception, match="batch op errors"):
+        service.save_properties(roll, ordered=False)
+
+    assert sorted(collection.documents) == ["1", "2", "3", "5", "6"]
+    assert service.get_property_stats()["total_properties"] == 5
+
+
+def test_multi_writer_stream_keeps_property_stats_exact(service):
+    service.stats_collection = InMemoryStatsCollection()
+    collection = service.properties_collection
+    write = collection.bulk_write
+
+    def slow_bulk_write(operations, ordered=True):
+        time.sleep(0.002)  # Widen the gap between reading stored documents and writing
+        return write(operations, ordered)
+
+    collection.bulk_write = slow_bulk_write
+
+    # Every account is revalued several times, in batches that different writers could hold at once
+    roll = [
+        {"account_id": str(i), "county": "harris" if i % 3 else "dallas",
+         "valuation": {"market_value": 1000 * (i + 1) * (revision + 1)}}
+        for revision in range(4) for i in range(30)
+    ]
+    service.save_properties_stream(roll, batch_size=7, writers=4)
+    assert len(collection.writer_threads) == 4
+
+    incremental = service.get_property_stats()
+    service.rebuild_property_stats()
+    rebuilt = service.get_property_stats()
+
+    assert incremental["total_properties"] == rebuilt["total_properties"] == 30
+    assert incremental["counties"] == rebuilt["counties"]
+    assert incremental["values"]["count"] == rebuilt["values"]["count"] == 30
+    assert incremental["values"]["avg_value"] == pytest.approx(rebuilt["values"]["avg_value"])
+    assert incremental["values"]["percentiles"] == rebuilt["values"]["percentiles"]
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, None),
+    ("majority", {"w": "majority"}),
+    ("1", {"w": 1}),
+    ("w=1, j=false, wtimeout=5000", {"w": 1, "j": False, "wtimeout": 5000}),
+])
+def test_parse_write_concern(value, expected):
+    assert parse_write_concern(value) == expected
+
+
+class AsyncInMemoryCollection:
+    """Coroutine wrapper over InMemoryCollection, shaped like a motor collection."""
+
+    def __init__(self):
+        self.collection = InMemoryCollection()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def find(self, query, projection=None):
+        return AsyncCursor(self.collection.find(query, projection))
+
+    def with_options(self, write_concern=None):
+        self.collection.with_options(write_concern)
+        return self
+
+    async def bulk_write(self, operations, ordered=True):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        return self.collection.bulk_write(operations, ordered)
+
+    async def insert_one(self, document):
+        return self.collection.insert_one(document)
+
+    async def update_one(self, query, update):
+        pass
+
+    async def estimated_document_count(self):
+        return self.collection.estimated_document_count()
+
+
+class AsyncInMemoryStatsCollection:
+    """Coroutine wrapper over InMemoryStatsCollection."""
+
+    def __init__(self):
+        self.collection = InMemoryStatsCollection()
+
+    def find(self, query):
+        return AsyncCursor(self.collection.find(query))
+
+    async def delete_many(self, query):
+        self.collection.delete_many(query)
+
+    async def bulk_write(self, operations, ordered=True):
+        self.collection.bulk_write(operations, ordered)
+
+
+class AsyncCursor:
+    def __init__(self, documents):
+        self.documents = iter(documents)
+
+    def batch_size(self, size):
+        return self
+
+    async def to_list(self, length=None):
+        return list(self.documents)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.documents)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def test_async_service_overlaps_bulk_writes_and_supports_delta():
+    service = AsyncMongoDBService(mongo_uri="mongodb://unused")
+    service.database = object()
+    service.properties_collection = AsyncInMemoryCollection()
+    service.logs_collection = AsyncInMemoryCollection()
+
+    async def roll():
+        for i in range(30):
+            yield {"account_id": str(i), "value": i}
+
+    first = asyncio.run(service.save_properties(roll(), batch_size=2, concurrency=3))
+    changed = [{"account_id": str(i), "value": i if i != 4 else 40} for i in range(30)]
+    second = asyncio.run(service.save_properties(changed, batch_size=2, delta=True))
+
+    assert (first["saved_count"], first["total_count"]) == (30, 30)
+    assert service.properties_collection.max_in_flight == 3
+    assert (second["saved_count"], second["unchanged_count"]) == (1, 29)
+    assert service.properties_collection.collection.documents["4"]["value"] == 40
+
+
+def test_async_service_waits_for_cancelled_writes_on_failure():
+    service = AsyncMongoDBService(mongo_uri="mongodb://unused")
+    service.database = object()
+    service.properties_collection = AsyncInMemoryCollection()
+    service.logs_collection = AsyncInMemoryCollection()
+    writes = []
+
+    async def bulk_write(operations, ordered=True):
+        writes.append(asyncio.current_task())
+        if len(writes) == 2:
+            raise RuntimeError("primary stepped down")
+        await asyncio.sleep(60)
+
+    service.properties_collection.bulk_write = bulk_write
+
+    async def save():
+        with pytest.raises(Exception, match="primary stepped down"):
+            await service.save_properties([{"account_id": str(i)} for i in range(10)], batch_size=2, concurrency=3)
+        return [task.done() for task in writes]
+
+    assert asyncio.run(save()) == [True, True]
+    assert service.bulk_writers == MongoDBService(mongo_uri="mongodb://unused").bulk_writers
+
+
+def test_async_property_stats_build_missing_summary_like_sync(service):
+    roll = [
+        {"account_id": str(i), "county": "harris" if i < 6 else "travis",
+         "valuation": {"market_value": 100000 * (i + 1)}}
+        for i in range(10)
+    ]
+    service.stats_collection = InMemoryStatsCollection()
+    service.maintain_stats = False
+    service.save_properties(roll, batch_size=4)
+
+    async_service = AsyncMongoDBService(mongo_uri="mongodb://unused")
+    async_service.database = object()
+    async_service.properties_collection = AsyncInMemoryCollection()
+    async_service.properties_collection.collection = service.properties_collection
+    async_service.logs_collection = AsyncInMemoryCollection()
+    async_service.stats_collection = AsyncInMemoryStatsCollection()
+
+    built = asyncio.run(async_service.get_property_stats())
+    expected = service.get_property_stats()
+
+    assert built["total_properties"] == 10
+    assert {key: built[key] for key in ("total_properties", "counties", "values")} == \
+        {key: expected[key] for key in ("total_properties", "counties", "values")}
+
+
+def test_async_service_reads_plain_iterables_off_the_event_loop():
+    service = AsyncMongoDBService(mongo_uri="mongodb://unused")
+    service.database = object()
+    service.properties_collection = AsyncInMemoryCollection()
+    service.logs_collection = AsyncInMemoryCollection()
+    reader_threads = set()
+
+    def parse():
+        for i in range(5):
+            reader_threads.add(threading.get_ident())
+            yield {"account_id": str(i)}
+
+    async def save():
+        result = await service.save_properties(parse(), batch_size=2)
+        return result, threading.get_ident()
+
+    result, loop_thread = asyncio.run(save())
+
+    assert result["saved_count"] == 5
+    assert reader_threads and loop_thread not in reader_threads
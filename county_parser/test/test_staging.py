@@ -0,0 +1,66 @@
+"""
+Tests for the content-addressed Parquet staging cache.
+"""
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from county_parser.utils.staging import ParquetStage
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "owners.txt"
+    path.write_text("acct\tname\n1\tSMITH\n2\t\n", encoding="utf-8")
+    return path
+
+
+def test_load_stages_once_and_tracks_source_changes(source, tmp_path):
+    stage = ParquetStage(tmp_path / "output")
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return pl.read_csv(source, separator="\t")
+
+    first = stage.load(source, loader)
+    second = stage.load(source, loader)
+
+    assert len(calls) == 1
+    assert second.equals(first)
+    assert stage.read(source, n_rows=1)["name"].to_list() == ["SMITH"]
+
+    source.write_text("acct\tname\n3\tDOE\n", encoding="utf-8")
+    assert stage.read(source) is None
+    assert stage.load(source, loader)["name"].to_list() == ["DOE"]
+    assert len(list((tmp_path / "output" / "staging").iterdir())) == 1
+
+
+def test_writer_publishes_only_complete_scans(source, tmp_path):
+    stage = ParquetStage(tmp_path / "output")
+    chunks = list(pd.read_csv(source, sep="\t", dtype=str, chunksize=1))
+
+    with pytest.raises(RuntimeError):
+        with stage.writer(source, ["acct", "name"]) as write_chunk:
+            write_chunk(chunks[0])
+            raise RuntimeError("scan abandoned")
+    assert stage.find(source) is None
+    assert list((tmp_path / "output" / "staging").iterdir()) == []
+
+    with stage.writer(source, ["acct", "name"]) as write_chunk:
+        for chunk in chunks:
+            write_chunk(chunk)
+
+    staged = pd.concat(stage.iter_pandas_batches(source, 1), ignore_index=True)
+    pd.testing.assert_frame_equal(staged, pd.read_csv(source, sep="\t", dtype=str), check_dtype=False)
+    assert pd.isna(stage.read_pandas(source).loc[1, "name"])
+
+
+def test_disabled_stage_never_writes(source, tmp_path):
+    stage = ParquetStage(tmp_path / "output", enabled=False)
+
+    stage.load(source, lambda: pl.read_csv(source, separator="\t"))
+
+    assert stage.find(source) is None
+    assert not (tmp_path / "output").exists()
@@ -0,0 +1,54 @@
+"""
+Tests for the streaming line-ending and encoding normalizer.
+"""
+
+import io
+import json
+
+import pytest
+
+from county_parser.utils.stream_utils import NormalizedLineStream, iter_json_array, read_delimited_normalized
+
+MIXED_BYTES = b"acct\tname\r\n001\tJOS\xc9\r002\tZO\xc3\x8b\n003\tLAST"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+def test_stream_fixes_line_endings_and_encodings_across_chunks(chunk_size):
+    stream = NormalizedLineStream(io.BytesIO(MIXED_BYTES), chunk_size=chunk_size)
+
+    assert stream.read().decode("utf-8") == "acct\tname\n001\tJOSÉ\n002\tZOË\n003\tLAST"
+
+
+def test_stream_stops_after_max_lines():
+    stream = NormalizedLineStream(io.BytesIO(MIXED_BYTES), max_lines=2, chunk_size=5)
+
+    assert stream.read() == "acct\tname\n001\tJOSÉ\n".encode("utf-8")
+    assert stream.lines_emitted == 2
+
+
+def test_read_delimited_normalized(tmp_path):
+    path = tmp_path / "real_acct.txt"
+    path.write_bytes(MIXED_BYTES + b"\r\n004\t\r\n005\tTOO\tMANY\r\n")
+
+    df = read_delimited_normalized(path)
+    sample = read_delimited_normalized(path, max_rows=2)
+
+    assert df.columns == ["acct", "name"]
+    assert df.rows() == [("001", "JOSÉ"), ("002", "ZOË"), ("003", "LAST"), ("004", None)]
+    assert sample.rows() == [("001", "JOSÉ"), ("002", "ZOË")]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1024])
+def test_json_array_elements_stream_across_chunks(tmp_path, chunk_size):
+    records = [{"account_id": "1", "owners": [{"name": "SMITH, JOHN ]"}]}, {"account_id": "2", "value": 12345}]
+    path = tmp_path / "records.json"
+    path.write_text(json.dumps(records, indent=2), encoding="utf-8")
+
+    assert list(iter_json_array(path, chunk_size=chunk_size)) == records
+
+    path.write_text("[]", encoding="utf-8")
+    assert list(iter_json_array(path, chunk_size=chunk_size)) == []
+
+    path.write_text('[{"account_id": "1"}, {"account', encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(iter_json_array(path, chunk_size=chunk_size))
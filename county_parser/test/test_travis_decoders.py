@@ -0,0 +1,377 @@
+"""
+Tests for the Travis County fixed-width decoders.
+
+Builds small synthetic PROP.TXT files so the columnar and line-by-line
+extractors can be compared without the real appraisal exports.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from county_parser.models.config import Config, TravisCountyConfig
+from county_parser.parsers.travis_field_specs import (
+    PROP_FIELDS,
+    TRAVIS_LAYOUTS,
+    FixedWidthField,
+    TravisFieldExtractor,
+    decode_fixed_width_frame,
+    get_layout,
+    read_fixed_width_lines,
+    validate_layouts,
+)
+from county_parser.parsers.travis_parser import (
+    AccountOffsetIndex,
+    TravisCountyNormalizer,
+    compute_shard_ranges,
+    iter_mapped_lines,
+)
+
+PROP_LINE_LENGTH = 9247
+
+
+def build_line(values: dict, length: int = PROP_LINE_LENGTH) -> str:
+    """Place values at their field positions in a blank fixed-width line."""
+    fields = {field.name: field for field in PROP_FIELDS}
+    line = [" "] * length
+    for name, value in values.items():
+        field = fields[name]
+        text = str(value).ljust(field.length)[:field.length]
+        line[field.start:field.end] = list(text)
+    return "".join(line)
+
+
+SAMPLE_PROPERTIES = [
+    {
+        "account_id": "000000100008", "property_type": "R", "tax_year": "02025",
+        "owner_name": "SMITH JOHN", "owner_city": "AUSTIN", "owner_state": "TX",
+        "property_street_name": "CONGRESS", "property_street_type": "AVE",
+        "property_zip": "78701", "property_city": "AUSTIN",
+        "market_value": "000433206600000", "land_value": "000100000000000",
+        "improvement_value": "abc", "assessment_date": "01152025",
+    },
+    {
+        "account_id": "000000100009", "property_type": "C", "tax_year": "02025",
+        "owner_name": "ACME LLC", "market_value": "000000000000000",
+        "assessment_date": "20250115", "exemption_codes": "HS OV65",
+    },
+    {
+        "account_id": "000000100010", "property_type": "R",
+        "assessment_date": "01-15-2025", "legal_description": "LOT 1 BLK A",
+    },
+]
+
+
+@pytest.fixture
+def prop_file(tmp_path: Path) -> Path:
+    path = tmp_path / "PROP.TXT"
+    lines = [build_line(values) for values in SAMPLE_PROPERTIES]
+    # Blank and short lines are skipped by both decoders
+    lines.insert(1, "")
+    lines.append("SHORT LINE")
+    path.write_text("\r\n".join(lines) + "\r\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def normalizer(prop_file: Path) -> TravisCountyNormalizer:
+    normalizer = TravisCountyNormalizer()
+    normalizer.files = {key: prop_file.parent / path.name for key, path in normalizer.files.items()}
+    return normalizer
+
+
+def test_columnar_decoder_matches_line_extractor(prop_file):
+    extractor = TravisFieldExtractor()
+    expected = []
+    with open(prop_file, "r", encoding="utf-8") as f:
+        for line in f:
+            record = extractor.extract_property_record(line.rstrip())
+            if record.get("account_id"):
+                expected.append(record)
+
+    frame = decode_fixed_width_frame(read_fixed_width_lines(prop_file), PROP_FIELDS)
+    decoded = [
+        {name: value for name, value in row.items() if value is not None}
+        for row in frame.iter_rows(named=True)
+    ]
+
+    assert decoded == expected
+    assert decoded[0]["market_value"] == pytest.approx(433.2066)
+    assert decoded[0]["improvement_value"] == 0
+    assert decoded[0]["assessment_date"] == "2025-01-15"
+    assert "market_value" not in decoded[1]
+
+
+def test_normalizer_columnar_mode_matches_default(normalizer):
+    line_records = normalizer.extract_property_records()
+    columnar_records = normalizer.extract_property_records(columnar=True)
+
+    assert columnar_records == line_records
+    assert list(columnar_records) == ["000000100008", "000000100009", "000000100010"]
+
+    # The blank line after the first record does not count toward the sample size
+    sample = normalizer.extract_property_records(max_records=2)
+    assert list(sample) == ["000000100008", "000000100009"]
+    assert normalizer.extract_property_records(max_records=2, columnar=True) == sample
+
+
+def test_shard_ranges_follow_record_stride(tmp_path):
+    path = tmp_path / "PROP.TXT"
+    lines = [build_line({"account_id": f"{i:012d}"}) for i in range(1, 11)]
+    path.write_text("\r\n".join(lines) + "\r\n", encoding="utf-8")
+    stride = PROP_LINE_LENGTH + 2
+
+    shards = compute_shard_ranges(path, 3, PROP_LINE_LENGTH)
+
+    assert shards[0][0] == 0 and shards[-1][1] == path.stat().st_size
+    assert all(start % stride == 0 for start, _ in shards)
+    assert [end - start for start, end in shards] == [4 * stride, 4 * stride, 2 * stride]
+
+
+def test_parallel_extraction_matches_serial(normalizer):
+    normalizer.config = None
+    serial = normalizer.extract_property_records()
+    parallel = normalizer.extract_property_records(parallel=True)
+    parallel_columnar = normalizer.extract_property_records(parallel=True, columnar=True)
+    parallel_mapped = normalizer.extract_property_records(parallel=True, memory_map=True)
+
+    assert parallel == serial
+    assert parallel_columnar == serial
+    assert parallel_mapped == serial
+
+    # Sample limits count records, so the blank line after the first record is skipped over
+    sample = normalizer.extract_property_records(max_records=2)
+    assert list(sample) == ["000000100008", "000000100009"]
+    assert normalizer.extract_property_records(max_records=2, parallel=True) == sample
+    assert normalizer.extract_property_records(max_records=2, parallel=True, columnar=True) == sample
+
+
+def test_parallel_sample_limits_match_serial(normalizer, prop_file):
+    normalizer.config = None
+    # Fixed-stride files: the leading records include lines without an account
+    lines = [build_line({"account_id": f"{i:012d}", "property_city": "AUSTIN"} if i % 3
+                        else {"property_city": "AUSTIN"})
+             for i in range(1, 13)]
+    prop_file.write_text("\r\n".join(lines) + "\r\n", encoding="utf-8")
+    entities = [related_line(f"{i:012d}", "2025", length=2750) for i in range(1, 41)]
+    write_lines(prop_file.parent / "PROP_ENT.TXT", entities)
+
+    serial = normalizer.extract_property_records(max_records=5)
+    assert len(serial) == 5
+    assert normalizer.extract_property_records(max_records=5, parallel=True) == serial
+
+    # The filter only matches accounts late in the file, past the first max_records lines
+    wanted = {f"{i:012d}" for i in (30, 35, 38)}
+    serial_entities = normalizer.extract_entity_records(wanted, max_records=2)
+    assert list(serial_entities) == ["000000000030", "000000000035"]
+    assert normalizer.extract_entity_records(wanted, max_records=2, parallel=True) == serial_entities
+
+
+def test_mapped_lines_match_stripped_text_lines(prop_file):
+    with open(prop_file, "r", encoding="utf-8") as f:
+        expected = [line.rstrip() for line in f if line.rstrip()]
+
+    mapped = [bytes(line).decode("utf-8") for line in iter_mapped_lines(prop_file)]
+
+    assert mapped == expected
+
+
+def test_memory_mapped_extraction_matches_default(normalizer):
+    # PROP.TXT lines are long enough to exercise the entity extractor too
+    normalizer.files["property_entities"] = normalizer.files["properties"]
+    default = normalizer.extract_property_records()
+    mapped = normalizer.extract_property_records(memory_map=True)
+    entities = normalizer.extract_entity_records(set(default), memory_map=True)
+
+    assert mapped == default
+    assert entities == normalizer.extract_entity_records(set(default))
+    assert list(entities) == list(default)
+    assert normalizer.extract_property_records(max_records=2, memory_map=True) == {
+        account_id: default[account_id] for account_id in ["000000100008", "000000100009"]
+    }
+
+
+def test_staged_property_frame_matches_decoder(normalizer, tmp_path):
+    normalizer.config = Config(output_dir=tmp_path / "output")
+    normalizer.config.parsing.stage_parquet = True
+    decoded = normalizer.extract_property_frame()
+    staged_path = normalizer._parquet_stage().find(normalizer.files["properties"], variant="decoded")
+
+    assert staged_path is not None
+    assert normalizer.extract_property_frame().equals(decoded)
+    assert normalizer.extract_property_frame(max_records=2).equals(decoded.head(2))
+
+
+def related_line(account_id: str, text: str, length: int = 1300) -> str:
+    """A PROP_ENT/IMP_DET/LAND_DET style line: account ID, then a text field at offset 12."""
+    return (account_id + text.ljust(10)).ljust(length - 1) + "|"
+
+
+def write_lines(path: Path, lines):
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def without_timestamps(records):
+    for record in records:
+        record["metadata"].pop("last_updated", None)
+        record["metadata"]["processing_stats"].pop("processing_timestamp", None)
+    return records
+
+
+def test_merge_join_matches_dict_join(normalizer, prop_file):
+    data_dir = prop_file.parent
+    # Orphan accounts before, between and after the properties are skipped
+    write_lines(data_dir / "PROP_ENT.TXT", [
+        related_line("000000100001", "ORPHAN"),
+        related_line("000000100008", "2025"),
+        related_line("000000100008", "2025"),
+        related_line("000000100010", "2025"),
+        related_line("000000100099", "2025"),
+    ])
+    write_lines(data_dir / "IMP_DET.TXT", [
+        related_line("000000100009", "IMP1"),
+        related_line("000000100009", "IMP2"),
+        related_line("000000100011", "IMP3"),
+    ])
+    write_lines(data_dir / "LAND_DET.TXT", [related_line("000000100010", "LAND1")])
+
+    expected = without_timestamps(normalizer.load_and_normalize_sample(10))
+    merged = without_timestamps(normalizer.load_and_normalize_sample(10, merge_join=True))
+
+    assert merged == expected
+    assert [len(record["improvements"]) for record in merged] == [0, 2, 0]
+    assert [len(record["land_details"]) for record in merged] == [0, 0, 1]
+    assert without_timestamps(list(normalizer.iter_normalized_records(max_records=2))) == expected[:2]
+
+
+def test_merge_join_rejects_unordered_files(normalizer, prop_file):
+    write_lines(prop_file.parent / "IMP_DET.TXT", [
+        related_line("000000100010", "IMP1"),
+        related_line("000000100008", "IMP2"),
+    ])
+
+    with pytest.raises(ValueError, match="IMP_DET.TXT is not ordered by account ID"):
+        list(normalizer.iter_normalized_records())
+
+
+@pytest.mark.parametrize("line_ending, sparse_interval", [("\r\n", 1024), ("\n", 2)])
+def test_account_offset_index_lookups(tmp_path, line_ending, sparse_interval):
+    accounts = [f"{i:012d}" for i in range(1, 200, 3) for _ in range(i % 3 + 1)]
+    path = tmp_path / "PROP_ENT.TXT"
+    lines = [related_line(account_id, f"E{n}", length=150) for n, account_id in enumerate(accounts)]
+    if sparse_interval != 1024:
+        # A short line breaks the fixed stride, so the sparse index is used
+        lines.insert(5, related_line(accounts[5], "SHORT", length=120))
+    path.write_text(line_ending.join(lines) + line_ending, encoding="utf-8")
+
+    with AccountOffsetIndex(path, sparse_interval=sparse_interval) as index:
+        assert (index.stride is not None) == (sparse_interval == 1024)
+        assert [line[:12] for line in index.lookup("000000000097")] == ["000000000097"] * 2
+        assert index.lookup("000000000098") == []
+        assert index.lookup("97") == index.lookup("000000000097")
+        assert {line[:12] for line in index.range("000000000050", "000000000061")} == {
+            "000000000052", "000000000055", "000000000058", "000000000061"
+        }
+        assert index.lower_bound("000000001000") == index.size
+        assert list(index.iter_lines(index.lower_bound("0"))) == [line.rstrip() for line in lines]
+
+
+def test_point_lookups_and_windowed_extraction(normalizer, prop_file):
+    data_dir = prop_file.parent
+    write_lines(data_dir / "PROP_ENT.TXT", [related_line(f"{i:012d}", "2025") for i in range(100000, 100020)])
+    write_lines(data_dir / "IMP_DET.TXT", [related_line(f"{i:012d}", "IMP") for i in range(100000, 100020)])
+
+    default = normalizer.extract_property_records()
+    assert normalizer.get_property("000000100009") == default["000000100009"]
+    assert normalizer.get_property("000000100011") is None
+    assert normalizer.get_property_range("000000100009", "000000100010") == {
+        account_id: default[account_id] for account_id in ["000000100009", "000000100010"]
+    }
+    assert [entity["account_id"] for entity in normalizer.get_entities("000000100010")] == ["000000100010"]
+
+    full_read = normalizer.extract_improvement_records(set(default))
+    normalizer.travis_config.files_sorted_by_account = True
+    windowed = normalizer.extract_improvement_records(set(default))
+    assert windowed == full_read
+    assert list(windowed) == ["000000100008", "000000100009", "000000100010"]
+
+    indexes = list(normalizer._account_indexes.values())
+    with normalizer:
+        pass
+    assert normalizer._account_indexes == {} and all(index._file.closed for index in indexes)
+
+
+def test_windowed_scan_falls_back_on_unsorted_file(normalizer, prop_file):
+    # Bisection starts the window at 100009; without the fallback the scan stops at 100020 and misses 100010
+    accounts = [100003, 100009, 100015, 100008, 100020, 100010]
+    write_lines(prop_file.parent / "IMP_DET.TXT", [related_line(f"{i:012d}", f"IMP{i}") for i in accounts])
+    account_ids = {"000000100008", "000000100009", "000000100010", "000000100015"}
+
+    full_read = normalizer.extract_improvement_records(account_ids)
+    normalizer.travis_config.files_sorted_by_account = True
+
+    assert normalizer.extract_improvement_records(account_ids) == full_read
+    assert sorted(full_read) == sorted(account_ids)
+
+
+def test_guessed_stride_is_checked_before_bisecting(tmp_path):
+    path = tmp_path / "IMP_DET.TXT"
+    # The second and third lines are one byte short and long, so the size is still a multiple of the first
+    lines = [related_line(f"{i:012d}", "IMP", length=150) for i in range(1, 7)]
+    lines[1], lines[2] = lines[1][:-2] + "|", lines[2] + "|"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    with AccountOffsetIndex(path) as index:
+        assert index.stride is None
+        assert [line[:12] for line in index.lookup("000000000005")] == ["000000000005"]
+
+
+@pytest.mark.parametrize("layout_key", sorted(TRAVIS_LAYOUTS))
+def test_compiled_layouts_match_field_extract(layout_key):
+    layout = TRAVIS_LAYOUTS[layout_key]
+    length = max(field.end for field in layout.fields)
+    samples = ["0" * length, "A" * (length - 1), "9" * length, "00012345 xyz".ljust(length), "x" * 99]
+    samples += ["".join(chr(48 + (i * 7 + seed) % 43) for i in range(length)) for seed in range(5)]
+
+    for line in samples:
+        expected = {}
+        if len(line) >= layout.min_line_length:
+            for field in layout.fields:
+                value = field.extract(line)
+                if value is not None:
+                    expected[field.name] = value
+        assert layout.decode(line) == expected
+        assert layout.decode(memoryview(line.encode())) == expected
+
+
+def test_layout_registry_and_validation():
+    extractor = TravisFieldExtractor()
+    agent = FixedWidthField("agent_name", 12, 72).extract
+    line = "000000000042" + "JONES TAX CONSULTING".ljust(163)
+
+    assert extractor.extract_agent_record(line) == {"agent_id": "000000000042", "agent_name": agent(line)}
+    assert extractor.extract_subdivision_record(" " * 12 + "OAK HILLS".ljust(200)) is None
+    with pytest.raises(KeyError, match="known layouts"):
+        get_layout("lawsuits")
+
+    validate_layouts(TravisCountyConfig())
+    with pytest.raises(ValueError, match="past the 3000-character line"):
+        validate_layouts(TravisCountyConfig(property_line_length=3000))
+
+
+def test_field_projection_matches_full_records(normalizer):
+    fields = ["market_value", "property_street_name", "property_zip"]
+    full = normalizer.extract_property_records()
+    expected = {
+        account_id: {name: value for name, value in record.items() if name in {"account_id", *fields}}
+        for account_id, record in full.items()
+    }
+
+    assert normalizer.extract_property_records(fields=fields) == expected
+    assert normalizer.extract_property_records(fields=fields, memory_map=True) == expected
+    assert normalizer.extract_property_records(fields=fields, columnar=True) == expected
+    assert normalizer.get_property("000000100008", fields=fields) == expected["000000100008"]
+    assert TRAVIS_LAYOUTS["properties"].decoder(fields) is TRAVIS_LAYOUTS["properties"].decoder(reversed(fields))
+
+    with pytest.raises(ValueError, match="Unknown properties fields: owner"):
+        normalizer.extract_property_records(fields=["owner"])
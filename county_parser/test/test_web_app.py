@@ -0,0 +1,159 @@
+"""
+Tests for the web app's shared MongoDB client lifecycle.
+
+Replaces MongoDBService with a stand-in that counts connections, so reuse,
+health checks and fork handling can be checked without a running MongoDB.
+"""
+
+import gzip
+import json
+from datetime import datetime
+
+import pytest
+
+import web_app
+
+
+class CountingService:
+    connections = 0
+
+    def __init__(self):
+        self.healthy = True
+        self.closed = False
+
+    def connect(self):
+        CountingService.connections += 1
+        return True
+
+    def ping(self):
+        return self.healthy
+
+    def disconnect(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pooled(monkeypatch):
+    CountingService.connections = 0
+    monkeypatch.setattr(web_app, "MongoDBService", CountingService)
+    monkeypatch.setattr(web_app, "HEALTH_CHECK_INTERVAL", 0)
+    return web_app.PooledDatabase()
+
+
+def test_requests_share_one_client_per_process(pooled, monkeypatch):
+    first = pooled.get()
+    assert pooled.get() is first
+    assert CountingService.connections == 1
+
+    # A failed health check drops the client and the next request reconnects
+    first.healthy = False
+    replacement = pooled.get()
+    assert replacement is not first and first.closed
+    assert CountingService.connections == 2
+
+    # A forked worker never reuses (or closes) its parent's client
+    monkeypatch.setattr(web_app.os, "getpid", lambda: -1)
+    child = pooled.get()
+    assert child is not replacement and not replacement.closed
+    assert CountingService.connections == 3
+
+
+def test_health_endpoint_reports_pooled_backend(pooled, monkeypatch):
+    monkeypatch.setattr(web_app, "shared_database", pooled)
+
+    response = web_app.app.test_client().get("/api/health")
+
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "ok"
+    assert response.get_json()["backend"] == "pooled"
+
+
+def test_stats_endpoint_serves_cached_summary(pooled, monkeypatch):
+    reads = []
+
+    def get_property_stats(self):
+        reads.append(1)
+        return {"total_properties": 3, "logs_count": 1, "counties": [{"_id": "harris", "count": 3}],
+                "values": {"avg_value": 100.0, "count": 3}, "last_updated": "2025-01-01T00:00:00"}
+
+    monkeypatch.setattr(CountingService, "get_property_stats", get_property_stats, raising=False)
+    monkeypatch.setattr(web_app, "shared_database", pooled)
+    monkeypatch.setattr(web_app, "stats_cache", web_app.StatsCache(ttl=60))
+    client = web_app.app.test_client()
+
+    first = client.get("/api/stats").get_json()
+    second = client.get("/api/stats").get_json()
+
+    assert first == second
+    assert (first["total_properties"], first["total_logs"]) == (3, 1)
+    assert first["values"]["avg_value"] == 100.0
+    assert len(reads) == 1
+
+
+class RecordingDatabase:
+    def __init__(self, documents):
+        self.documents = documents
+        self.calls = []
+
+    def query_properties(self, filter_query=None, limit=100, projection=None, sort=None):
+        self.calls.append((filter_query, limit, projection, sort))
+        after = filter_query.get("account_id", {}).get("$gt", "")
+        return [doc for doc in self.documents if doc["account_id"] > after][:limit]
+
+
+def test_properties_endpoint_pages_by_account_with_projection(monkeypatch):
+    db = RecordingDatabase([{"account_id": f"{i:03d}", "county": "harris"} for i in range(5)])
+    monkeypatch.setattr(web_app, "database", lambda: db)
+    client = web_app.app.test_client()
+
+    first = client.get("/api/properties?limit=2&county=Harris&zip=77002&min_value=1000"
+                       "&fields=county,valuation,valuation.market_value").get_json()
+    second = client.get(f"/api/properties?limit=2&after={first['next_cursor']}").get_json()
+    last = client.get("/api/properties?limit=2&after=003").get_json()
+
+    assert [doc["account_id"] for doc in first["properties"]] == ["000", "001"]
+    assert first["next_cursor"] == "001"
+    assert [doc["account_id"] for doc in second["properties"]] == ["002", "003"]
+    assert last["next_cursor"] is None and len(last["properties"]) == 1
+
+    query, limit, projection, sort = db.calls[0]
+    assert query == {"county": "harris", "property_address.zip_code": "77002",
+                     "valuation.total_market_value": {"$gte": 1000.0}}
+    assert limit == 3 and sort == [("account_id", 1)]
+    assert projection == {"_id": 0, "account_id": 1, "county": 1, "valuation": 1}
+
+    assert client.get("/api/properties?fields=owners.$").status_code == 400
+    assert client.get("/api/properties?min_value=cheap").status_code == 400
+
+
+class StreamingDatabase:
+    def __init__(self, count):
+        self.count = count
+        self.calls = []
+
+    def iter_properties(self, filter_query=None, batch_size=1000, projection=None, limit=0):
+        self.calls.append((filter_query, projection, limit))
+        for i in range(self.count):
+            yield {"account_id": f"{i:04d}", "county": "travis", "loaded_at": datetime(2025, 1, 1)}
+
+
+def test_export_streams_compressed_ndjson_and_json(monkeypatch):
+    db = StreamingDatabase(3000)
+    monkeypatch.setattr(web_app, "database", lambda: db)
+    client = web_app.app.test_client()
+
+    response = client.get("/api/properties/export?county=travis&fields=county",
+                          headers={"Accept-Encoding": "gzip"})
+    assert response.is_streamed
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.mimetype == "application/x-ndjson"
+    lines = gzip.decompress(response.get_data()).decode("utf-8").splitlines()
+    assert len(lines) == 3000
+    assert json.loads(lines[-1]) == {"account_id": "2999", "county": "travis", "loaded_at": "2025-01-01T00:00:00"}
+    assert db.calls[0] == ({"county": "travis"}, {"_id": 0, "account_id": 1, "county": 1}, 0)
+
+    plain = client.get("/api/properties/export?format=json")
+    assert "Content-Encoding" not in plain.headers
+    assert len(json.loads(plain.get_data())) == 3000
+
+    assert client.get("/api/properties/export?format=xml").status_code == 400
@@ -1,6 +1,10 @@
 """Utility functions and helpers."""
 
-from .file_utils import get_file_size, ensure_directory
+from .file_utils import get_file_size, ensure_directory, file_fingerprint, count_lines
 from .data_utils import detect_file_format, sample_data
+from .staging import ParquetStage
+from .stream_utils import NormalizedLineStream, open_normalized, read_delimited_normalized, iter_json_array
 
-__all__ = ["get_file_size", "ensure_directory", "detect_file_format", "sample_data"]
+__all__ = ["get_file_size", "ensure_directory", "file_fingerprint", "count_lines", "detect_file_format", "sample_data",
+           "ParquetStage", "NormalizedLineStream", "open_normalized", "read_delimited_normalized",
+           "iter_json_array"]
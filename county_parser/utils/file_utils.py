@@ -1,5 +1,6 @@
 """File system utilities."""
 
+import hashlib
 import os
 from pathlib import Path
 from typing import Union
@@ -46,3 +47,38 @@ def get_available_space(dir_path: Union[str, Path]) -> dict:
         "available_bytes": available_bytes,
         "available_gb": round(available_bytes / (1024 * 1024 * 1024), 2)
     }
+
+
+def file_fingerprint(file_path: Union[str, Path], sample_bytes: int = 65536) -> str:
+    """Get a short fingerprint that changes when a data file is replaced or modified.
+    
+    Combines the file size, modification time and a hash of the first
+    ``sample_bytes`` so cached artifacts derived from the file can be reused
+    without rehashing multi-gigabyte exports.
+    """
+    
+    path = Path(file_path)
+    stat = path.stat()
+    
+    digest = hashlib.sha256(f"{stat.st_size}:{stat.st_mtime_ns}:".encode())
+    with open(path, 'rb') as f:
+        digest.update(f.read(sample_bytes))
+    
+    return digest.hexdigest()[:16]
+
+
+def count_lines(file_path: Union[str, Path], block_size: int = 1024 * 1024) -> int:
+    """Count lines by scanning raw bytes in blocks, without decoding the file."""
+    
+    count = 0
+    last = b''
+    with open(file_path, 'rb') as f:
+        while block := f.read(block_size):
+            count += block.count(b'\n')
+            last = block[-1:]
+    
+    # An unterminated final line still counts
+    if last and last != b'\n':
+        count += 1
+    
+    return count
@@ -0,0 +1,115 @@
+"""Content-addressed Parquet staging for raw county source files."""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Generator, List, Optional, Union
+
+import pandas as pd
+import polars as pl
+
+from .file_utils import file_fingerprint
+
+
+class ParquetStage:
+    """Typed Parquet copies of raw county files, reused while the source is unchanged.
+
+    A staged copy is written to ``<output_dir>/staging/<stem>.<variant>.<fingerprint>.parquet``,
+    where the fingerprint comes from file_fingerprint. Replacing or editing the
+    source changes its fingerprint, so the old copy is simply never matched again
+    and is removed the next time the file is staged. ``variant`` distinguishes
+    different parses of the same source (for example raw columns vs decoded fields).
+    """
+
+    def __init__(self, output_dir: Union[str, Path], enabled: bool = True):
+        self.staging_dir = Path(output_dir) / 'staging'
+        self.enabled = enabled
+
+    def path_for(self, source: Union[str, Path], variant: str = 'raw') -> Path:
+        source = Path(source)
+        return self.staging_dir / f"{source.stem}.{variant}.{file_fingerprint(source)}.parquet"
+
+    def find(self, source: Union[str, Path], variant: str = 'raw') -> Optional[Path]:
+        """Return the staged copy of source if staging is on and the copy is current."""
+        if not self.enabled or not Path(source).exists():
+            return None
+        path = self.path_for(source, variant)
+        return path if path.exists() else None
+
+    def read(self, source: Union[str, Path], variant: str = 'raw',
+             n_rows: Optional[int] = None) -> Optional[pl.DataFrame]:
+        """Read the staged copy of source, or None when there is no current copy."""
+        path = self.find(source, variant)
+        if path is None:
+            return None
+        return pl.read_parquet(path, n_rows=n_rows)
+
+    def read_pandas(self, source: Union[str, Path], variant: str = 'raw',
+                    n_rows: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """Like read, but as a pandas frame with missing values as NaN (as pd.read_csv gives)."""
+        df = self.read(source, variant, n_rows)
+        return None if df is None else _to_pandas(df.to_arrow())
+
+    def iter_pandas_batches(self, source: Union[str, Path], batch_size: int,
+                            variant: str = 'raw') -> Optional[Generator[pd.DataFrame, None, None]]:
+        """Stream the staged copy of source as pandas frames of up to batch_size rows."""
+        import pyarrow.parquet as pq
+
+        path = self.find(source, variant)
+        if path is None:
+            return None
+        return (_to_pandas(batch) for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size))
+
+    def load(self, source: Union[str, Path], loader: Callable[[], pl.DataFrame],
+             variant: str = 'raw') -> pl.DataFrame:
+        """Read the staged copy of source, or call loader and stage its result."""
+        df = self.read(source, variant)
+        if df is not None:
+            return df
+
+        df = loader()
+        if self.enabled:
+            with self._staging_path(source, variant) as path:
+                df.write_parquet(path)
+        return df
+
+    @contextmanager
+    def writer(self, source: Union[str, Path], columns: List[str], variant: str = 'raw'):
+        """Stage an all-string source incrementally from pandas chunks.
+
+        Yields a function that appends one chunk. The copy is only published if
+        the block exits normally, so an abandoned scan never leaves a partial file.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema([(column, pa.string()) for column in columns])
+
+        with self._staging_path(source, variant) as path:
+            with pq.ParquetWriter(path, schema) as parquet_writer:
+                def write_chunk(chunk: pd.DataFrame):
+                    parquet_writer.write_table(pa.Table.from_pandas(chunk[columns], schema=schema,
+                                                                    preserve_index=False))
+                yield write_chunk
+
+    @contextmanager
+    def _staging_path(self, source: Union[str, Path], variant: str):
+        """Yield a temporary path, then atomically move it into place and drop stale copies."""
+        source = Path(source)
+        final_path = self.path_for(source, variant)
+        temp_path = final_path.with_suffix('.tmp')
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+
+        try:
+            yield temp_path
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        for stale_path in self.staging_dir.glob(f"{source.stem}.{variant}.*.parquet"):
+            stale_path.unlink()
+        temp_path.replace(final_path)
+
+
+def _to_pandas(table) -> pd.DataFrame:
+    df = table.to_pandas()
+    return df.astype(object).where(df.notna(), float('nan'))
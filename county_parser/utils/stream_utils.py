@@ -0,0 +1,201 @@
+"""Streaming helpers for reading raw county exports without temporary copies."""
+
+import io
+import json
+from pathlib import Path
+from typing import Any, BinaryIO, Generator, List, Optional, Union
+
+import polars as pl
+
+
+class NormalizedLineStream(io.RawIOBase):
+    """Read-only byte stream that repairs line endings and encodings on the fly.
+
+    Wraps a raw county export and yields UTF-8 bytes with ``\\n`` line endings:
+    CRLF and lone CR become LF, and any line that is not valid UTF-8 is decoded
+    with ``fallback_encoding`` and re-encoded. Chunks that are already clean UTF-8
+    pass through untouched. Optionally stops after ``max_lines`` lines.
+    """
+
+    def __init__(self, source: Union[str, Path, BinaryIO], fallback_encoding: str = 'latin-1',
+                 max_lines: Optional[int] = None, chunk_size: int = 1024 * 1024):
+        super().__init__()
+        if isinstance(source, (str, Path)):
+            self._raw = open(source, 'rb')
+            self._owns_raw = True
+        else:
+            self._raw = source
+            self._owns_raw = False
+
+        self.fallback_encoding = fallback_encoding
+        self.max_lines = max_lines
+        self.chunk_size = chunk_size
+        self.lines_emitted = 0
+
+        self._remainder = b''
+        self._pending = b''
+        self._position = 0
+        self._finished = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while self._position >= len(self._pending) and not self._finished:
+            self._fill()
+
+        available = len(self._pending) - self._position
+        if available <= 0:
+            return 0
+
+        size = min(len(buffer), available)
+        buffer[:size] = self._pending[self._position:self._position + size]
+        self._position += size
+        return size
+
+    def close(self):
+        if self._owns_raw and not self._raw.closed:
+            self._raw.close()
+        super().close()
+
+    def _fill(self):
+        """Convert the next block of complete lines into the pending buffer."""
+        chunk = self._raw.read(self.chunk_size)
+        data = self._remainder + chunk
+
+        if not chunk:
+            # End of input: flush the final (possibly unterminated) line
+            self._remainder = b''
+            self._finished = True
+        else:
+            # Cut after the last complete line; a trailing CR may still be half of a CRLF
+            cut = data.rfind(b'\n') + 1
+            if cut == 0:
+                cut = data.rfind(b'\r', 0, len(data) - 1) + 1
+            data, self._remainder = data[:cut], data[cut:]
+
+        self._pending = self._convert(data)
+        self._position = 0
+
+    def _convert(self, data: bytes) -> bytes:
+        """Normalize line endings and encoding for a block of complete lines."""
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+        try:
+            data.decode('utf-8')
+        except UnicodeDecodeError:
+            data = b''.join(self._convert_line(line) for line in data.splitlines(keepends=True))
+
+        if self.max_lines is not None:
+            data = self._limit_lines(data)
+
+        return data
+
+    def _convert_line(self, line: bytes) -> bytes:
+        try:
+            line.decode('utf-8')
+            return line
+        except UnicodeDecodeError:
+            return line.decode(self.fallback_encoding, errors='replace').encode('utf-8')
+
+    def _limit_lines(self, data: bytes) -> bytes:
+        """Truncate output once max_lines lines have been emitted."""
+        remaining = self.max_lines - self.lines_emitted
+        line_count = data.count(b'\n')
+
+        if line_count < remaining:
+            self.lines_emitted += line_count
+            return data
+
+        end = -1
+        for _ in range(remaining):
+            end = data.index(b'\n', end + 1)
+
+        self.lines_emitted = self.max_lines
+        self._finished = True
+        return data[:end + 1]
+
+
+def open_normalized(file_path: Union[str, Path], fallback_encoding: str = 'latin-1',
+                    max_lines: Optional[int] = None) -> io.BufferedReader:
+    """Open a raw export as a buffered UTF-8/LF stream (see NormalizedLineStream)."""
+    return io.BufferedReader(NormalizedLineStream(file_path, fallback_encoding, max_lines))
+
+
+def read_delimited_normalized(file_path: Union[str, Path], delimiter: str = '\t',
+                              max_rows: Optional[int] = None,
+                              fallback_encoding: str = 'latin-1') -> pl.DataFrame:
+    """
+    Read a delimited export into an all-string Polars frame in a single streaming pass.
+
+    The file is normalized by NormalizedLineStream and parsed block by block with
+    pyarrow's streaming CSV reader, so no temporary copy is written. Empty fields
+    become nulls and rows with the wrong number of fields are skipped.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    max_lines = max_rows + 1 if max_rows is not None else None
+
+    with open_normalized(file_path, fallback_encoding, max_lines) as stream:
+        header = stream.readline().decode('utf-8').rstrip('\n')
+        column_names = [name.strip('"') for name in header.split(delimiter)]
+
+        reader = pa_csv.open_csv(
+            stream,
+            read_options=pa_csv.ReadOptions(column_names=column_names),
+            parse_options=pa_csv.ParseOptions(delimiter=delimiter, invalid_row_handler=lambda row: 'skip'),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in column_names},
+                strings_can_be_null=True
+            )
+        )
+        table = reader.read_all()
+
+    return pl.from_arrow(table)
+
+
+def iter_json_array(file_path: Union[str, Path], chunk_size: int = 1024 * 1024) -> Generator[Any, None, None]:
+    """
+    Yield the elements of a top-level JSON array one at a time.
+
+    The file is read in chunks and each element is decoded as soon as it is
+    complete, so a multi-gigabyte export never has to be loaded as one list.
+    """
+    decoder = json.JSONDecoder()
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        buffer = f.read(chunk_size)
+        eof = not buffer
+        position = len(buffer) - len(buffer.lstrip())
+
+        if buffer[position:position + 1] != '[':
+            raise ValueError(f"{file_path} does not contain a JSON array")
+        position += 1
+
+        while True:
+            # Skip whitespace and the commas between elements
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+
+            if position < len(buffer):
+                if buffer[position] == ']':
+                    return
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                    # An element that runs to the end of the buffer may be cut short
+                    if end < len(buffer) or eof:
+                        yield item
+                        position = end
+                        continue
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+
+            if eof:
+                raise ValueError(f"Unterminated JSON array in {file_path}")
+
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
@@ -9,6 +9,7 @@ db = db.getSiblingDB('county_data');
 // Create collections with proper indexing
 db.createCollection('properties');
 db.createCollection('processing_logs');
+db.createCollection('property_stats');
 
 print('📊 Creating indexes for optimal query performance...');
 
@@ -19,6 +20,8 @@ db.properties.createIndex({ "property_details.market_area_1": 1 }, { name: "idx_
 db.properties.createIndex({ "valuation.total_market_value": 1 }, { name: "idx_market_value" });
 db.properties.createIndex({ "metadata.created_at": 1 }, { name: "idx_created_date" });
 db.properties.createIndex({ "metadata.source_files": 1 }, { name: "idx_source_files" });
+db.properties.createIndex({ "account_id": 1, "metadata.content_hash": 1 }, { name: "idx_account_content_hash" });
+db.properties.createIndex({ "county": 1, "account_id": 1 }, { name: "idx_county_account" });
 
 // Compound indexes for common queries
 db.properties.createIndex({ 
@@ -1,4 +1,21 @@
 // Multi-County Property Data Viewer - Frontend JavaScript
+
+// Only the fields the properties table renders are requested from /api/properties
+const TABLE_FIELDS = [
+    'county',
+    'account_id',
+    'mailing_address.name',
+    'owners.name',
+    'property_address.street_address',
+    'property_address.city',
+    'property_address.full_address',
+    'valuation.market_value',
+    'valuation.total_market_value',
+    'valuation.assessed_value',
+    'valuation.total_value',
+    'tax_entities'
+];
+
 class PropertyViewer {
     constructor() {
         this.properties = [];
@@ -51,9 +68,12 @@ class PropertyViewer {
             const countyFilter = document.getElementById('countyFilter').value;
             const sampleSize = document.getElementById('sampleSize').value;
             
+            // The "sample size" control shows a random sample, not the first accounts in order
             const params = new URLSearchParams({
                 limit: sampleSize,
-                county: countyFilter
+                county: countyFilter,
+                sample: 'true',
+                fields: TABLE_FIELDS.join(',')
             });
             
             const response = await fetch(`/api/properties?${params}`);
@@ -2,142 +2,441 @@
 Simple Flask web application to visualize property data from our multi-county database.
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request, stream_with_context
 from county_parser.services.mongodb_service import MongoDBService
+from county_parser.services.async_mongodb_service import AsyncMongoDBService
 from county_parser.models.config import Config
+from county_parser.services.json_utils import json_default
+import asyncio
+import atexit
 import json
+import os
+import re
+import threading
+import time
+import zlib
 from datetime import datetime
 
 app = Flask(__name__)
 
-# Initialize MongoDB service
+# Initialize configuration
 config = Config()
-mongodb = MongoDBService()
+
+# MONGO_ASYNC=true serves queries through the motor-based AsyncMongoDBService
+USE_ASYNC_MONGO = os.getenv('MONGO_ASYNC', 'false').lower() == 'true'
+
+# Seconds between health-check pings of a process's shared client
+HEALTH_CHECK_INTERVAL = float(os.getenv('MONGO_HEALTH_CHECK_INTERVAL', '30'))
+
+# Largest page /api/properties returns
+MAX_PAGE_SIZE = 1000
+
+# Dotted document paths accepted by the fields= projection
+FIELD_PATTERN = re.compile(r'^[A-Za-z0-9_]+(\.[A-Za-z0-9_]+)*$')
+
+# Documents fetched per cursor batch and bytes buffered per chunk when streaming exports
+EXPORT_BATCH_SIZE = int(os.getenv('EXPORT_BATCH_SIZE', '1000'))
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+# Seconds /api/stats reuses a summary before reading property_stats again
+STATS_CACHE_TTL = float(os.getenv('STATS_CACHE_TTL', '60'))
+
+
+class PooledDatabase:
+    """One connected MongoDBService per worker process, shared by all request threads.
+    
+    MongoClient is thread-safe and pools its connections, so requests reuse warm,
+    authenticated connections instead of connecting and pinging per request.
+    pymongo clients must not cross a fork, so the client is created lazily and
+    replaced whenever the process id changes (e.g. workers of a preloading WSGI
+    server). The server is pinged at most every HEALTH_CHECK_INTERVAL seconds and
+    a failed check drops the client so the next request reconnects.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid = None
+        self._service = None
+        self._checked_at = 0.0
+    
+    def get(self):
+        """Return the process's connected service, or None if MongoDB is unavailable."""
+        with self._lock:
+            if self._service is not None and self._pid == os.getpid():
+                if time.monotonic() - self._checked_at < HEALTH_CHECK_INTERVAL:
+                    return self._service
+                if self._service.ping():
+                    self._checked_at = time.monotonic()
+                    return self._service
+                self._service.disconnect()
+            
+            # First use in this process, or the last health check failed
+            self._service = None
+            service = MongoDBService()
+            if not service.connect():
+                return None
+            
+            self._service, self._pid, self._checked_at = service, os.getpid(), time.monotonic()
+            return service
+    
+    def close(self):
+        with self._lock:
+            if self._service is not None and self._pid == os.getpid():
+                self._service.disconnect()
+            self._service = None
+
+
+class AsyncDatabase:
+    """Runs AsyncMongoDBService on one background event loop shared by all request threads.
+    
+    Request threads submit coroutines to the loop and wait for their results, so
+    concurrent requests share one motor client and its pool. Like PooledDatabase,
+    the loop and client are created lazily per process and health-checked every
+    HEALTH_CHECK_INTERVAL seconds.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid = None
+        self._loop = None
+        self._service = None
+        self._checked_at = 0.0
+    
+    def get(self):
+        """Return this handle once its client is connected, or None if MongoDB is unavailable."""
+        with self._lock:
+            if self._service is not None and self._pid == os.getpid():
+                if time.monotonic() - self._checked_at < HEALTH_CHECK_INTERVAL:
+                    return self
+                if self._run(self._service.ping()):
+                    self._checked_at = time.monotonic()
+                    return self
+                self._stop()
+            
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, daemon=True).start()
+            service = AsyncMongoDBService()
+            if not asyncio.run_coroutine_threadsafe(service.connect(), loop).result():
+                loop.call_soon_threadsafe(loop.stop)
+                self._service = None
+                return None
+            
+            self._loop, self._service, self._pid, self._checked_at = loop, service, os.getpid(), time.monotonic()
+            return self
+    
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+    
+    def _stop(self):
+        if self._service is not None and self._pid == os.getpid():
+            self._service.disconnect()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._service = None
+    
+    def close(self):
+        with self._lock:
+            self._stop()
+    
+    def aggregate(self, pipeline):
+        return self._run(self._service.aggregate(pipeline))
+    
+    def get_collection_stats(self):
+        return self._run(self._service.get_collection_stats())
+    
+    def get_property_stats(self):
+        return self._run(self._service.get_property_stats())
+    
+    def query_properties(self, filter_query=None, limit=100, projection=None, sort=None):
+        return self._run(self._service.query_properties(filter_query, limit, projection, sort))
+    
+    def iter_properties(self, filter_query=None, batch_size=1000, projection=None, limit=0):
+        """Stream the async cursor to a request thread, one batch per round trip to the loop."""
+        documents = self._service.iter_properties(filter_query, batch_size, projection, limit)
+        
+        async def next_batch():
+            batch = []
+            async for prop in documents:
+                batch.append(prop)
+                if len(batch) >= batch_size:
+                    break
+            return batch
+        
+        try:
+            while True:
+                batch = self._run(next_batch())
+                yield from batch
+                if len(batch) < batch_size:
+                    return
+        finally:
+            self._run(documents.aclose())
+
+
+shared_database = AsyncDatabase() if USE_ASYNC_MONGO else PooledDatabase()
+atexit.register(shared_database.close)
+
+
+def database():
+    """Return the process's shared database handle, or None if MongoDB is unavailable."""
+    return shared_database.get()
+
+
+class StatsCache:
+    """Keeps the last property_stats summary for STATS_CACHE_TTL seconds per process."""
+    
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._stats = None
+        self._loaded_at = 0.0
+    
+    def get(self, db):
+        with self._lock:
+            if self._stats is None or time.monotonic() - self._loaded_at >= self.ttl:
+                self._stats = db.get_property_stats()
+                self._loaded_at = time.monotonic()
+            return self._stats
+    
+    def clear(self):
+        with self._lock:
+            self._stats = None
+
+
+stats_cache = StatsCache(STATS_CACHE_TTL)
+
 
 @app.route('/')
 def index():
     """Main dashboard page."""
     return render_template('index.html')
 
+def property_filters(args):
+    """Build the /api/properties query from its filter parameters.
+    
+    Each filter targets an indexed field from mongodb-init/init.js: county
+    (idx_county_account), zip (idx_location), school_district (idx_school_value)
+    and min_value/max_value on valuation.total_market_value (idx_market_value).
+    Raises ValueError for malformed numbers.
+    """
+    query = {}
+    
+    county = args.get('county', 'all')
+    if county and county != 'all':
+        query['county'] = county.lower()
+    if args.get('zip'):
+        query['property_address.zip_code'] = args['zip']
+    if args.get('school_district'):
+        query['property_details.school_district'] = args['school_district']
+    
+    value_range = {}
+    if args.get('min_value'):
+        value_range['$gte'] = float(args['min_value'])
+    if args.get('max_value'):
+        value_range['$lte'] = float(args['max_value'])
+    if value_range:
+        query['valuation.total_market_value'] = value_range
+    
+    return query
+
+
+def field_projection(fields):
+    """Turn a comma-separated fields= value into a projection; None returns whole documents.
+    
+    account_id is always included because it is the pagination cursor.
+    """
+    if not fields:
+        return None
+    
+    projection = {'_id': 0, 'account_id': 1}
+    for field in fields.split(','):
+        field = field.strip()
+        if not field:
+            continue
+        if not FIELD_PATTERN.match(field):
+            raise ValueError(f"Invalid field name: {field}")
+        projection[field] = 1
+    
+    # A parent path overrides its children (Mongo rejects projecting both)
+    return {
+        field: include for field, include in projection.items()
+        if not any(field.startswith(parent + '.') for parent in projection)
+    }
+
+
 @app.route('/api/properties')
 def get_properties():
-    """API endpoint to get property data."""
+    """API endpoint to get property data.
+    
+    Pages through matching properties in account_id order: pass the response's
+    next_cursor back as ``after`` to get the next page. ``sample=true`` returns
+    a random sample instead, as the dashboard originally did.
+    """
     try:
         # Get query parameters
-        sample_size = int(request.args.get('limit', 100))
-        county_filter = request.args.get('county', 'all')
+        try:
+            page_size = max(1, min(int(request.args.get('limit', 100)), MAX_PAGE_SIZE))
+            query = property_filters(request.args)
+            projection = field_projection(request.args.get('fields'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        if not mongodb.connect():
+        db = database()
+        if db is None:
             return jsonify({'error': 'Failed to connect to database'}), 500
         
-        try:
-            # Build MongoDB query
-            query = {}
-            if county_filter != 'all':
-                query['county'] = county_filter.lower()
-            
-            # Get random sample
-            pipeline = [
-                {'$match': query},
-                {'$sample': {'size': min(sample_size, 1000)}}  # Limit to 1000 max
-            ]
-            
-            properties = list(mongodb.properties_collection.aggregate(pipeline))
-            
-            # Convert ObjectId to string for JSON serialization
-            for prop in properties:
-                if '_id' in prop:
-                    prop['_id'] = str(prop['_id'])
-            
-            return jsonify({
-                'properties': properties,
-                'count': len(properties),
-                'query': query
-            })
-            
-        finally:
-            mongodb.disconnect()
+        if request.args.get('sample', 'false').lower() == 'true':
+            pipeline = [{'$match': query}, {'$sample': {'size': page_size}}]
+            if projection:
+                pipeline.append({'$project': projection})
+            properties = db.aggregate(pipeline)
+            next_cursor = None
+        else:
+            page_query = dict(query)
+            if request.args.get('after'):
+                page_query['account_id'] = {'$gt': request.args['after']}
             
+            # One extra document tells whether another page follows
+            properties = db.query_properties(page_query, page_size + 1, projection, [('account_id', 1)])
+            next_cursor = None
+            if len(properties) > page_size:
+                properties = properties[:page_size]
+                next_cursor = properties[-1]['account_id']
+        
+        # Convert ObjectId to string for JSON serialization
+        for prop in properties:
+            if '_id' in prop:
+                prop['_id'] = str(prop['_id'])
+        
+        return jsonify({
+            'properties': properties,
+            'count': len(properties),
+            'query': query,
+            'next_cursor': next_cursor
+        })
+        
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def response_encoder(accept_encodings):
+    """Pick the best content encoding the client accepts: zstd, gzip or none.
+    
+    zstd is only offered when the optional zstandard package is installed.
+    Returns (encoding name or None, compressobj-style compressor or None).
+    """
+    offered = ['gzip', 'identity']
+    try:
+        import zstandard
+        offered.insert(0, 'zstd')
+    except ImportError:
+        zstandard = None
+    
+    encoding = accept_encodings.best_match(offered, default='identity')
+    if encoding == 'zstd':
+        return 'zstd', zstandard.ZstdCompressor().compressobj()
+    if encoding == 'gzip':
+        return 'gzip', zlib.compressobj(6, zlib.DEFLATED, 31)
+    return None, None
+
+
+def serialize_documents(documents, output_format='ndjson'):
+    """Yield documents as NDJSON lines or as the pieces of one JSON array."""
+    if output_format == 'json':
+        yield '['
+        for index, prop in enumerate(documents):
+            yield (',\n' if index else '\n') + json.dumps(prop, default=json_default)
+        yield '\n]\n'
+    else:
+        for prop in documents:
+            yield json.dumps(prop, default=json_default) + '\n'
+
+
+def encode_chunks(pieces, compressor=None, chunk_bytes=EXPORT_CHUNK_BYTES):
+    """Buffer serialized pieces into chunks of about chunk_bytes, compressing each if asked."""
+    buffer = []
+    size = 0
+    
+    for piece in pieces:
+        data = piece.encode('utf-8')
+        buffer.append(data)
+        size += len(data)
+        if size >= chunk_bytes:
+            data = b''.join(buffer)
+            buffer, size = [], 0
+            data = compressor.compress(data) if compressor else data
+            if data:
+                yield data
+    
+    data = b''.join(buffer)
+    if compressor:
+        data = compressor.compress(data) + compressor.flush()
+    if data:
+        yield data
+
+
+@app.route('/api/properties/export')
+def export_properties():
+    """Stream every matching property as NDJSON (default) or a JSON array (format=json).
+    
+    Takes the same filters and fields= projection as /api/properties, plus an
+    optional limit. Documents are serialized as the cursor yields them and the
+    body is gzip- or zstd-encoded when the client accepts it, so the worker's
+    memory does not grow with the size of the extract.
+    """
+    output_format = request.args.get('format', 'ndjson')
+    if output_format not in ('ndjson', 'json'):
+        return jsonify({'error': f"Unsupported format: {output_format}"}), 400
+    
+    try:
+        limit = int(request.args.get('limit', 0))
+        query = property_filters(request.args)
+        projection = field_projection(request.args.get('fields')) or {'_id': 0}
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    db = database()
+    if db is None:
+        return jsonify({'error': 'Failed to connect to database'}), 500
+    
+    encoding, compressor = response_encoder(request.accept_encodings)
+    documents = db.iter_properties(query, EXPORT_BATCH_SIZE, projection, limit)
+    body = encode_chunks(serialize_documents(documents, output_format), compressor)
+    
+    headers = {'Vary': 'Accept-Encoding'}
+    if encoding:
+        headers['Content-Encoding'] = encoding
+    mimetype = 'application/x-ndjson' if output_format == 'ndjson' else 'application/json'
+    
+    return Response(stream_with_context(body), mimetype=mimetype, headers=headers)
+
 @app.route('/api/stats')
 def get_stats():
-    """Get database statistics."""
+    """Get database statistics from the precomputed property_stats summary."""
     try:
-        if not mongodb.connect():
+        db = database()
+        if db is None:
             return jsonify({'error': 'Failed to connect to database'}), 500
         
-        try:
-            # Get collection stats
-            stats = mongodb.get_collection_stats()
-            
-            # Get county distribution
-            pipeline = [
-                {'$group': {'_id': '$county', 'count': {'$sum': 1}}},
-                {'$sort': {'count': -1}}
-            ]
-            county_stats = list(mongodb.properties_collection.aggregate(pipeline))
-            
-            # Get value statistics (sample for performance) - handle both market_value and total_market_value
-            value_pipeline = [
-                {'$sample': {'size': 1000}},
-                {'$match': {
-                    '$or': [
-                        {'valuation.market_value': {'$exists': True, '$gt': 0, '$lt': 100000000}},
-                        {'valuation.total_market_value': {'$exists': True, '$gt': 0, '$lt': 100000000}},
-                        {'valuation.assessed_value': {'$exists': True, '$gt': 0, '$lt': 100000000}}
-                    ]
-                }},
-                {'$addFields': {
-                    'effective_value': {
-                        '$cond': {
-                            'if': {'$and': [
-                                {'$gt': ['$valuation.market_value', 0]},
-                                {'$lt': ['$valuation.market_value', 100000000]}
-                            ]},
-                            'then': '$valuation.market_value',
-                            'else': {
-                                '$cond': {
-                                    'if': {'$and': [
-                                        {'$gt': ['$valuation.total_market_value', 0]},
-                                        {'$lt': ['$valuation.total_market_value', 100000000]}
-                                    ]},
-                                    'then': '$valuation.total_market_value',
-                                    'else': '$valuation.assessed_value'
-                                }
-                            }
-                        }
-                    }
-                }},
-                {'$group': {
-                    '_id': None,
-                    'avg_value': {'$avg': '$effective_value'},
-                    'min_value': {'$min': '$effective_value'},
-                    'max_value': {'$max': '$effective_value'},
-                    'count': {'$sum': 1}
-                }}
-            ]
-            
-            try:
-                value_stats = list(mongodb.properties_collection.aggregate(value_pipeline))
-            except Exception as e:
-                print(f"Error in value stats aggregation: {e}")
-                value_stats = [{'avg_value': 0, 'min_value': 0, 'max_value': 0, 'count': 0}]
-            
-            return jsonify({
-                'total_properties': stats['properties_count'],
-                'total_logs': stats['logs_count'],
-                'counties': county_stats,
-                'values': value_stats[0] if value_stats else {},
-                'last_updated': datetime.now().isoformat()
-            })
-            
-        finally:
-            mongodb.disconnect()
-            
+        stats = stats_cache.get(db)
+        
+        return jsonify({
+            'total_properties': stats.get('total_properties', 0),
+            'total_logs': stats.get('logs_count', 0),
+            'counties': stats.get('counties', []),
+            'values': stats.get('values', {}),
+            'last_updated': stats.get('last_updated') or datetime.now().isoformat()
+        })
+        
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/health')
+def get_health():
+    """Report whether this worker's shared MongoDB client is connected."""
+    db = database()
+    return jsonify({
+        'status': 'ok' if db is not None else 'unavailable',
+        'backend': 'async' if USE_ASYNC_MONGO else 'pooled',
+        'pid': os.getpid()
+    }), 200 if db is not None else 503
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)